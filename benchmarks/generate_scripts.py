@@ -0,0 +1,134 @@
+"""Gera um conjunto sintético e reprodutível de scripts SQL para os benchmarks.
+
+Uso: python -m benchmarks.generate_scripts PASTA [--scale N] [--seed S]
+"""
+import argparse
+import os
+import random
+
+DEFAULT_SEED = 2024
+
+_NAMES = ("Ana", "Bruno", "Carla", "D'Ávila", "Eduardo", "Fátima", "O'Neil", "João", "Luíza", "Márcio")
+
+
+def insert_run(rng, rows, table="bench_clientes"):
+    """Sequência longa de INSERTs homogêneos com literais (candidata a executemany)."""
+    lines = [f"-- Carga de {rows} linhas em {table}"]
+    for row in range(1, rows + 1):
+        name = rng.choice(_NAMES).replace("'", "''")
+        balance = f"{rng.uniform(-5000, 50000):.2f}"
+        created = "NULL" if row % 7 == 0 else f"'2024-{row % 12 + 1:02d}-{row % 28 + 1:02d}'"
+        lines.append(
+            f"INSERT INTO {table} (id, nome, saldo, criado) VALUES ({row}, '{name} {row}', {balance}, {created});"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def plsql_package(rng, index, procedures):
+    """Package com especificação e corpo: blocos longos terminados em '/'."""
+    name = f"pkg_bench_{index}"
+    spec = [f"CREATE OR REPLACE PACKAGE {name} AS"]
+    body = [f"CREATE OR REPLACE PACKAGE BODY {name} AS"]
+    for proc in range(1, procedures + 1):
+        spec.append(f"  PROCEDURE processar_{proc}(p_id IN NUMBER);")
+        body.extend([
+            f"  PROCEDURE processar_{proc}(p_id IN NUMBER) IS",
+            "    v_total NUMBER := 0;",
+            "    v_texto VARCHAR2(200) := 'fim; não é o fim do bloco';",
+            "  BEGIN",
+            f"    FOR i IN 1 .. {rng.randint(5, 50)} LOOP",
+            "      IF MOD(i, 2) = 0 THEN",
+            "        v_total := v_total + i;",
+            "      ELSE",
+            "        v_total := CASE WHEN i > 10 THEN v_total - 1 ELSE v_total END;",
+            "      END IF;",
+            "    END LOOP;",
+            "    UPDATE bench_clientes SET saldo = saldo + v_total WHERE id = p_id;",
+            "    -- comentário com ; e 'aspas'",
+            f"  END processar_{proc};",
+        ])
+    spec.append(f"END {name};")
+    body.append(f"END {name};")
+    return "\n".join(spec) + "\n/\n\n" + "\n".join(body) + "\n/\n"
+
+
+def mixed_ddl(rng, index, statements):
+    """DDL variado intercalado com blocos anônimos e DML com expressões."""
+    parts = []
+    for n in range(1, statements + 1):
+        kind = n % 5
+        if kind == 0:
+            parts.append(
+                f"CREATE TABLE bench_t{index}_{n} (\n  id NUMBER PRIMARY KEY,\n"
+                f"  descricao VARCHAR2({rng.randint(10, 400)}),\n  criado DATE DEFAULT SYSDATE\n);"
+            )
+        elif kind == 1:
+            parts.append(f"CREATE INDEX bench_i{index}_{n} ON bench_clientes (saldo, criado);")
+        elif kind == 2:
+            parts.append(f"ALTER TABLE bench_clientes ADD (extra_{index}_{n} NUMBER(10, 2));")
+        elif kind == 3:
+            parts.append(
+                "BEGIN\n  EXECUTE IMMEDIATE 'DROP TABLE bench_tmp';\n"
+                "EXCEPTION\n  WHEN OTHERS THEN\n    NULL;\nEND;\n/"
+            )
+        else:
+            parts.append(f"UPDATE bench_clientes SET saldo = saldo * 1.01 WHERE MOD(id, {rng.randint(2, 9)}) = 0;")
+    return "\n\n".join(parts) + "\n"
+
+
+def pathological(rng, index, statements):
+    """Comentários e aspas que exercitam os casos difíceis do lexer."""
+    parts = [f"/* Script patológico {index}\n   ; ' \" -- nada disto termina um comando\n*/"]
+    for n in range(1, statements + 1):
+        kind = n % 6
+        if kind == 0:
+            parts.append(f"INSERT INTO bench_textos VALUES ({n}, q'[texto com ; e ' e ]'' dentro]');")
+        elif kind == 1:
+            parts.append(f"INSERT INTO bench_textos VALUES ({n}, 'linha 1;\nlinha 2 -- sem comentário\n/* idem */');")
+        elif kind == 2:
+            parts.append(f'SELECT "Coluna;Estranha", \'--\' FROM "Tabela""{n}" /* ; */ WHERE 1 = 1; -- fim')
+        elif kind == 3:
+            parts.append("-- " + "; ".join(f"comentário {i}" for i in range(rng.randint(1, 20))))
+        elif kind == 4:
+            parts.append(f"UPDATE bench_textos SET texto = nq'{{chaves {{}} ; }}' WHERE id = {n}\n/")
+        else:
+            parts.append(f"DELETE FROM bench_textos WHERE texto LIKE '%;%' /* comentário\nem várias\nlinhas ; */ AND id = {n};")
+    return "\n".join(parts) + "\n"
+
+
+def generate_corpus(folder, scale=1, seed=DEFAULT_SEED):
+    """Grava o conjunto de scripts na pasta e retorna os caminhos, em ordem.
+
+    scale multiplica o tamanho de cada tipo de script; o mesmo seed gera
+    sempre os mesmos arquivos.
+    """
+    rng = random.Random(seed)
+    os.makedirs(folder, exist_ok=True)
+    scripts = [
+        ("01_carga_clientes.sql", insert_run(rng, 20000 * scale)),
+        ("02_packages.sql", "\n".join(plsql_package(rng, i, 40) for i in range(1, 5 * scale + 1))),
+        ("03_ddl_misto.sql", "\n".join(mixed_ddl(rng, i, 100) for i in range(1, 5 * scale + 1))),
+        ("04_patologico.sql", "\n".join(pathological(rng, i, 300) for i in range(1, 5 * scale + 1))),
+        ("05_carga_pedidos.sql", insert_run(rng, 5000 * scale, table="bench_pedidos")),
+    ]
+    paths = []
+    for name, content in scripts:
+        path = os.path.join(folder, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera scripts SQL sintéticos para os benchmarks.")
+    parser.add_argument("folder", help="pasta de destino")
+    parser.add_argument("--scale", type=int, default=1, help="multiplicador do tamanho (padrão: 1)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args(argv)
+    for path in generate_corpus(args.folder, args.scale, args.seed):
+        print(f"{path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
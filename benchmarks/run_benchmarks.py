@@ -0,0 +1,269 @@
+"""Benchmarks de vazão e memória do divisor, do executor e da execução completa.
+
+Os scripts são gerados por generate_scripts e executados contra o driver
+simulado (src.database.fake_driver), sem uma instância Oracle. Os resultados
+podem ser gravados como referência e comparados em execuções futuras.
+
+Uso: python -m benchmarks.run_benchmarks [--save-baseline | --compare]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generate_scripts import generate_corpus, DEFAULT_SEED
+from src.database.commit_policy import CommitPolicy
+from src.database.drivers import select_driver, DRIVER_FAKE
+from src.database.fake_driver import FakeSessionPool
+from src.database.oracle_connector import OracleConnector
+from src.database.session_pool import set_pool_factory
+from src.database.sql_lexer import split_sql_blocks
+from src.engine.script_runner import ScriptRunner, IGNORAR_TODOS
+from src.utils.script_reader import open_script
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+DEFAULT_REPEAT = 3
+DEFAULT_LATENCY_MS = 0.2
+# Diferença tolerada (tempo e memória) antes de apontar uma regressão
+DEFAULT_TOLERANCE = 0.25
+
+BENCHMARKS = ("split", "execute_script", "pipeline_cold", "pipeline_warm")
+
+_CONNECTION = ("bench", "bench", "localhost", 1521, "BENCH")
+
+
+class _SilentListener:
+    """Observador do ScriptRunner que apenas conta os erros."""
+
+    def __init__(self):
+        self.errors = []
+
+    def on_run_start(self, total):
+        pass
+
+    def on_script_success(self, file_path):
+        pass
+
+    def on_script_error(self, file_path, error, general=False):
+        self.errors.append((file_path, error))
+
+    def ask_error_action(self, file_path, error):
+        return IGNORAR_TODOS
+
+    def on_connection_error(self, error):
+        self.errors.append((None, error))
+
+    def on_run_error(self, error):
+        self.errors.append((None, error))
+
+    def on_script_resumed(self, file_path, start_block):
+        pass
+
+    def on_run_finish(self, success_count, error_count):
+        pass
+
+
+def bench_split(paths, pool, workdir):
+    """Divide os scripts em blocos, lendo-os do disco."""
+    blocks = 0
+    for path in paths:
+        with open_script(path) as script:
+            for _ in split_sql_blocks(script):
+                blocks += 1
+    return {"blocks": blocks}
+
+
+def bench_execute_script(paths, pool, workdir):
+    """Executa os scripts em uma sessão com OracleConnector.execute_script."""
+    connector = OracleConnector()
+    success, error = connector.connect(*_CONNECTION)
+    if not success:
+        raise RuntimeError(error)
+    connector.begin_run(CommitPolicy())
+    try:
+        for path in paths:
+            with open_script(path) as script:
+                success, error = connector.execute_script(script)
+            if not success:
+                raise RuntimeError(error)
+        connector.end_run(completed=True)
+    finally:
+        connector.close()
+    return {}
+
+
+def _run_pipeline(paths, workdir):
+    config = {
+        "user": _CONNECTION[0], "password": _CONNECTION[1], "host": _CONNECTION[2],
+        "port": _CONNECTION[3], "service": _CONNECTION[4],
+        "journal_dir": os.path.join(workdir, "journal"),
+        "block_cache_dir": os.path.join(workdir, "block_cache"),
+    }
+    listener = _SilentListener()
+    ScriptRunner(config, listener).run(paths)
+    if listener.errors:
+        raise RuntimeError(listener.errors[0][1])
+
+
+def bench_pipeline_cold(paths, pool, workdir):
+    """Execução completa (ScriptRunner) com cache de blocos vazio."""
+    with tempfile.TemporaryDirectory(dir=workdir) as run_dir:
+        _run_pipeline(paths, run_dir)
+    return {}
+
+
+def bench_pipeline_warm(paths, pool, workdir):
+    """Execução completa (ScriptRunner) com os blocos já em cache."""
+    _run_pipeline(paths, workdir)
+    return {}
+
+
+_FUNCTIONS = {
+    "split": (bench_split, None),
+    "execute_script": (bench_execute_script, None),
+    "pipeline_cold": (bench_pipeline_cold, None),
+    "pipeline_warm": (bench_pipeline_warm, _run_pipeline),
+}
+
+
+def run_benchmark(name, paths, pool, workdir, repeat):
+    """Mede um benchmark: melhor tempo e mediana de repeat execuções e pico de memória."""
+    function, prepare = _FUNCTIONS[name]
+    bench_dir = os.path.join(workdir, name)
+    os.makedirs(bench_dir, exist_ok=True)
+    if prepare is not None:
+        prepare(paths, bench_dir)
+
+    timings = []
+    extra = {}
+    round_trips = None
+    for _ in range(repeat):
+        before = pool.stats.round_trips
+        started = time.perf_counter()
+        extra = function(paths, pool, bench_dir)
+        timings.append(time.perf_counter() - started)
+        round_trips = pool.stats.round_trips - before
+
+    # Memória medida à parte: o tracemalloc deixa a execução bem mais lenta
+    tracemalloc.start()
+    try:
+        function(paths, pool, bench_dir)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    best = min(timings)
+    result = {
+        "seconds": round(best, 4),
+        "median_seconds": round(statistics.median(timings), 4),
+        "mb_per_second": round(total_bytes / (1024 * 1024) / best, 2),
+        "peak_memory_kb": round(peak / 1024),
+    }
+    if round_trips:
+        result["round_trips"] = round_trips
+    result.update(extra)
+    return result
+
+
+def run_all(names, scale=1, repeat=DEFAULT_REPEAT, latency_ms=DEFAULT_LATENCY_MS, seed=DEFAULT_SEED):
+    """Gera o conjunto de scripts e executa os benchmarks; retorna o relatório."""
+    select_driver(DRIVER_FAKE)
+    pool = FakeSessionPool(latency=latency_ms / 1000)
+    set_pool_factory(pool.factory)
+    try:
+        with tempfile.TemporaryDirectory(prefix="oracle_bench_") as workdir:
+            paths = generate_corpus(os.path.join(workdir, "scripts"), scale, seed)
+            results = {name: run_benchmark(name, paths, pool, workdir, repeat) for name in names}
+            corpus_kb = round(sum(os.path.getsize(path) for path in paths) / 1024)
+    finally:
+        set_pool_factory(None)
+    return {
+        "params": {"scale": scale, "seed": seed, "latency_ms": latency_ms, "corpus_kb": corpus_kb},
+        "environment": {"python": platform.python_version(), "platform": platform.platform()},
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Compara o relatório com a referência; retorna a lista de regressões."""
+    regressions = []
+    for name, result in report["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        for metric in ("seconds", "peak_memory_kb"):
+            if result[metric] > reference[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {reference[metric]} -> {result[metric]}")
+    return regressions
+
+
+def _print_report(report, baseline=None):
+    print(f"Parâmetros: {report['params']}")
+    for name, result in report["results"].items():
+        line = (f"{name:<16} {result['seconds']:>9.4f} s  {result['mb_per_second']:>8.2f} MB/s"
+                f"  pico {result['peak_memory_kb']:>8} KB")
+        if "round_trips" in result:
+            line += f"  {result['round_trips']} idas ao banco"
+        reference = (baseline or {}).get("results", {}).get(name)
+        if reference:
+            line += f"  ({result['seconds'] / reference['seconds']:.2f}x da referência)"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do divisor e do executor de scripts.")
+    parser.add_argument("--only", help="benchmarks separados por vírgula: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_LATENCY_MS,
+                        help="latência simulada por ida ao banco (padrão: 0.2)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como referência")
+    parser.add_argument("--compare", action="store_true",
+                        help="compara com a referência; código de saída 1 se houver regressão")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    names = BENCHMARKS
+    if args.only:
+        names = tuple(name.strip() for name in args.only.split(","))
+        unknown = [name for name in names if name not in BENCHMARKS]
+        if unknown:
+            parser.error("benchmark desconhecido: " + ", ".join(unknown))
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Referência indisponível: {e}", file=sys.stderr)
+            return 2
+
+    report = run_all(names, args.scale, args.repeat, args.latency_ms)
+    _print_report(report, baseline)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Referência gravada em {args.baseline}")
+
+    if baseline is not None:
+        if baseline.get("params") != report["params"]:
+            print("Aviso: a referência foi gravada com outros parâmetros.", file=sys.stderr)
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSÃO {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,15 +10,15 @@ pip install -r requirements.txt
 echo Gerando executavel...
 pyinstaller oracle_script_executor.spec --clean
 
-echo Copiando Oracle Instant Client...
+echo Copiando Oracle Instant Client (usado apenas pelos drivers thick e cx_oracle)...
 xcopy /E /I /Y "instantclient\instantclient_23_7" "dist\instantclient_23_7"
 
 echo Build concluido!
 echo ----------------------------------------------------
 echo DISTRIBUICAO:
 echo 1. O arquivo executavel "dist\OracleScriptExecutor.exe"
-echo 2. A pasta "dist\instantclient_23_7"
+echo 2. A pasta "dist\instantclient_23_7" (opcional com o driver thin, o padrao)
 echo ----------------------------------------------------
-echo IMPORTANTE: Distribua sempre o executavel e a pasta instantclient_23_7 juntos! 
-echo            Ambos devem estar no mesmo diretorio.
+echo IMPORTANTE: Com os drivers thick ou cx_oracle, distribua o executavel e a
+echo            pasta instantclient_23_7 juntos, no mesmo diretorio.
 pause 
\ No newline at end of file
@@ -15,7 +15,7 @@ a = Analysis(
     datas=[
         ('config.json', '.'),
     ],
-    hiddenimports=['cx_Oracle'],
+    hiddenimports=['oracledb'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -5,11 +5,12 @@ setup(
     version="1.1",
     packages=find_packages(),
     install_requires=[
-        "cx_Oracle==8.3.0",
+        "oracledb==2.5.1",
     ],
     entry_points={
         'console_scripts': [
             'oracle-script-executor=src.main:main',
+            'oracle-script-executor-cli=src.cli:main',
         ],
     },
 ) 
\ No newline at end of file
@@ -0,0 +1,311 @@
+import argparse
+import json
+import os
+import sys
+
+# Adiciona o diretório src ao PYTHONPATH
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config.config_manager import ConfigManager
+from src.database.commit_policy import COMMIT_MODES
+from src.database.drivers import DRIVERS
+from src.database.error_policy import ErrorPolicy
+from src.database.execution_profile import DEFAULT_TOP_BLOCKS
+from src.database.oracle_client import initialize_oracle_client
+from src.database.session_pool import close_all_pools
+from src.database.result_export import FORMATS
+from src.engine.fanout import FanOutRunner, load_targets, TARGET_FAILED
+from src.engine.script_runner import ScriptRunner, IGNORAR_TODOS, PARAR
+from src.utils.folder_scanner import list_scripts, scan_options
+
+# Códigos de saída do modo em lote
+EXIT_OK = 0
+EXIT_SCRIPT_ERRORS = 1
+EXIT_SETUP_ERROR = 2
+EXIT_STOPPED = 3
+
+# Campos de conexão obrigatórios
+REQUIRED_FIELDS = ("user", "password", "host", "port", "service")
+
+
+def _emit(event, **fields):
+    """Escreve um evento de progresso como uma linha JSON na saída padrão."""
+    fields["event"] = event
+    sys.stdout.write(json.dumps(fields, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def collect_scripts(paths, config):
+    """Expande arquivos e pastas na lista de scripts, em ordem natural."""
+    options = scan_options(config)
+    scripts = []
+    for path in paths:
+        if os.path.isdir(path):
+            scripts.extend(list_scripts(path, **options))
+        elif os.path.isfile(path):
+            scripts.append(path)
+        else:
+            raise FileNotFoundError(f"Script ou pasta não encontrado: {path}")
+    return scripts
+
+
+class JsonLinesListener:
+    """Observador do ScriptRunner que relata o progresso em JSON lines."""
+
+    def __init__(self, stop_on_error=True):
+        self.stop_on_error = stop_on_error
+        self.setup_failed = False
+
+    def on_run_start(self, total):
+        _emit("run_start", total=total)
+
+    def on_script_success(self, file_path):
+        _emit("script_success", script=file_path)
+
+    def on_script_resumed(self, file_path, start_block):
+        _emit("script_resumed", script=file_path, start_block=start_block)
+
+    def on_script_error(self, file_path, error, general=False):
+        _emit("script_error", script=file_path, error=error, general=general)
+
+    def ask_error_action(self, file_path, error):
+        return PARAR if self.stop_on_error else IGNORAR_TODOS
+
+    def on_load_progress(self, file_path, rows, rows_per_second):
+        _emit("load_progress", script=file_path, rows=rows, rows_per_second=round(rows_per_second, 1))
+
+    def on_connection_error(self, error):
+        self.setup_failed = True
+        _emit("connection_error", error=error)
+
+    def on_run_error(self, error):
+        self.setup_failed = True
+        _emit("run_error", error=error)
+
+    def on_run_finish(self, success_count, error_count):
+        _emit("run_finish", success=success_count, errors=error_count)
+
+    # Execução em vários destinos (FanOutRunner)
+
+    def on_fanout_start(self, targets, script_count):
+        _emit("fanout_start", targets=targets, scripts=script_count)
+
+    def on_target_script_success(self, target, file_path):
+        _emit("script_success", target=target, script=file_path)
+
+    def on_target_script_error(self, target, file_path, error):
+        _emit("script_error", target=target, script=file_path, error=error)
+
+    def ask_target_error_action(self, target, file_path, error):
+        return self.ask_error_action(file_path, error)
+
+    def on_target_error(self, target, error):
+        _emit("target_error", target=target, error=error)
+
+    def on_target_finish(self, target, progress):
+        _emit("target_finish", **progress.as_dict())
+
+    def on_fanout_finish(self, summary):
+        _emit("fanout_summary", **summary)
+
+
+def build_parser():
+    """Cria o parser de argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(
+        prog="oracle-script-executor-cli",
+        description="Executa scripts SQL Oracle sem interface gráfica."
+    )
+    parser.add_argument("scripts", nargs="*",
+                        help="arquivos .sql/.csv/.tsv ou pastas (padrão: pasta da configuração)")
+    parser.add_argument("--config", default="config.json",
+                        help="arquivo de configuração (padrão: config.json)")
+    parser.add_argument("--user")
+    parser.add_argument("--password",
+                        help="senha (ou variável de ambiente ORACLE_PASSWORD)")
+    parser.add_argument("--host")
+    parser.add_argument("--port")
+    parser.add_argument("--service")
+    parser.add_argument("--folder", help="pasta com os scripts")
+    parser.add_argument("--commit-mode", choices=COMMIT_MODES)
+    parser.add_argument("--commit-every", type=int)
+    parser.add_argument("--sessions", type=int, dest="parallel_sessions")
+    parser.add_argument("--driver", choices=DRIVERS,
+                        help="driver do banco (padrão: thin, sem Instant Client)")
+    parser.add_argument("--on-error", choices=("stop", "continue"), default="stop",
+                        help="parar na primeira falha ou continuar (padrão: stop)")
+    parser.add_argument("--resume", action="store_true",
+                        help="retomar a última execução interrompida")
+    parser.add_argument("--statement-timeout", type=float,
+                        help="tempo limite de cada comando, em segundos (padrão: sem limite)")
+    parser.add_argument("--script-timeout", type=float,
+                        help="tempo limite de cada script, em segundos (padrão: sem limite)")
+    parser.add_argument("--profile", action="store_true",
+                        help="mede o tempo de cada bloco e emite o resumo do perfil")
+    parser.add_argument("--profile-out",
+                        help="exporta o tempo de cada bloco para o arquivo (.csv ou .jsonl)")
+    parser.add_argument("--rejects-out",
+                        help="grava em CSV as linhas rejeitadas pelos lotes de INSERTs")
+    parser.add_argument("--results-dir",
+                        help="grava o resultado de cada SELECT dos scripts nesta pasta")
+    parser.add_argument("--results-format", choices=FORMATS,
+                        help="formato dos resultados exportados (padrão: csv)")
+    parser.add_argument("--profile-top", type=int, default=DEFAULT_TOP_BLOCKS,
+                        help="blocos mais lentos listados no resumo do perfil (padrão: 10)")
+    parser.add_argument("--targets",
+                        help="arquivo JSON com os bancos de destino; executa os scripts em todos eles")
+    parser.add_argument("--target-workers", type=int,
+                        help="destinos executados ao mesmo tempo (padrão: 8)")
+    return parser
+
+
+def build_config(args):
+    """Combina o arquivo de configuração com os argumentos informados."""
+    config_manager = ConfigManager(
+        args.config, on_error=lambda message: _emit("config_error", error=message)
+    )
+    config = dict(config_manager.get_config())
+
+    if args.password is None and os.environ.get("ORACLE_PASSWORD"):
+        args.password = os.environ["ORACLE_PASSWORD"]
+
+    for key in ("user", "password", "host", "port", "service", "folder",
+                "commit_mode", "commit_every", "parallel_sessions", "driver",
+                "statement_timeout", "script_timeout", "target_workers"):
+        value = getattr(args, key)
+        if value is not None:
+            config[key] = value
+    if args.results_dir:
+        config["export_results"] = True
+        config["results_dir"] = args.results_dir
+    if args.profile or args.profile_out:
+        config["profile"] = True
+    if args.results_format:
+        config["results_format"] = args.results_format
+    return config
+
+
+def report_profile(profile, args):
+    """Emite o resumo do perfil da execução e o exporta, se solicitado."""
+    if profile is None or not profile.records:
+        return
+    _emit("profile_summary", **profile.summary(args.profile_top))
+    if args.profile_out:
+        try:
+            profile.export(args.profile_out)
+        except OSError as e:
+            _emit("run_error", error=f"Erro ao exportar o perfil: {e}")
+
+
+def report_rejects(rejects, args):
+    """Emite o resumo das linhas rejeitadas e as exporta, se solicitado."""
+    if rejects is None or not rejects.total:
+        return
+    _emit("rejects_summary", **rejects.summary())
+    if args.rejects_out:
+        try:
+            rejects.export(args.rejects_out)
+        except OSError as e:
+            _emit("run_error", error=f"Erro ao exportar as linhas rejeitadas: {e}")
+
+
+def run_targets(scripts, targets, config, args):
+    """Executa os scripts em todos os destinos; retorna o código de saída."""
+    listener = JsonLinesListener(stop_on_error=args.on_error == "stop")
+    fanout = FanOutRunner(config, targets, listener)
+    try:
+        summary = fanout.run(scripts)
+    except KeyboardInterrupt:
+        _emit("run_error", error="Execução interrompida pelo usuário.")
+        return EXIT_STOPPED
+    finally:
+        close_all_pools()
+
+    if fanout.stopped:
+        return EXIT_STOPPED
+    if summary["script_errors"] or summary["by_state"].get(TARGET_FAILED):
+        return EXIT_SCRIPT_ERRORS
+    return EXIT_OK
+
+
+def main(argv=None):
+    """Ponto de entrada do modo em lote; retorna o código de saída."""
+    args = build_parser().parse_args(argv)
+    config = build_config(args)
+
+    targets = None
+    if args.targets:
+        if args.resume:
+            _emit("config_error", error="--resume não pode ser usado com --targets.")
+            return EXIT_SETUP_ERROR
+        try:
+            targets = load_targets(args.targets, config)
+        except ValueError as e:
+            _emit("config_error", error=str(e))
+            return EXIT_SETUP_ERROR
+    else:
+        missing = [field for field in REQUIRED_FIELDS if not config.get(field)]
+        if missing:
+            _emit("config_error", error="Campos de conexão obrigatórios: " + ", ".join(missing))
+            return EXIT_SETUP_ERROR
+    try:
+        valid = int(config.get("commit_every", 100)) >= 1 and int(config.get("parallel_sessions", 1)) >= 1
+        valid = valid and int(config.get("target_workers", 1)) >= 1
+    except (TypeError, ValueError):
+        valid = False
+    if not valid or config.get("commit_mode", COMMIT_MODES[0]) not in COMMIT_MODES:
+        _emit("config_error", error="commit_mode, commit_every, sessions ou target-workers inválidos.")
+        return EXIT_SETUP_ERROR
+    try:
+        ErrorPolicy.from_config(config)
+    except ValueError as e:
+        _emit("config_error", error=str(e))
+        return EXIT_SETUP_ERROR
+
+    try:
+        scripts = collect_scripts(args.scripts or ([config["folder"]] if config.get("folder") else []), config)
+    except OSError as e:
+        _emit("config_error", error=str(e))
+        return EXIT_SETUP_ERROR
+    if not scripts:
+        _emit("config_error", error="Nenhum script SQL foi informado para execução.")
+        return EXIT_SETUP_ERROR
+
+    success, error = initialize_oracle_client(config.get("driver"))
+    if not success:
+        _emit("client_error", error=error)
+        return EXIT_SETUP_ERROR
+
+    if targets is not None:
+        return run_targets(scripts, targets, config, args)
+
+    listener = JsonLinesListener(stop_on_error=args.on_error == "stop")
+    runner = ScriptRunner(config, listener)
+    if args.resume and not runner.can_resume():
+        _emit("config_error", error="Não há execução interrompida para retomar.")
+        return EXIT_SETUP_ERROR
+    try:
+        runner.run(scripts, resume=args.resume)
+    except KeyboardInterrupt:
+        runner.stop()
+        _emit("run_error", error="Execução interrompida pelo usuário.")
+        return EXIT_STOPPED
+    finally:
+        close_all_pools()
+        report_profile(runner.profile, args)
+        report_rejects(runner.rejects, args)
+        if runner.results is not None and runner.results.results:
+            _emit("results_summary", **runner.results.summary())
+        if runner.error_policy is not None and runner.error_policy.summary():
+            _emit("error_rules_summary", actions=runner.error_policy.summary())
+
+    if listener.setup_failed and not runner.success_count and not runner.error_count:
+        return EXIT_SETUP_ERROR
+    if runner.error_count:
+        return EXIT_SCRIPT_ERRORS
+    if runner.stopped:
+        return EXIT_STOPPED
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,21 @@
 import os
 import json
-from tkinter import messagebox
 
 class ConfigManager:
-    def __init__(self, config_file="config.json"):
+    def __init__(self, config_file="config.json", on_error=None):
         self.config_file = config_file
+        # Função que recebe as mensagens de erro; por padrão, um diálogo do tkinter
+        self.on_error = on_error
         self.config = self._load_config()
 
+    def _report_error(self, message):
+        """Informa um erro de configuração ao usuário."""
+        if self.on_error is not None:
+            self.on_error(message)
+            return
+        from tkinter import messagebox
+        messagebox.showerror("Erro de Configuração", message)
+
     def _load_config(self):
         """Carrega as configurações do arquivo JSON."""
         if os.path.exists(self.config_file):
@@ -14,10 +23,10 @@ class ConfigManager:
                 with open(self.config_file, 'r') as f:
                     return json.load(f)
             except json.JSONDecodeError:
-                messagebox.showerror("Erro de Configuração", f"Erro ao ler o arquivo {self.config_file}. Verifique o formato JSON.")
+                self._report_error(f"Erro ao ler o arquivo {self.config_file}. Verifique o formato JSON.")
                 return {}
             except Exception as e:
-                messagebox.showerror("Erro de Configuração", f"Erro inesperado ao carregar {self.config_file}: {e}")
+                self._report_error(f"Erro inesperado ao carregar {self.config_file}: {e}")
                 return {}
         return {}
 
@@ -27,7 +36,7 @@ class ConfigManager:
             with open(self.config_file, 'w') as f:
                 json.dump(data, f, indent=4)
         except Exception as e:
-            messagebox.showerror("Erro de Configuração", f"Erro ao salvar configurações em {self.config_file}: {e}")
+            self._report_error(f"Erro ao salvar configurações em {self.config_file}: {e}")
 
     def get_config(self):
         """Retorna as configurações atuais."""
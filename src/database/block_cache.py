@@ -0,0 +1,207 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from src.database.sql_lexer import LEXER_VERSION, ParsedBlock, parse_block, split_sql_blocks
+from src.utils.script_reader import open_script, SCRIPT_BUFFER_SIZE
+
+# Local e tamanho padrão do cache de blocos
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".oracle_script_executor", "block_cache")
+DEFAULT_CACHE_MAX_MB = 256
+# Uma entrada ocupa no máximo esta fração do cache; scripts maiores não são guardados
+ENTRY_MAX_FRACTION = 4
+
+_ENTRY_SUFFIX = ".blocks"
+
+
+def content_digest(file_path):
+    """Calcula o hash do conteúdo de um script, combinado com a versão do lexer."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"lexer-v{LEXER_VERSION}\0".encode())
+    with open(file_path, "rb", buffering=0) as f:
+        for chunk in iter(lambda: f.read(SCRIPT_BUFFER_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlockCache:
+    """Cache em disco dos blocos já divididos e classificados de cada script.
+
+    Cada entrada é identificada pelo hash do conteúdo do script e pela
+    versão do lexer, de modo que scripts inalterados não são analisados
+    novamente. As entradas são gravadas uma linha JSON por bloco, enquanto
+    o script é executado, e o conjunto é limitado a max_bytes, descartando
+    as menos usadas recentemente (LRU). Scripts maiores que max_entry_bytes
+    (1/ENTRY_MAX_FRACTION do cache) são apenas divididos, sem hash nem
+    gravação: copiá-los expulsaria o restante do cache.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // ENTRY_MAX_FRACTION
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o cache a partir da configuração; retorna None se estiver desativado."""
+        if not config.get("block_cache", True):
+            return None
+        return cls(
+            config.get("block_cache_dir") or DEFAULT_CACHE_DIR,
+            int(config.get("block_cache_max_mb", DEFAULT_CACHE_MAX_MB)) * 1024 * 1024
+        )
+
+    def blocks(self, file_path, digest=None):
+        """Produz os blocos (ParsedBlock) do script, do cache ou do lexer.
+
+        Em caso de falta, o script é lido e dividido normalmente e os blocos
+        são gravados à medida que são produzidos; a entrada só é publicada
+        se o script for consumido até o fim.
+        """
+        if os.path.getsize(file_path) > self.max_entry_bytes:
+            # Grande demais para o cache: nem a entrada nem o hash são necessários
+            with open_script(file_path) as script:
+                for block in split_sql_blocks(script):
+                    yield parse_block(block)
+            return
+        if digest is None:
+            digest = content_digest(file_path)
+        entry_path = os.path.join(self.directory, digest + _ENTRY_SUFFIX)
+        try:
+            entry = open(entry_path, encoding="utf-8")
+        except OSError:
+            entry = None
+
+        if entry is not None:
+            with entry:
+                self._touch(digest, entry_path)
+                self.hits += 1
+                try:
+                    for line in entry:
+                        yield ParsedBlock(*json.loads(line))
+                except (ValueError, TypeError):
+                    # Entrada corrompida: descarta para que seja refeita na próxima execução
+                    self._discard(digest, entry_path)
+                    raise
+            return
+
+        self.misses += 1
+        yield from self._parse_and_store(file_path, digest, entry_path)
+
+    def _parse_and_store(self, file_path, digest, entry_path):
+        """Divide o script com o lexer, gravando os blocos em uma nova entrada."""
+        temp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            writer = open(temp_path, "wb")
+        except OSError:
+            # Sem acesso ao diretório do cache: apenas executa sem gravar
+            writer = None
+
+        published = False
+        written = 0
+        try:
+            with open_script(file_path) as script:
+                for block in split_sql_blocks(script):
+                    parsed = parse_block(block)
+                    if writer is not None:
+                        data = (json.dumps(parsed, ensure_ascii=False) + "\n").encode("utf-8")
+                        written += len(data)
+                        if written > self.max_entry_bytes:
+                            # A entrada passou do limite (o JSON é maior que o script): desiste dela
+                            writer.close()
+                            writer = None
+                            self._remove(temp_path)
+                        else:
+                            writer.write(data)
+                    yield parsed
+            if writer is not None:
+                writer.close()
+                try:
+                    os.replace(temp_path, entry_path)
+                    published = True
+                    self._register(digest, os.path.getsize(entry_path))
+                except OSError:
+                    # Outra execução publicou ou está lendo a mesma entrada
+                    pass
+        finally:
+            if writer is not None and not published:
+                writer.close()
+                self._remove(temp_path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _load_index(self):
+        """Lê as entradas existentes, da menos para a mais recentemente usada."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for item in it:
+                    if item.name.endswith(_ENTRY_SUFFIX) and item.is_file():
+                        stat = item.stat()
+                        entries.append((stat.st_mtime, item.name[:-len(_ENTRY_SUFFIX)], stat.st_size))
+        except OSError:
+            pass
+        entries.sort()
+        self._entries = OrderedDict((digest, size) for _, digest, size in entries)
+        self._total_bytes = sum(self._entries.values())
+
+    def _touch(self, digest, entry_path):
+        """Marca a entrada como usada agora."""
+        with self._lock:
+            if self._entries is None:
+                self._load_index()
+            if digest in self._entries:
+                self._entries.move_to_end(digest)
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+    def _register(self, digest, size):
+        """Registra uma nova entrada e descarta as antigas acima do limite."""
+        with self._lock:
+            if self._entries is None:
+                self._load_index()
+            self._total_bytes += size - self._entries.pop(digest, 0)
+            self._entries[digest] = size
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_digest, old_size = self._entries.popitem(last=False)
+                self._total_bytes -= old_size
+                try:
+                    os.remove(os.path.join(self.directory, old_digest + _ENTRY_SUFFIX))
+                except OSError:
+                    pass
+
+    def _discard(self, digest, entry_path):
+        """Remove uma entrada inválida."""
+        with self._lock:
+            if self._entries is not None:
+                self._total_bytes -= self._entries.pop(digest, 0)
+        try:
+            os.remove(entry_path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove todas as entradas do cache."""
+        with self._lock:
+            self._load_index()
+            for digest in self._entries:
+                try:
+                    os.remove(os.path.join(self.directory, digest + _ENTRY_SUFFIX))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
@@ -0,0 +1,104 @@
+import time
+from src.database.sql_lexer import (
+    STATEMENT_DDL, STATEMENT_DML, STATEMENT_PLSQL, STATEMENT_TCL
+)
+
+# Modos de commit disponíveis
+COMMIT_POR_COMANDO = "statement"     # commit após cada comando (comportamento original)
+COMMIT_A_CADA_N = "count"            # commit a cada N comandos DML/PL-SQL
+COMMIT_POR_INTERVALO = "interval"    # commit a cada N milissegundos
+COMMIT_POR_ARQUIVO = "file"          # um commit por script; rollback se o script falhar
+COMMIT_EXECUCAO = "run"              # uma única transação para toda a execução
+
+COMMIT_MODES = (
+    COMMIT_POR_COMANDO,
+    COMMIT_A_CADA_N,
+    COMMIT_POR_INTERVALO,
+    COMMIT_POR_ARQUIVO,
+    COMMIT_EXECUCAO,
+)
+
+# Rótulos exibidos na interface para cada modo
+COMMIT_MODE_LABELS = {
+    COMMIT_POR_COMANDO: "Por comando",
+    COMMIT_A_CADA_N: "A cada N comandos",
+    COMMIT_POR_INTERVALO: "A cada N ms",
+    COMMIT_POR_ARQUIVO: "Por arquivo",
+    COMMIT_EXECUCAO: "Execução inteira",
+}
+
+
+class CommitPolicy:
+    """Decide quando confirmar a transação durante a execução dos scripts.
+
+    Acompanha se há alterações pendentes: SELECTs não abrem transação, DDL
+    e COMMIT/ROLLBACK explícitos a encerram implicitamente e blocos PL/SQL
+    que terminam em COMMIT já se confirmam sozinhos. Assim, commits
+    redundantes são evitados em qualquer modo.
+    """
+
+    def __init__(self, mode=COMMIT_POR_COMANDO, every=100):
+        if mode not in COMMIT_MODES:
+            raise ValueError(f"Modo de commit desconhecido: {mode}")
+        self.mode = mode
+        # Quantidade de comandos (modo count) ou milissegundos (modo interval)
+        self.every = max(1, int(every))
+        self.reset()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria a política a partir das chaves commit_mode/commit_every da configuração."""
+        return cls(
+            config.get("commit_mode", COMMIT_POR_COMANDO),
+            config.get("commit_every", 100)
+        )
+
+    def reset(self):
+        """Reinicia o estado para uma nova execução."""
+        self.pending = False
+        # Indica se há um savepoint válido marcando o início do script atual
+        self.savepoint = False
+        self._since_commit = 0
+        self._last_commit = time.monotonic()
+
+    def record(self, statement_type, count=1, commits_itself=False):
+        """Registra comandos executados com sucesso e indica se é hora do commit."""
+        if statement_type in (STATEMENT_DDL, STATEMENT_TCL) or commits_itself:
+            # A transação (e qualquer savepoint) já foi encerrada pelo próprio comando
+            self.pending = False
+            self.savepoint = False
+            self.committed()
+            return False
+
+        if statement_type not in (STATEMENT_DML, STATEMENT_PLSQL):
+            return False
+
+        self.pending = True
+        self._since_commit += count
+
+        if self.mode == COMMIT_POR_COMANDO:
+            return True
+        if self.mode == COMMIT_A_CADA_N:
+            return self._since_commit >= self.every
+        if self.mode == COMMIT_POR_INTERVALO:
+            return (time.monotonic() - self._last_commit) * 1000 >= self.every
+        return False
+
+    def committed(self):
+        """Registra que a transação foi confirmada ou desfeita."""
+        self.pending = False
+        self.savepoint = False
+        self._since_commit = 0
+        self._last_commit = time.monotonic()
+
+    def needs_file_savepoint(self):
+        """Indica se o script deve começar com um savepoint (modo execução inteira)."""
+        return self.mode == COMMIT_EXECUCAO and self.pending
+
+    def commits_at_file_end(self):
+        """Indica se o trabalho pendente é confirmado ao final de cada script."""
+        return self.mode != COMMIT_EXECUCAO
+
+    def rolls_back_failed_file(self):
+        """Indica se um script com erro deve ter suas alterações desfeitas."""
+        return self.mode in (COMMIT_POR_ARQUIVO, COMMIT_EXECUCAO)
@@ -0,0 +1,192 @@
+import csv
+import json
+import os
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+# Arquivos delimitados carregados diretamente em tabelas (em vez de scripts de INSERT)
+DELIMITED_EXTENSIONS = (".csv", ".tsv")
+
+# Sufixo do arquivo de mapeamento: dados.csv -> dados.csv.json
+MAPPING_SUFFIX = ".json"
+
+# Linhas enviadas por executemany quando nem o mapeamento nem a configuração definem
+DEFAULT_LOAD_BATCH_SIZE = 1000
+
+# Tamanho do buffer de leitura dos arquivos (em bytes)
+LOAD_BUFFER_SIZE = 1024 * 1024
+
+TYPE_TEXT = "text"
+TYPE_NUMBER = "number"
+TYPE_DATE = "date"
+TYPE_TIMESTAMP = "timestamp"
+
+_DEFAULT_FORMATS = {
+    TYPE_DATE: "%Y-%m-%d",
+    TYPE_TIMESTAMP: "%Y-%m-%d %H:%M:%S",
+}
+
+# Tipo informado ao driver (setinputsizes): colunas numéricas e de data não
+# dependem da primeira linha do lote para definir o tipo do bind
+_BIND_TYPES = {
+    TYPE_TEXT: None,
+    TYPE_NUMBER: Decimal,
+    TYPE_DATE: datetime,
+    TYPE_TIMESTAMP: datetime,
+}
+
+# Linhas de um lote: números das linhas de dados (sem o cabeçalho), valores
+# convertidos e linhas inválidas como (linha, mensagem, campos originais)
+LoadChunk = namedtuple("LoadChunk", ["lines", "rows", "invalid"])
+
+
+def is_delimited(file_path):
+    """Indica se o arquivo é um arquivo delimitado (.csv/.tsv) e não um script SQL."""
+    return file_path.lower().endswith(DELIMITED_EXTENSIONS)
+
+
+def mapping_path(file_path):
+    """Caminho do arquivo de mapeamento que acompanha o arquivo de dados."""
+    return file_path + MAPPING_SUFFIX
+
+
+def _number_converter(decimal_separator):
+    def convert(text):
+        if decimal_separator != ".":
+            text = text.replace(".", "").replace(decimal_separator, ".")
+        return Decimal(text.strip())
+    return convert
+
+
+def _date_converter(date_format):
+    def convert(text):
+        return datetime.strptime(text.strip(), date_format)
+    return convert
+
+
+class DelimitedFile:
+    """Arquivo CSV/TSV e seu mapeamento para uma tabela.
+
+    O mapeamento (dados.csv.json) informa a tabela e as colunas na ordem
+    do arquivo; cada coluna é um nome (texto) ou um objeto com name, type
+    (text, number, date, timestamp) e format (padrão do strptime). Uma
+    coluna null é ignorada. Opções: delimiter, header, encoding, null
+    (texto tratado como NULL), decimal e batch_size.
+    """
+
+    def __init__(self, path, mapping, batch_size=DEFAULT_LOAD_BATCH_SIZE):
+        self.path = path
+        table = mapping.get("table")
+        columns = mapping.get("columns")
+        if not table or not isinstance(columns, list) or not any(columns):
+            raise ValueError(f"Mapeamento de '{os.path.basename(path)}' deve informar 'table' e 'columns'.")
+
+        self.table = table
+        self.delimiter = mapping.get("delimiter") or ("\t" if path.lower().endswith(".tsv") else ",")
+        self.header = bool(mapping.get("header", True))
+        self.encoding = mapping.get("encoding", "utf-8-sig")
+        self.null = mapping.get("null", "")
+        self.batch_size = max(1, int(mapping.get("batch_size") or batch_size))
+
+        decimal_separator = mapping.get("decimal", ".")
+        self._names = []
+        self._types = []
+        self._converters = []
+        for position, column in enumerate(columns, 1):
+            if column is None:
+                self._converters.append(None)
+                continue
+            if isinstance(column, str):
+                column = {"name": column}
+            name = column.get("name")
+            column_type = str(column.get("type", TYPE_TEXT)).lower()
+            if not name or column_type not in _BIND_TYPES:
+                raise ValueError(
+                    f"Coluna {position} do mapeamento de '{os.path.basename(path)}' inválida: "
+                    f"informe 'name' e um 'type' entre {', '.join(_BIND_TYPES)}."
+                )
+            if column_type == TYPE_NUMBER:
+                converter = _number_converter(decimal_separator)
+            elif column_type in _DEFAULT_FORMATS:
+                converter = _date_converter(column.get("format") or _DEFAULT_FORMATS[column_type])
+            else:
+                converter = str
+            self._names.append(name)
+            self._types.append(column_type)
+            self._converters.append((name, converter))
+
+    @classmethod
+    def from_file(cls, path, config=None):
+        """Lê o mapeamento do arquivo; levanta ValueError se estiver ausente ou inválido."""
+        batch_size = int((config or {}).get("load_batch_size", DEFAULT_LOAD_BATCH_SIZE))
+        try:
+            with open(mapping_path(path), encoding="utf-8-sig") as f:
+                mapping = json.load(f)
+        except FileNotFoundError:
+            raise ValueError(
+                f"Arquivo de mapeamento não encontrado: {os.path.basename(mapping_path(path))}"
+            ) from None
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Mapeamento de '{os.path.basename(path)}' inválido: {e}") from None
+        if not isinstance(mapping, dict):
+            raise ValueError(f"Mapeamento de '{os.path.basename(path)}' deve ser um objeto JSON.")
+        return cls(path, mapping, batch_size)
+
+    @property
+    def sql(self):
+        """INSERT com um bind por coluna mapeada."""
+        binds = ", ".join(f":{n}" for n in range(1, len(self._names) + 1))
+        return f"INSERT INTO {self.table} ({', '.join(self._names)}) VALUES ({binds})"
+
+    def input_sizes(self):
+        """Tipos dos binds para setinputsizes (None: definido pelo driver)."""
+        return [_BIND_TYPES[column_type] for column_type in self._types]
+
+    def chunks(self, start_line=1):
+        """Lê o arquivo em lotes de batch_size linhas, a partir da linha de dados start_line.
+
+        O arquivo é lido de forma incremental: apenas o lote atual fica em
+        memória, qualquer que seja o tamanho do arquivo.
+        """
+        expected = len(self._converters)
+        lines, rows, invalid = [], [], []
+        with open(self.path, encoding=self.encoding, newline="", buffering=LOAD_BUFFER_SIZE) as f:
+            reader = csv.reader(f, delimiter=self.delimiter)
+            if self.header:
+                next(reader, None)
+            for line, fields in enumerate(reader, 1):
+                if line < start_line or not fields:
+                    continue
+                if len(fields) != expected:
+                    invalid.append((line, f"{len(fields)} campo(s); o mapeamento define {expected}.", fields))
+                else:
+                    try:
+                        rows.append(self._convert(fields))
+                        lines.append(line)
+                    except _InvalidValue as e:
+                        invalid.append((line, str(e), fields))
+                if len(rows) + len(invalid) >= self.batch_size:
+                    yield LoadChunk(lines, rows, invalid)
+                    lines, rows, invalid = [], [], []
+        if rows or invalid:
+            yield LoadChunk(lines, rows, invalid)
+
+    def _convert(self, fields):
+        values = []
+        for text, column in zip(fields, self._converters):
+            if column is None:
+                continue
+            if text == self.null:
+                values.append(None)
+                continue
+            name, converter = column
+            try:
+                values.append(converter(text))
+            except (ValueError, InvalidOperation):
+                raise _InvalidValue(f"Valor inválido na coluna {name}: '{text}'") from None
+        return tuple(values)
+
+
+class _InvalidValue(Exception):
+    """Valor que não pôde ser convertido para o tipo da coluna."""
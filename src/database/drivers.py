@@ -0,0 +1,150 @@
+import importlib
+
+# Drivers disponíveis (chave "driver" da configuração)
+DRIVER_THIN = "thin"            # python-oracledb sem bibliotecas nativas
+DRIVER_THICK = "thick"          # python-oracledb com o Oracle Instant Client
+DRIVER_CX_ORACLE = "cx_oracle"  # cx_Oracle 8 (legado), com o Instant Client
+DRIVER_FAKE = "fake"            # driver simulado, sem banco (testes e benchmarks)
+DRIVERS = (DRIVER_THIN, DRIVER_THICK, DRIVER_CX_ORACLE, DRIVER_FAKE)
+
+DEFAULT_DRIVER = DRIVER_THIN
+
+_active = None
+
+
+class DriverBackend:
+    """Módulo DB-API usado pelas sessões e o que ele exige para inicializar.
+
+    O módulo só é importado quando o driver é selecionado, de modo que
+    drivers não usados não precisam estar instalados.
+    """
+
+    name = None
+    module_name = None
+    # Drivers que carregam as bibliotecas do Oracle Instant Client
+    needs_instant_client = False
+
+    def __init__(self):
+        self.module = importlib.import_module(self.module_name)
+
+    @property
+    def database_error(self):
+        """Classe base dos erros de banco do driver."""
+        return self.module.DatabaseError
+
+    @property
+    def char_type(self):
+        """Tipo de bind CHAR (semântica de comparação dos literais de texto)."""
+        return None
+
+    def init_client(self, lib_dir):
+        """Carrega as bibliotecas nativas (apenas drivers que usam o Instant Client)."""
+
+    def makedsn(self, host, port, service):
+        return self.module.makedsn(host, port, service_name=service)
+
+    def set_call_timeout(self, connection, milliseconds):
+        """Tempo limite de cada ida ao banco da sessão (0 = sem limite)."""
+        connection.call_timeout = milliseconds
+
+    def create_pool(self, user, password, dsn, min_sessions, max_sessions):
+        """Cria o pool nativo do driver (acquire/release/drop/close)."""
+        raise NotImplementedError
+
+
+class OracledbThinDriver(DriverBackend):
+    name = DRIVER_THIN
+    module_name = "oracledb"
+
+    @property
+    def char_type(self):
+        return self.module.DB_TYPE_CHAR
+
+    def create_pool(self, user, password, dsn, min_sessions, max_sessions):
+        return self.module.create_pool(
+            user=user,
+            password=password,
+            dsn=dsn,
+            min=min_sessions,
+            max=max_sessions,
+            increment=1,
+            getmode=self.module.POOL_GETMODE_WAIT
+        )
+
+
+class OracledbThickDriver(OracledbThinDriver):
+    name = DRIVER_THICK
+    needs_instant_client = True
+
+    def init_client(self, lib_dir):
+        self.module.init_oracle_client(lib_dir=lib_dir)
+
+
+class CxOracleDriver(DriverBackend):
+    name = DRIVER_CX_ORACLE
+    module_name = "cx_Oracle"
+    needs_instant_client = True
+
+    @property
+    def char_type(self):
+        return self.module.FIXED_CHAR
+
+    def init_client(self, lib_dir):
+        self.module.init_oracle_client(lib_dir=lib_dir)
+
+    def set_call_timeout(self, connection, milliseconds):
+        connection.callTimeout = milliseconds
+
+    def create_pool(self, user, password, dsn, min_sessions, max_sessions):
+        return self.module.SessionPool(
+            user=user,
+            password=password,
+            dsn=dsn,
+            min=min_sessions,
+            max=max_sessions,
+            increment=1,
+            threaded=True,
+            getmode=self.module.SPOOL_ATTRVAL_WAIT
+        )
+
+
+class FakeDriver(DriverBackend):
+    name = DRIVER_FAKE
+    module_name = "src.database.fake_driver"
+
+    def create_pool(self, user, password, dsn, min_sessions, max_sessions):
+        return self.module.FakeSessionPool(user, password, dsn, max_sessions=max_sessions)
+
+
+_BACKENDS = {
+    backend.name: backend
+    for backend in (OracledbThinDriver, OracledbThickDriver, CxOracleDriver, FakeDriver)
+}
+
+
+def select_driver(name=None):
+    """Seleciona o driver das próximas sessões e o retorna.
+
+    Sem nome, usa o driver padrão (thin) ou, se o python-oracledb não
+    estiver instalado, o cx_Oracle. Levanta ValueError para um nome
+    desconhecido e ImportError se o módulo do driver não estiver instalado.
+    """
+    global _active
+    if name is None:
+        try:
+            backend = OracledbThinDriver()
+        except ImportError:
+            backend = CxOracleDriver()
+    elif name in _BACKENDS:
+        backend = _BACKENDS[name]()
+    else:
+        raise ValueError(f"Driver desconhecido: '{name}'. Use um de: {', '.join(DRIVERS)}.")
+    _active = backend
+    return backend
+
+
+def get_driver():
+    """Retorna o driver selecionado (o padrão, se nenhum foi escolhido)."""
+    if _active is None:
+        return select_driver()
+    return _active
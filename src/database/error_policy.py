@@ -0,0 +1,152 @@
+import fnmatch
+import os
+import re
+import threading
+from src.database.sql_lexer import (
+    STATEMENT_SELECT, STATEMENT_DML, STATEMENT_DDL, STATEMENT_PLSQL, STATEMENT_TCL, STATEMENT_OTHER
+)
+
+# Ações das regras de erros
+ACTION_IGNORE = "ignore"        # o bloco é tratado como executado
+ACTION_RETRY = "retry"          # o bloco é repetido (retries vezes, a cada delay segundos)
+ACTION_STOP_FILE = "stop_file"  # os blocos restantes do script não são executados
+ACTION_STOP_RUN = "stop_run"    # o script e a execução são interrompidos
+ACTION_ASK = "ask"              # comportamento sem regras: pergunta ao usuário ao final do script
+
+ERROR_ACTIONS = (ACTION_IGNORE, ACTION_RETRY, ACTION_STOP_FILE, ACTION_STOP_RUN, ACTION_ASK)
+
+STATEMENT_TYPES = (
+    STATEMENT_SELECT, STATEMENT_DML, STATEMENT_DDL, STATEMENT_PLSQL, STATEMENT_TCL, STATEMENT_OTHER
+)
+
+DEFAULT_RETRIES = 3
+DEFAULT_RETRY_DELAY = 1.0
+
+_CODE_RE = re.compile(r"^(?:ORA-?)?(\d{1,5})$", re.IGNORECASE)
+
+
+def _parse_code(value):
+    """Código ORA de uma regra: 955, "955", "00955" ou "ORA-00955"."""
+    match = _CODE_RE.match(str(value).strip())
+    if match is None:
+        raise ValueError(f"Código de erro inválido nas regras de erros: {value}")
+    return int(match.group(1))
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+class ErrorRule:
+    """Regra de erros: critérios (códigos ORA, tipos de comando, scripts) e ação.
+
+    Critérios omitidos valem para qualquer erro; uma regra sem critérios
+    decide todos os erros que as regras anteriores não decidiram.
+    """
+
+    def __init__(self, action, codes=(), statement_types=(), files=(),
+                 retries=DEFAULT_RETRIES, delay=DEFAULT_RETRY_DELAY):
+        if action not in ERROR_ACTIONS:
+            raise ValueError(f"Ação desconhecida nas regras de erros: {action}")
+        unknown = [kind for kind in statement_types if kind not in STATEMENT_TYPES]
+        if unknown:
+            raise ValueError(f"Tipo de comando desconhecido nas regras de erros: {', '.join(unknown)}")
+        self.action = action
+        self.codes = frozenset(codes)
+        self.statement_types = frozenset(statement_types)
+        self.files = [pattern.replace("\\", "/").lower() for pattern in files]
+        self.retries = max(0, int(retries))
+        self.delay = max(0.0, float(delay))
+
+    @classmethod
+    def from_dict(cls, entry):
+        """Cria a regra a partir de um item de error_rules; levanta ValueError se for inválido."""
+        if not isinstance(entry, dict):
+            raise ValueError("Cada regra de erros deve ser um objeto JSON.")
+        try:
+            return cls(
+                str(entry.get("action", "")).lower(),
+                codes=[_parse_code(code) for code in _as_list(entry.get("codes"))],
+                statement_types=[str(kind).upper() for kind in _as_list(entry.get("statement_types"))],
+                files=[str(pattern) for pattern in _as_list(entry.get("files"))],
+                retries=entry.get("retries", DEFAULT_RETRIES),
+                delay=entry.get("delay", DEFAULT_RETRY_DELAY),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Regra de erros inválida {entry}: {e}") from None
+
+    def matches(self, code, statement_type, script):
+        if self.codes and code not in self.codes:
+            return False
+        if self.statement_types and statement_type not in self.statement_types:
+            return False
+        if self.files:
+            path = (script or "").replace("\\", "/").lower()
+            name = os.path.basename(path)
+            if not any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(path, pattern) for pattern in self.files):
+                return False
+        return True
+
+
+class ErrorPolicy:
+    """Decide, sem interação, o que fazer com o erro de um bloco (chave error_rules).
+
+    Vale a primeira regra que corresponder ao erro; uma regra de repetição
+    cujas tentativas se esgotaram passa o erro às regras seguintes. Erros
+    sem regra seguem o comportamento interativo (diálogo ou --on-error).
+    Compartilhada entre as sessões: conta as ações aplicadas por código.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self._applied = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria a política a partir de error_rules; retorna None sem regras e levanta ValueError se inválidas."""
+        entries = config.get("error_rules") or []
+        if not isinstance(entries, list):
+            raise ValueError("error_rules deve ser uma lista de regras.")
+        if not entries:
+            return None
+        return cls(ErrorRule.from_dict(entry) for entry in entries)
+
+    def decide(self, code, statement_type, script, attempt=None):
+        """Ação para o erro: ACTION_RETRY (com a regra) apenas se attempt for informado.
+
+        Retorna (ação, regra); sem regra correspondente, (ACTION_ASK, None).
+        """
+        for rule in self.rules:
+            if not rule.matches(code, statement_type, script):
+                continue
+            if rule.action == ACTION_RETRY and (attempt is None or attempt > rule.retries):
+                continue
+            self._count(rule.action, code)
+            return rule.action, rule
+        return ACTION_ASK, None
+
+    def _count(self, action, code):
+        key = f"ORA-{code:05d}" if code else "?"
+        with self._lock:
+            by_code = self._applied.setdefault(action, {})
+            by_code[key] = by_code.get(key, 0) + 1
+
+    def summary(self):
+        """Erros decididos pelas regras, por ação e código ORA."""
+        with self._lock:
+            return {action: dict(by_code) for action, by_code in self._applied.items()}
+
+    def format_summary(self):
+        """Texto do resumo para exibição no painel de saída."""
+        summary = self.summary()
+        lines = ["Regras de erros aplicadas:"]
+        for action in ERROR_ACTIONS:
+            by_code = summary.get(action)
+            if by_code:
+                codes = ", ".join(f"{code}: {count}" for code, count in
+                                  sorted(by_code.items(), key=lambda item: item[1], reverse=True))
+                lines.append(f"  {action}: {sum(by_code.values())} ({codes})")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,189 @@
+import csv
+import json
+import os
+import threading
+from collections import namedtuple
+
+# Quantidade padrão de blocos no ranking dos mais lentos
+DEFAULT_TOP_BLOCKS = 10
+
+# Tamanho do trecho de SQL guardado para identificar cada bloco
+SQL_PREVIEW_LENGTH = 120
+
+# Tipos de registro
+KIND_STATEMENT = "statement"   # um bloco executado com execute()
+KIND_BATCH = "batch"           # um lote de INSERTs enviado com executemany()
+KIND_COMMIT = "commit"         # commit ao final do script ou da execução
+
+BlockTiming = namedtuple("BlockTiming", [
+    "script", "block", "kind", "statement_type", "rows",
+    "split_ms", "execute_ms", "commit_ms", "rowcount", "ok", "sql"
+])
+
+
+def _preview(sql):
+    sql = " ".join(sql.split())
+    return sql if len(sql) <= SQL_PREVIEW_LENGTH else sql[:SQL_PREVIEW_LENGTH - 3] + "..."
+
+
+class ExecutionProfile:
+    """Tempos de cada bloco executado: leitura/divisão, execução e commit.
+
+    Compartilhado entre as sessões de uma execução; cada ida ao banco
+    (execute, executemany ou commit avulso) gera um BlockTiming, mantido
+    em memória até o fim da execução. Por isso o perfil só é medido quando
+    a chave profile está ativada.
+    """
+
+    def __init__(self):
+        self.records = []
+        # Execuções por texto de comando (hash), para estimar o reaproveitamento de parse
+        self._statements = {}
+        self._bound_executions = 0
+        self._server_parses = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o perfil da execução; retorna None se profile não estiver ativado."""
+        if not config.get("profile", False):
+            return None
+        return cls()
+
+    def record(self, script, block, kind, statement_type, rows, split, execute, commit,
+               rowcount, ok, sql=""):
+        """Registra uma ida ao banco (tempos em segundos; commit None se não houve commit)."""
+        timing = BlockTiming(
+            script or "", block, kind, statement_type, rows,
+            round(split * 1000, 3), round(execute * 1000, 3),
+            None if commit is None else round(commit * 1000, 3),
+            rowcount, ok, _preview(sql)
+        )
+        with self._lock:
+            self.records.append(timing)
+
+    def count_parse(self, sql, bound=False):
+        """Registra o texto de um comando enviado ao banco (bound: literais convertidos em binds)."""
+        key = hash(sql)
+        with self._lock:
+            self._statements[key] = self._statements.get(key, 0) + 1
+            if bound:
+                self._bound_executions += 1
+
+    def add_server_parses(self, counts):
+        """Soma os contadores de parse de uma sessão (v$mystat) ao final da execução."""
+        with self._lock:
+            for name, value in counts.items():
+                self._server_parses[name] = self._server_parses.get(name, 0) + value
+
+    def parse_summary(self):
+        """Reaproveitamento de parse: execuções que repetiram um texto já enviado.
+
+        A estimativa vem dos textos enviados; quando a sessão pode ler
+        v$mystat, os contadores do servidor também são incluídos.
+        """
+        with self._lock:
+            executions = sum(self._statements.values())
+            distinct = len(self._statements)
+            summary = {
+                "executions": executions,
+                "distinct_statements": distinct,
+                "bound_executions": self._bound_executions,
+                "reuse_ratio": round(1 - distinct / executions, 4) if executions else 0.0,
+            }
+            if self._server_parses:
+                total = self._server_parses.get("parse count (total)", 0)
+                hard = self._server_parses.get("parse count (hard)", 0)
+                summary["server"] = {
+                    "parse_total": total,
+                    "parse_hard": hard,
+                    "cursor_cache_hits": self._server_parses.get("session cursor cache hits", 0),
+                    "soft_parse_ratio": round(1 - hard / total, 4) if total else 0.0,
+                }
+        return summary
+
+    def summary(self, top=DEFAULT_TOP_BLOCKS):
+        """Resume o perfil: totais, tempo por tipo de comando e blocos mais lentos."""
+        with self._lock:
+            records = list(self.records)
+
+        by_type = {}
+        round_trips = {"execute": 0, "executemany": 0, "commit": 0}
+        totals = {"split_ms": 0.0, "execute_ms": 0.0, "commit_ms": 0.0}
+        blocks = 0
+        for timing in records:
+            totals["split_ms"] += timing.split_ms
+            totals["execute_ms"] += timing.execute_ms
+            if timing.commit_ms is not None:
+                totals["commit_ms"] += timing.commit_ms
+                round_trips["commit"] += 1
+            if timing.kind == KIND_COMMIT:
+                continue
+            round_trips["executemany" if timing.kind == KIND_BATCH else "execute"] += 1
+            blocks += timing.rows
+            stats = by_type.setdefault(timing.statement_type, {"blocks": 0, "execute_ms": 0.0})
+            stats["blocks"] += timing.rows
+            stats["execute_ms"] += timing.execute_ms
+
+        slowest = sorted(
+            (t for t in records if t.kind != KIND_COMMIT),
+            key=lambda t: t.execute_ms + (t.commit_ms or 0), reverse=True
+        )[:top]
+        return {
+            "blocks": blocks,
+            "round_trips": round_trips,
+            "totals": {key: round(value, 3) for key, value in totals.items()},
+            "by_type": by_type,
+            "slowest": [timing._asdict() for timing in slowest],
+            "parses": self.parse_summary(),
+        }
+
+    def format_summary(self, top=DEFAULT_TOP_BLOCKS):
+        """Texto do resumo para exibição no painel de saída."""
+        summary = self.summary(top)
+        trips = summary["round_trips"]
+        totals = summary["totals"]
+        lines = [
+            "Perfil da execução:",
+            f"  Blocos: {summary['blocks']} | Idas ao banco: {trips['execute']} execute, "
+            f"{trips['executemany']} executemany, {trips['commit']} commit",
+            f"  Tempo: execução {totals['execute_ms'] / 1000:.3f} s, "
+            f"commit {totals['commit_ms'] / 1000:.3f} s, "
+            f"leitura/divisão {totals['split_ms'] / 1000:.3f} s",
+        ]
+        parses = summary["parses"]
+        if parses["executions"]:
+            lines.append(
+                f"  Parse: {parses['executions']} comando(s) enviados, {parses['distinct_statements']} texto(s) distinto(s), "
+                f"reaproveitamento {parses['reuse_ratio']:.1%} ({parses['bound_executions']} com literais em binds)"
+            )
+        if "server" in parses:
+            server = parses["server"]
+            lines.append(
+                f"  Parse no servidor: {server['parse_total']} total, {server['parse_hard']} hard, "
+                f"{server['cursor_cache_hits']} acerto(s) no cache de cursores ({server['soft_parse_ratio']:.1%} sem hard parse)"
+            )
+        lines.append("  Tempo por tipo de comando:")
+        for statement_type, stats in sorted(summary["by_type"].items(),
+                                            key=lambda item: item[1]["execute_ms"], reverse=True):
+            lines.append(f"    {statement_type:<8} {stats['execute_ms'] / 1000:10.3f} s  ({stats['blocks']} bloco(s))")
+        if summary["slowest"]:
+            lines.append(f"  Blocos mais lentos:")
+            for position, timing in enumerate(summary["slowest"], 1):
+                seconds = (timing["execute_ms"] + (timing["commit_ms"] or 0)) / 1000
+                lines.append(f"    {position:>2}. {seconds:8.3f} s  {os.path.basename(timing['script'])} #{timing['block']}  {timing['sql']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Exporta os registros em CSV (extensão .csv) ou JSON Lines (demais extensões)."""
+        with self._lock:
+            records = list(self.records)
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(BlockTiming._fields)
+                writer.writerows(records)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                for timing in records:
+                    f.write(json.dumps(timing._asdict(), ensure_ascii=False) + "\n")
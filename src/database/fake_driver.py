@@ -0,0 +1,148 @@
+import threading
+import time
+
+# Latência padrão simulada por ida ao banco (em segundos)
+DEFAULT_LATENCY = 0.0005
+DEFAULT_ROW_LATENCY = 0.000002
+
+
+class DatabaseError(Exception):
+    """Erro de banco do driver simulado (mesma hierarquia do DB-API)."""
+
+
+def makedsn(host, port, service_name=None):
+    return f"{host}:{port}/{service_name}"
+
+
+class DriverStats:
+    """Contadores de idas ao banco de um FakeSessionPool (compartilhados entre sessões)."""
+
+    def __init__(self):
+        self.execute = 0
+        self.executemany = 0
+        self.rows = 0
+        self.commit = 0
+        self.rollback = 0
+        self._lock = threading.Lock()
+
+    def count(self, kind, rows=0):
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+            self.rows += rows
+
+    @property
+    def round_trips(self):
+        return self.execute + self.executemany + self.commit + self.rollback
+
+    def as_dict(self):
+        return {
+            "execute": self.execute, "executemany": self.executemany, "rows": self.rows,
+            "commit": self.commit, "rollback": self.rollback, "round_trips": self.round_trips,
+        }
+
+
+class FakeCursor:
+    """Cursor DB-API em memória: aceita qualquer comando e simula a latência."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+        self.description = None
+        self.arraysize = 100
+
+    def execute(self, sql, parameters=None):
+        self.connection._round_trip("execute")
+        self.rowcount = 0 if sql.lstrip()[:6].upper() == "SELECT" else 1
+
+    def setinputsizes(self, *sizes):
+        pass
+
+    def executemany(self, sql, seq_of_parameters, batcherrors=False):
+        rows = len(seq_of_parameters)
+        self.connection._round_trip("executemany", rows)
+        self.rowcount = rows
+
+    def getbatcherrors(self):
+        return []
+
+    def fetchone(self):
+        return None
+
+    def fetchmany(self, size=None):
+        return []
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Conexão DB-API em memória criada por FakeSessionPool."""
+
+    def __init__(self, pool):
+        self._pool = pool
+        self.call_timeout = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def ping(self):
+        pass
+
+    def commit(self):
+        self._round_trip("commit")
+
+    def rollback(self):
+        self._round_trip("rollback")
+
+    def cancel(self):
+        pass
+
+    def close(self):
+        pass
+
+    def _round_trip(self, kind, rows=0):
+        """Contabiliza uma ida ao banco e aguarda a latência simulada."""
+        self._pool.stats.count(kind, rows)
+        delay = self._pool.latency + rows * self._pool.row_latency
+        if delay > 0:
+            time.sleep(delay)
+
+
+class FakeSessionPool:
+    """Pool de sessões simulado, com a mesma interface de session_pool.SessionPool.
+
+    Permite medir o divisor e o executor sem uma instância Oracle: cada
+    execute/executemany/commit/rollback custa latency segundos (mais
+    row_latency por linha de um executemany) e é contado em stats.
+    Usado pelo driver "fake" ou instalado com session_pool.set_pool_factory.
+    """
+
+    def __init__(self, user=None, password=None, dsn=None, max_sessions=64,
+                 latency=DEFAULT_LATENCY, row_latency=DEFAULT_ROW_LATENCY):
+        self.max_sessions = max_sessions
+        self.closed = False
+        self.latency = latency
+        self.row_latency = row_latency
+        self.stats = DriverStats()
+
+    def factory(self, user, password, dsn, max_sessions=None):
+        """Fábrica para set_pool_factory que sempre devolve este pool."""
+        return self
+
+    def acquire(self):
+        return FakeConnection(self)
+
+    def release(self, connection):
+        pass
+
+    def drop(self, connection):
+        pass
+
+    def retire(self):
+        self.close()
+
+    def close(self, force=False):
+        self.closed = True
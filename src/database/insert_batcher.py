@@ -0,0 +1,141 @@
+import re
+from decimal import Decimal
+
+# Identificador Oracle simples ou entre aspas
+_IDENT = r'(?:"[^"]+"|[^\W\d][\w$#]*)'
+
+_INSERT_HEAD_RE = re.compile(
+    r"INSERT\s+INTO\s+(" + _IDENT + r"(?:\s*\.\s*" + _IDENT + r")?)\s*"
+    r"(?:\(([^()'\"]*(?:\"[^\"]*\"[^()'\"]*)*)\)\s*)?"
+    r"VALUES\s*\(",
+    re.IGNORECASE
+)
+
+# Um literal da lista VALUES seguido de ',' ou ')'
+_LITERAL_RE = re.compile(
+    r"\s*(?:'((?:[^']|'')*)'|(NULL)|([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?))\s*([,)])",
+    re.IGNORECASE
+)
+
+_COLUMN_SPLIT_RE = re.compile(r"\s*,\s*")
+
+
+def _normalize_identifier(identifier):
+    """Normaliza um identificador para comparação (maiúsculas fora de aspas)."""
+    parts = []
+    for part in re.split(r"\s*\.\s*", identifier.strip()):
+        parts.append(part if part.startswith('"') else part.upper())
+    return ".".join(parts)
+
+
+def parse_insert(block):
+    """Converte um INSERT ... VALUES com literais em comando com binds.
+
+    Retorna (chave, sql_com_binds, valores) ou None quando o comando não pode
+    ser parametrizado com segurança (expressões, funções, subconsultas,
+    literais tipados etc.). A chave identifica tabela e lista de colunas.
+    """
+    match = _INSERT_HEAD_RE.match(block)
+    if match is None:
+        return None
+
+    table, column_list = match.group(1), match.group(2)
+    values = []
+    pos = match.end()
+    while True:
+        literal = _LITERAL_RE.match(block, pos)
+        if literal is None:
+            return None
+        text, null, number, separator = literal.groups()
+        if text is not None:
+            values.append(text.replace("''", "'"))
+        elif null is not None:
+            values.append(None)
+        else:
+            values.append(Decimal(number))
+        pos = literal.end()
+        if separator == ")":
+            break
+
+    # Nada além do fechamento da lista VALUES (sem RETURNING, LOG ERRORS etc.)
+    if block[pos:].strip():
+        return None
+
+    if column_list is not None:
+        columns = _COLUMN_SPLIT_RE.split(column_list.strip())
+        if len(columns) != len(values):
+            return None
+        key = (_normalize_identifier(table), tuple(_normalize_identifier(c) for c in columns))
+        target = f"{table} ({', '.join(c.strip() for c in columns)})"
+    else:
+        key = (_normalize_identifier(table), len(values))
+        target = table
+
+    binds = ", ".join(f":{n}" for n in range(1, len(values) + 1))
+    return key, f"INSERT INTO {target} VALUES ({binds})", values
+
+
+class InsertBatch:
+    """Acumula INSERTs consecutivos e homogêneos para envio via executemany."""
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Esvazia o lote."""
+        self.key = None
+        self.sql = None
+        self.rows = []
+        self.blocks = []
+        self._column_types = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def accepts(self, parsed_insert):
+        """Indica se o INSERT tem o mesmo destino e tipos compatíveis com o lote."""
+        if not self.rows:
+            return True
+        key, _, values = parsed_insert
+        if key != self.key:
+            return False
+        for value, column_type in zip(values, self._column_types):
+            if value is not None and column_type is not None and type(value) is not column_type:
+                return False
+        return True
+
+    def add(self, index, block, parsed_insert):
+        """Adiciona um INSERT ao lote, guardando o bloco original para erros."""
+        key, sql, values = parsed_insert
+        if not self.rows:
+            self.key = key
+            self.sql = sql
+            self._column_types = [None] * len(values)
+        for position, value in enumerate(values):
+            if value is not None and self._column_types[position] is None:
+                self._column_types[position] = type(value)
+        self.rows.append(tuple(values))
+        self.blocks.append((index, block))
+
+
+class BatchSizer:
+    """Ajusta o tamanho dos lotes conforme o tempo gasto em cada ida ao banco.
+
+    Lotes rápidos dobram de tamanho e lotes lentos são reduzidos à metade,
+    mantendo cada chamada perto de target_seconds.
+    """
+
+    def __init__(self, initial=100, minimum=10, maximum=5000, target_seconds=0.5):
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_seconds = target_seconds
+
+    def record(self, rows, elapsed):
+        """Registra a duração de um lote completo e ajusta o próximo tamanho."""
+        if rows < self.size:
+            return
+        if elapsed < self.target_seconds / 2:
+            self.size = min(self.maximum, self.size * 2)
+        elif elapsed > self.target_seconds:
+            self.size = max(self.minimum, self.size // 2)
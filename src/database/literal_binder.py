@@ -0,0 +1,89 @@
+import re
+from decimal import Decimal
+
+# Apenas UPDATE e DELETE são parametrizados (INSERTs são tratados pelo insert_batcher)
+_HEAD_RE = re.compile(r"\s*(?:UPDATE|DELETE)(?![\w$#])", re.IGNORECASE)
+
+_TOKEN_RE = re.compile(
+    r"""(?P<string>'(?:[^']|'')*')"""
+    r'''|(?P<quoted>"[^"]*")'''
+    r"|(?P<word>[^\W\d][\w$#]*)"
+    r"|(?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)"
+    r"|(?P<other>.)",
+    re.DOTALL
+)
+
+# Palavras cujos argumentos precisam ser literais (tamanhos de tipo, posições
+# de ORDER/GROUP BY, listas do PIVOT, amostragem, partições...) ou cujo
+# comportamento muda com binds (RETURNING exige binds de saída)
+_UNSAFE_WORDS = {
+    "CAST", "TREAT", "ORDER", "GROUP", "PIVOT", "UNPIVOT", "MODEL", "SAMPLE",
+    "PARTITION", "SUBPARTITION", "RETURNING", "RETURN", "INTERVAL", "ERRORS",
+}
+_UNSAFE_PREFIXES = ("JSON_", "XML")
+
+# Literais tipados: a string seguinte permanece como literal
+_TYPED_LITERALS = {"DATE", "TIMESTAMP"}
+
+# Prefixos de literais especiais (q'[...]', n'...', u'...')
+_STRING_PREFIXES = {"Q", "N", "NQ", "U"}
+
+# Tamanho máximo de um bind CHAR (o tipo usado para manter a semântica do literal)
+MAX_CHAR_BIND_BYTES = 2000
+
+
+def bind_literals(block):
+    """Converte os literais de um UPDATE/DELETE em variáveis de ligação.
+
+    Retorna (sql_com_binds, valores) ou None quando o comando não é um
+    UPDATE/DELETE, não tem literais ou contém construções em que a troca
+    não é segura (ver _UNSAFE_WORDS, binds ou comentários já presentes,
+    números com sufixo de tipo). Strings viram str e números Decimal;
+    literais DATE/TIMESTAMP são mantidos no texto.
+    """
+    if _HEAD_RE.match(block) is None:
+        return None
+
+    parts = []
+    values = []
+    keep_next_string = False
+    for match in _TOKEN_RE.finditer(block):
+        kind = match.lastgroup
+        text = match.group()
+        end = match.end()
+        if kind == "string":
+            if keep_next_string:
+                parts.append(text)
+                keep_next_string = False
+                continue
+            value = text[1:-1].replace("''", "'")
+            if len(value.encode("utf-8")) > MAX_CHAR_BIND_BYTES:
+                return None
+            values.append(value)
+            parts.append(f":{len(values)}")
+            continue
+        if kind == "number":
+            # 1.5f, 2d, 10K...: sufixos de tipo ou texto inesperado
+            if end < len(block) and (block[end].isalnum() or block[end] in "_$#"):
+                return None
+            values.append(Decimal(text))
+            parts.append(f":{len(values)}")
+            continue
+        if kind == "word":
+            word = text.upper()
+            if word in _UNSAFE_WORDS or word.startswith(_UNSAFE_PREFIXES):
+                return None
+            if word in _STRING_PREFIXES and block[end:end + 1] == "'":
+                return None
+            keep_next_string = word in _TYPED_LITERALS
+        elif kind == "other":
+            # Binds, variáveis de substituição, aspas sem fechamento e comentários (incluindo hints)
+            if text in ":?&'\"" or block[match.start():end + 1] in ("/*", "--"):
+                return None
+            if not text.isspace():
+                keep_next_string = False
+        parts.append(text)
+
+    if not values:
+        return None
+    return "".join(parts), values
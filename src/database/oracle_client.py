@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+import time
+from src.database.drivers import select_driver
+
+# Versão do Oracle Instant Client distribuída com a aplicação
+INSTANT_CLIENT_FOLDER = "instantclient_23_7"
+
+
+def get_application_path():
+    """Retorna o caminho base da aplicação, seja em desenvolvimento ou no executável."""
+    if getattr(sys, 'frozen', False):
+        # Se estiver rodando como executável
+        return os.path.dirname(sys.executable)
+    # Se estiver rodando em desenvolvimento
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def get_instant_client_dir():
+    """Retorna a pasta esperada do Oracle Instant Client."""
+    base_path = get_application_path()
+
+    # O Instant Client deve estar na mesma pasta do executável
+    if getattr(sys, 'frozen', False):
+        return os.path.join(base_path, INSTANT_CLIENT_FOLDER)
+    return os.path.join(base_path, "instantclient", INSTANT_CLIENT_FOLDER)
+
+
+def initialize_oracle_client(driver_name=None):
+    """Seleciona o driver e inicializa o cliente Oracle, se ele precisar.
+
+    O driver thin (padrão) não usa bibliotecas nativas: o Instant Client só
+    é carregado pelos drivers thick e cx_oracle. Retorna (True, None) em
+    caso de sucesso ou (False, mensagem) em caso de erro, sem depender da
+    interface gráfica.
+    """
+    try:
+        driver = select_driver(driver_name)
+    except ValueError as e:
+        return False, str(e)
+    except ImportError as e:
+        return False, f"O driver '{driver_name or 'padrão'}' não está instalado.\nErro: {e}"
+    if not driver.needs_instant_client:
+        return True, None
+
+    instant_client_dir = None
+    try:
+        instant_client_dir = get_instant_client_dir()
+
+        if not os.path.exists(instant_client_dir):
+            return False, (
+                f"Pasta do Oracle Instant Client não encontrada em:\n{instant_client_dir}\n\n"
+                f"Por favor, certifique-se de que a pasta '{INSTANT_CLIENT_FOLDER}' está no mesmo diretório do executável."
+            )
+
+        # Adiciona o diretório ao PATH do sistema
+        if instant_client_dir not in os.environ['PATH']:
+            os.environ['PATH'] = instant_client_dir + os.pathsep + os.environ['PATH']
+
+        driver.init_client(instant_client_dir)
+        return True, None
+    except Exception as e:
+        return False, (
+            f"Não foi possível inicializar o Oracle Instant Client.\n"
+            f"Erro: {str(e)}\n\n"
+            f"Caminho tentado: {instant_client_dir or 'Nenhum'}"
+        )
+
+
+class ClientInitializer:
+    """Seleciona o driver e inicializa o cliente Oracle em segundo plano.
+
+    Permite que a janela seja exibida enquanto o driver (e, se necessário,
+    o Instant Client) é carregado. on_done(success, error) é chamado a
+    partir da thread de inicialização; wait() bloqueia até o resultado.
+    """
+
+    def __init__(self, driver_name=None, on_done=None):
+        self.driver_name = driver_name
+        self.on_done = on_done
+        self.result = None
+        self.elapsed = None
+        self._done = threading.Event()
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name="oracle-client-init", daemon=True)
+        thread.start()
+        return self
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Aguarda a inicialização e retorna (sucesso, mensagem de erro)."""
+        if not self._done.wait(timeout):
+            return False, "A inicialização do cliente Oracle ainda está em andamento."
+        return self.result
+
+    def _run(self):
+        started = time.perf_counter()
+        try:
+            self.result = initialize_oracle_client(self.driver_name)
+        except Exception as e:
+            self.result = (False, f"Erro inesperado ao inicializar o cliente Oracle: {e}")
+        self.elapsed = time.perf_counter() - started
+        self._done.set()
+        if self.on_done is not None:
+            self.on_done(*self.result)
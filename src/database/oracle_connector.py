@@ -1,129 +1,828 @@
-import cx_Oracle
-from tkinter import messagebox
-import re
+import os
+import time
+from src.database.sql_lexer import split_sql_blocks, parse_block, STATEMENT_DML, STATEMENT_SELECT
+from src.database.insert_batcher import InsertBatch, BatchSizer, parse_insert
+from src.database.literal_binder import bind_literals
+from src.database.reject_log import MAX_REJECTS_IN_MESSAGE, format_values
+from src.database.commit_policy import CommitPolicy
+from src.database.error_policy import ACTION_ASK, ACTION_IGNORE, ACTION_RETRY, ACTION_STOP_FILE, ACTION_STOP_RUN
+from src.database.drivers import get_driver
+from src.database.session_pool import (
+    get_pool, get_error_code, is_connection_lost, is_call_interrupted, POOL_MAX_SESSIONS
+)
+from src.database.execution_profile import KIND_STATEMENT, KIND_BATCH, KIND_COMMIT
+
+# Savepoint que marca o início de cada script no modo "execução inteira"
+_FILE_SAVEPOINT = "inicio_script"
+
+_SESSION_LOST_NOTE = "Sessão restabelecida; alterações ainda não confirmadas foram perdidas."
+
+# Tempo limite da verificação da sessão após um comando interrompido (em milissegundos)
+_PING_TIMEOUT_MS = 5000
+
+# Intervalo mínimo entre as notificações de progresso das cargas de arquivos (em segundos)
+PROGRESS_INTERVAL = 1.0
+
+# Contadores de parse da sessão (exige acesso a v$mystat/v$statname)
+_PARSE_STATS_SQL = (
+    "SELECT n.name, s.value FROM v$mystat s JOIN v$statname n ON n.statistic# = s.statistic# "
+    "WHERE n.name IN ('parse count (total)', 'parse count (hard)', 'session cursor cache hits')"
+)
 
 class OracleConnector:
     def __init__(self):
         self.connection = None
         self.cursor = None
+        self._pool = None
+        self._batch_sizer = BatchSizer()
+        self.commit_policy = CommitPolicy()
+        # Diário de execução (opcional) e blocos ainda não confirmados por script
+        self.journal = None
+        self._script = None
+        self._unconfirmed = {}
+        self._finished_scripts = []
+        # Perfil de tempos (opcional); leitura e commit são somados ao próximo registro
+        self.profile = None
+        self._split_elapsed = 0.0
+        self._commit_elapsed = None
+        self._parse_start = None
+        # Literais de UPDATE/DELETE enviados como binds (ver literal_binder)
+        self.bind_literals = True
+        self._stmtcachesize = None
+        # Lotes enviados com batcherrors e relatório (opcional) das linhas rejeitadas
+        self.batch_errors = True
+        self.rejects = None
+        # Exportação (opcional) das linhas retornadas pelos SELECTs
+        self.results = None
+        # Tempos limite (em segundos; 0 = sem limite) e cancelamento pelo usuário
+        self.statement_timeout = 0
+        self.script_timeout = 0
+        self.cancelled = False
+        self._deadline = None
+        # Regras de erros (opcional) e a decisão delas no script atual
+        self.error_policy = None
+        self._halt = None
+        self._unmatched_error = False
+        self._call_timeout = None
+
+    def connect(self, user, password, host, port, service, max_sessions=POOL_MAX_SESSIONS, stmtcachesize=None):
+        """Obtém uma sessão do pool de conexões com o banco de dados Oracle.
 
-    def connect(self, user, password, host, port, service):
-        """Estabelece conexão com o banco de dados Oracle."""
+        O pool é reaproveitado entre validações e execuções com os mesmos
+        parâmetros, evitando um novo handshake a cada operação. stmtcachesize
+        define quantos comandos já analisados a sessão mantém em cache
+        (None usa o padrão do driver).
+        """
+        self._stmtcachesize = stmtcachesize
         try:
-            dsn = cx_Oracle.makedsn(host, port, service_name=service)
-            self.connection = cx_Oracle.connect(user=user, password=password, dsn=dsn)
-            self.cursor = self.connection.cursor()
+            self._pool = get_pool(user, password, host, port, service, max(max_sessions, POOL_MAX_SESSIONS))
+            self._acquire_session()
             return True, None
-        except cx_Oracle.DatabaseError as e:
-            error, = e.args
-            error_msg = f"Erro ao conectar ao banco de dados:\nCódigo: {error.code}\nMensagem: {error.message}"
-            return False, error_msg
         except Exception as e:
+            if get_error_code(e) is not None:
+                error, = e.args
+                error_msg = f"Erro ao conectar ao banco de dados:\nCódigo: {error.code}\nMensagem: {error.message}"
+                return False, error_msg
             error_msg = f"Erro inesperado durante a conexão: {e}"
             return False, error_msg
 
+    def begin_run(self, commit_policy=None):
+        """Prepara uma nova execução com a política de commit informada."""
+        if commit_policy is not None:
+            self.commit_policy = commit_policy
+        self.commit_policy.reset()
+        self._parse_start = None
+        self.cancelled = False
+
+    def end_run(self, completed):
+        """Encerra a transação da execução: commit se concluída, rollback se interrompida."""
+        self._record_server_parses()
+        if not self.commit_policy.pending:
+            return True, None
+        try:
+            self._arm_timeout()
+            if completed:
+                self._commit()
+                self._record_commit()
+            else:
+                self.connection.rollback()
+                self._discard_unconfirmed()
+            self.commit_policy.committed()
+            return True, None
+        except Exception as e:
+            return False, f"Erro ao finalizar a transação da execução: {e}"
+
     def execute_script(self, sql):
-        """Executa um script SQL com múltiplos blocos/comandos."""
-        overall_success = True
-        error_messages = []
-        
+        """Executa um script SQL com múltiplos blocos/comandos.
+
+        O script pode ser um texto ou um iterável de linhas (como um arquivo
+        aberto); neste caso cada bloco é executado assim que é lido.
+        Sequências de INSERTs homogêneos com literais são agrupadas e
+        enviadas em lotes via executemany. Os commits seguem a política
+        definida em commit_policy.
+        """
         # Remove comentários e divide o script em blocos
-        blocks = self._split_sql_blocks(sql)
-        
-        for i, block in enumerate(blocks, 1):
-            # Ignora blocos vazios
-            if not block.strip():
-                continue
-                
-            try:
-                # Executa o bloco SQL
-                self.cursor.execute(block)
-                
-                # Commit após cada comando DDL ou DML bem-sucedido
-                # (não afeta comandos SELECT)
-                self.connection.commit()
-            except Exception as e:
-                overall_success = False
-                
-                # Preparando o bloco para exibição (limitado a 500 caracteres para não sobrecarregar a UI)
-                block_preview = block
-                if len(block_preview) > 500:
-                    block_preview = block_preview[:497] + "..."
-                
-                # Formata a mensagem de erro incluindo o bloco que falhou
-                error_message = f"Erro no bloco {i}:\n{str(e)}\n\n"
-                error_message += f"Bloco com erro:\n{block_preview}\n"
-                error_message += "-" * 50 + "\n"
-                
-                error_messages.append(error_message)
+        return self.execute_blocks(self._split_sql_blocks(sql))
+
+    def execute_blocks(self, blocks, script=None, start_block=1):
+        """Executa blocos já divididos: textos ou ParsedBlock (ex.: do cache de blocos).
+
+        Com um diário de execução, o resultado de cada bloco de script é
+        registrado; blocos anteriores a start_block (já confirmados em uma
+        execução interrompida) são ignorados.
+        """
+        error_messages = []
+        batch = InsertBatch()
+        self._script = script
+        if self.profile is not None:
+            blocks = self._timed_blocks(blocks)
+            if self._parse_start is None:
+                self._parse_start = self._server_parse_counts()
+
+        self._begin_file()
+        try:
+            for i, parsed in enumerate(blocks, 1):
+                if i < start_block:
+                    continue
+                interruption = self._interruption()
+                if interruption:
+                    # O lote pendente também não é enviado
+                    batch.clear()
+                    error_messages.append(interruption)
+                    break
+                if isinstance(parsed, str):
+                    parsed = parse_block(parsed)
+                block = parsed.text
+                # Ignora blocos vazios
+                if not block.strip():
+                    continue
+
+                parsed_insert = parse_insert(block) if parsed.statement_type == STATEMENT_DML else None
+                if parsed_insert is not None:
+                    if not batch.accepts(parsed_insert):
+                        error_messages.extend(self._flush_insert_batch(batch))
+                    batch.add(i, block, parsed_insert)
+                    if len(batch) >= self._batch_sizer.size:
+                        error_messages.extend(self._flush_insert_batch(batch))
+                    continue
+
+                # Um comando que não é INSERT encerra o lote em andamento
+                error_messages.extend(self._flush_insert_batch(batch))
+                started = time.perf_counter()
+                error_message = self._execute_block(i, block, parsed)
+                if self.journal is not None:
+                    self.journal.block(script, i, error_message is None, time.perf_counter() - started)
+                if error_message:
+                    error_messages.append(error_message)
+
+            error_messages.extend(self._flush_insert_batch(batch))
+        except BaseException:
+            self._end_file(False)
+            raise
+
+        return self._finish_file(script, error_messages)
+
+    def load_file(self, source, script=None, start_line=1, on_progress=None):
+        """Carrega um arquivo delimitado (ver delimited_loader) via executemany.
+
+        As linhas são lidas e enviadas em lotes de source.batch_size, de modo
+        que a memória usada não depende do tamanho do arquivo. Linhas com
+        valores inválidos ou rejeitadas pelo banco não interrompem a carga e
+        são listadas no erro do arquivo. on_progress(linhas, segundos) é
+        chamado a cada PROGRESS_INTERVAL segundos e ao final.
+        """
+        error_messages = []
+        shown = []
+        total = rejected = 0
+        self._script = script
+        if self.profile is not None and self._parse_start is None:
+            self._parse_start = self._server_parse_counts()
+
+        started = last_report = time.perf_counter()
+        self._begin_file()
+        try:
+            for chunk in source.chunks(start_line):
+                interruption = self._interruption()
+                if interruption:
+                    error_messages.append(interruption)
+                    break
+                failures = [(line, None, message, fields) for line, message, fields in chunk.invalid]
+                total += len(chunk.lines) + len(chunk.invalid)
+                if chunk.rows:
+                    sent = time.perf_counter()
+                    try:
+                        if self.profile is not None:
+                            self.profile.count_parse(source.sql, True)
+                        errors = self._send_rows(source.sql, chunk.rows, source.input_sizes())
+                    except Exception as e:
+                        code = get_error_code(e)
+                        if is_connection_lost(e):
+                            self._reconnect()
+                            e = f"{e}\n{_SESSION_LOST_NOTE}"
+                        elif is_call_interrupted(e):
+                            e, _ = self._after_interruption(e)
+                        if self.profile is not None:
+                            self._record_timing(chunk.lines[0], source.sql, STATEMENT_DML, KIND_BATCH,
+                                                len(chunk.rows), time.perf_counter() - sent, None, False)
+                        self._apply_error_rules(code, STATEMENT_DML)
+                        error_messages.append(
+                            f"Erro na carga de {os.path.basename(source.path)} a partir da linha {chunk.lines[0]}:\n"
+                            f"{e}\nAs linhas seguintes não foram carregadas.\n" + "-" * 50 + "\n"
+                        )
+                        break
+                    elapsed = time.perf_counter() - sent
+                    failures.extend((chunk.lines[row], code, message, chunk.rows[row]) for row, code, message in errors)
+                    succeeded = len(chunk.rows) - len(errors)
+                    if self.journal is not None:
+                        self.journal.block(script, chunk.lines[-1], not failures, elapsed)
+                        self._mark_executed(chunk.lines[-1])
+                    try:
+                        if succeeded:
+                            self._register_success(STATEMENT_DML, succeeded)
+                    except Exception as e:
+                        error_messages.append(self._format_block_error(chunk.lines[-1], source.sql, e))
+                        break
+                    finally:
+                        if self.profile is not None:
+                            self._record_timing(chunk.lines[0], source.sql, STATEMENT_DML, KIND_BATCH,
+                                                len(chunk.rows), elapsed, succeeded, not errors)
+
+                for line, code, message, values in failures:
+                    if self.rejects is not None:
+                        self.rejects.add(script, line, code, message, values)
+                    if self._apply_error_rules(code, STATEMENT_DML)[0] == ACTION_IGNORE:
+                        # Fica apenas no relatório de rejeições
+                        continue
+                    rejected += 1
+                    if len(shown) < MAX_REJECTS_IN_MESSAGE:
+                        shown.append(f"  Linha {line}: {message}\n    Valores: {format_values(values)}")
+
+                if on_progress is not None and time.perf_counter() - last_report >= PROGRESS_INTERVAL:
+                    last_report = time.perf_counter()
+                    on_progress(total, last_report - started)
+        except BaseException:
+            self._end_file(False)
+            raise
+
+        if on_progress is not None:
+            on_progress(total, time.perf_counter() - started)
+        if rejected:
+            if rejected > MAX_REJECTS_IN_MESSAGE:
+                shown.append(f"  ... e mais {rejected - MAX_REJECTS_IN_MESSAGE} linha(s)")
+            error_messages.insert(0, (
+                f"Carga de {os.path.basename(source.path)}: {rejected} de {total} linha(s) rejeitada(s); "
+                f"as demais foram enviadas.\n{source.sql}\n" + "\n".join(shown) + "\n" + "-" * 50 + "\n"
+            ))
+        return self._finish_file(script, error_messages)
+
+    def _finish_file(self, script, error_messages):
+        """Encerra o script (ou arquivo de dados) e retorna (sucesso, erros)."""
+        rolled_back = bool(error_messages) and self.commit_policy.rolls_back_failed_file()
+        file_message = self._end_file(not error_messages)
+        if file_message:
+            error_messages.append(file_message)
+        if self.journal is not None and not rolled_back:
+            # O script é concluído quando suas alterações pendentes forem confirmadas
+            self._finished_scripts.append(script)
+            if not self.commit_policy.pending:
+                self._checkpoint()
         
-        if overall_success:
+        if not error_messages:
             return True, None
         else:
             # Retorna todos os erros encontrados
             return False, "\n".join(error_messages)
 
-    def _remove_comments(self, sql_script):
-        """Remove comentários de uma linha (--) e blocos de comentários (/* */) do script SQL."""
-        # Primeiro, normaliza as quebras de linha
-        script = sql_script.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Remove blocos de comentários (/* ... */)
-        # Usamos expressão regular não-gulosa (?:.*?) para capturar conteúdo entre /* e */
-        block_comments_pattern = re.compile(r'/\*(?:.*?)\*/', re.DOTALL)
-        script = block_comments_pattern.sub(' ', script)
-        
-        # Remove comentários de uma linha (--) até o final da linha
+    def _execute_block(self, index, block, parsed=None, retry=True, attempt=1):
+        """Executa um único bloco e retorna a mensagem de erro, se houver.
+
+        Se a sessão cair (ORA-03113/03114...) sem trabalho pendente, o bloco
+        é repetido uma vez em uma nova sessão do pool. Os demais erros
+        seguem as regras de erros (error_policy), quando houver.
+        """
+        if parsed is None:
+            parsed = parse_block(block)
+        bound = None
+        if self.bind_literals and parsed.statement_type == STATEMENT_DML:
+            # Comandos que diferem apenas nos literais compartilham o mesmo cursor
+            bound = bind_literals(block)
+
+        export = self.results is not None and parsed.statement_type == STATEMENT_SELECT
+        started = time.perf_counter()
+        try:
+            self._arm_timeout()
+            # Executa o bloco SQL
+            if export:
+                self.results.prepare(self.cursor)
+            if bound is None:
+                self.cursor.execute(block)
+            else:
+                self._execute_bound(*bound)
+            if export and self.cursor.description:
+                # As linhas são buscadas e gravadas em lotes, sem acumular o resultado
+                self.results.export(self.cursor, self._script, index)
+            executed = time.perf_counter() - started
+            self._mark_executed(index)
+            if self.profile is not None:
+                self.profile.count_parse(block if bound is None else bound[0], bound is not None)
+
+            # O commit depende da política e do tipo do comando
+            # (SELECT e DDL não precisam de commit)
+            self._register_success(parsed.statement_type, commits_itself=parsed.commits_itself)
+            if self.profile is not None:
+                self._record_timing(index, block, parsed.statement_type, KIND_STATEMENT, 1,
+                                    executed, self.cursor.rowcount, True)
+            return None
+        except Exception as e:
+            executed = time.perf_counter() - started
+            code = get_error_code(e)
+            # Só erros comuns podem ser repetidos pelas regras
+            rule_attempt = None
+            if is_connection_lost(e):
+                work_lost = self.commit_policy.pending
+                self._reconnect()
+                if retry and not work_lost:
+                    return self._execute_block(index, block, parsed, retry=False)
+                e = f"{e}\n{_SESSION_LOST_NOTE}"
+            elif is_call_interrupted(e):
+                e, _ = self._after_interruption(e)
+            else:
+                rule_attempt = attempt
+            if self.profile is not None:
+                self._record_timing(index, block, parsed.statement_type, KIND_STATEMENT, 1, executed, None, False)
+            action, rule = self._apply_error_rules(code, parsed.statement_type, rule_attempt)
+            if action == ACTION_RETRY and self._wait_retry(rule.delay):
+                return self._execute_block(index, block, parsed, retry, attempt + 1)
+            if action == ACTION_IGNORE:
+                self._mark_executed(index)
+                return None
+            return self._format_block_error(index, block, e)
+
+    def _execute_bound(self, sql, values):
+        """Executa um comando com os literais convertidos em binds.
+
+        Textos são enviados como CHAR, como os literais originais, para
+        manter a comparação com colunas CHAR (com preenchimento de espaços).
+        """
+        char_type = get_driver().char_type
+        if char_type is not None:
+            self.cursor.setinputsizes(*(char_type if isinstance(value, str) else None for value in values))
+        self.cursor.execute(sql, values)
+
+    def _register_success(self, statement_type, count=1, commits_itself=False):
+        """Informa comandos bem-sucedidos à política e faz o commit quando devido."""
+        if self.commit_policy.record(statement_type, count, commits_itself):
+            self._commit()
+        elif not self.commit_policy.pending:
+            # Nada pendente: o comando não alterou dados ou já se confirmou (DDL/COMMIT)
+            self._checkpoint()
+
+    def _commit(self):
+        """Confirma a transação atual."""
+        self._arm_timeout()
+        started = time.perf_counter()
+        self.connection.commit()
+        self._commit_elapsed = (self._commit_elapsed or 0.0) + time.perf_counter() - started
+        self.commit_policy.committed()
+        self._checkpoint()
+
+    def _timed_blocks(self, blocks):
+        """Repassa os blocos medindo o tempo de leitura/divisão de cada um."""
+        iterator = iter(blocks)
+        while True:
+            started = time.perf_counter()
+            try:
+                block = next(iterator)
+            except StopIteration:
+                return
+            self._split_elapsed += time.perf_counter() - started
+            yield block
+
+    def _record_timing(self, index, sql, statement_type, kind, rows, executed, rowcount, ok):
+        """Registra os tempos de uma ida ao banco no perfil da execução."""
+        self.profile.record(
+            self._script, index, kind, statement_type, rows,
+            self._split_elapsed, executed, self._commit_elapsed, rowcount, ok, sql
+        )
+        self._split_elapsed = 0.0
+        self._commit_elapsed = None
+
+    def _record_commit(self):
+        """Registra um commit que não foi disparado por um bloco (fim de script ou execução)."""
+        if self.profile is not None and self._commit_elapsed is not None:
+            self._record_timing(None, "COMMIT", None, KIND_COMMIT, 0, 0.0, None, True)
+
+    def _mark_executed(self, index):
+        """Registra o último bloco executado do script atual, ainda não confirmado."""
+        if self.journal is not None:
+            self._unconfirmed[self._script] = index
+
+    def _checkpoint(self):
+        """Registra no diário os blocos e scripts cujas alterações foram confirmadas."""
+        if self.journal is None:
+            return
+        for script, index in self._unconfirmed.items():
+            self.journal.durable(script, index)
+        for script in self._finished_scripts:
+            self.journal.script_done(script)
+        self._unconfirmed.clear()
+        self._finished_scripts.clear()
+
+    def _discard_unconfirmed(self, script=None):
+        """Esquece blocos desfeitos (de um script ou de toda a transação)."""
+        if script is None:
+            self._unconfirmed.clear()
+            self._finished_scripts.clear()
+        else:
+            self._unconfirmed.pop(script, None)
+
+    def _begin_file(self):
+        """Marca o início de um script com savepoint quando há trabalho pendente."""
+        if self.script_timeout:
+            self._deadline = time.monotonic() + self.script_timeout
+        self._halt = None
+        self._unmatched_error = False
+        if self.commit_policy.needs_file_savepoint():
+            self._arm_timeout()
+            self.cursor.execute(f"SAVEPOINT {_FILE_SAVEPOINT}")
+            self.commit_policy.savepoint = True
+
+    def _end_file(self, success):
+        """Finaliza a transação do script conforme a política de commit.
+
+        Cada comando já é atômico no Oracle; aqui tratamos o script como um
+        todo: em caso de falha, os modos por arquivo e execução inteira
+        desfazem apenas o script atual (via savepoint), preservando o
+        trabalho dos scripts anteriores.
+        """
+        policy = self.commit_policy
+        # O encerramento do script não está sujeito ao tempo limite do script
+        self._deadline = None
+        try:
+            self._arm_timeout()
+            if not success and policy.rolls_back_failed_file():
+                if policy.savepoint:
+                    self.cursor.execute(f"ROLLBACK TO SAVEPOINT {_FILE_SAVEPOINT}")
+                    policy.savepoint = False
+                    self._discard_unconfirmed(self._script)
+                else:
+                    self.connection.rollback()
+                    policy.committed()
+                    self._discard_unconfirmed()
+                return "Alterações do script desfeitas (rollback).\n"
+            if policy.pending and policy.commits_at_file_end():
+                self._commit()
+                self._record_commit()
+        except Exception as e:
+            return f"Erro ao finalizar a transação do script: {e}\n"
+        return None
+
+    def _flush_insert_batch(self, batch):
+        """Envia o lote de INSERTs acumulado e retorna as mensagens de erro.
+
+        Se uma linha falhar, as anteriores já foram inseridas; o erro é
+        atribuído ao bloco original da linha e o envio continua a partir
+        da linha seguinte, como na execução comando a comando.
+        """
+        error_messages = []
+        if len(batch) == 1:
+            # Não há ganho em parametrizar um INSERT isolado
+            index, block = batch.blocks[0]
+            started = time.perf_counter()
+            error_message = self._execute_block(index, block)
+            if self.journal is not None:
+                self.journal.block(self._script, index, error_message is None, time.perf_counter() - started)
+            if error_message:
+                error_messages.append(error_message)
+        elif batch.rows:
+            rows, blocks, offset = batch.rows, batch.blocks, 0
+            succeeded = 0
+            failed_rows = set()
+            batch_started = time.perf_counter()
+            can_retry = not self.commit_policy.pending
+            while offset < len(rows):
+                pending = rows[offset:] if offset else rows
+                started = time.perf_counter()
+                try:
+                    self._arm_timeout()
+                    if self.profile is not None:
+                        self.profile.count_parse(batch.sql, True)
+                    if self.batch_errors:
+                        # Linhas inválidas não interrompem o lote: o banco devolve os erros ao final
+                        self.cursor.executemany(batch.sql, pending, batcherrors=True)
+                        rejected = self.cursor.getbatcherrors()
+                    else:
+                        self.cursor.executemany(batch.sql, pending)
+                        rejected = ()
+                    self._batch_sizer.record(len(pending), time.perf_counter() - started)
+                    succeeded += len(pending) - len(rejected)
+                    if rejected:
+                        message = self._collect_rejects(batch, offset, rejected, failed_rows)
+                        if message:
+                            error_messages.append(message)
+                    break
+                except Exception as e:
+                    # rowcount indica quantas linhas foram processadas antes do erro
+                    processed = min(max(self.cursor.rowcount or 0, 0), len(pending) - 1)
+                    code = get_error_code(e)
+                    if is_call_interrupted(e):
+                        # Cancelamento ou tempo limite: as linhas restantes do lote não são enviadas
+                        message, lost = self._after_interruption(e)
+                        if lost:
+                            succeeded = 0
+                            failed_rows.update(range(offset))
+                        failed_rows.update(range(offset, len(rows)))
+                        index, block = blocks[offset]
+                        if self._apply_error_rules(code, STATEMENT_DML)[0] != ACTION_IGNORE:
+                            error_messages.append(self._format_block_error(index, block, message))
+                        break
+                    if is_connection_lost(e):
+                        self._reconnect()
+                        if can_retry:
+                            # Nada havia sido confirmado: reenvia o lote inteiro na nova sessão
+                            can_retry = False
+                            offset = succeeded = 0
+                            error_messages = []
+                            failed_rows.clear()
+                            continue
+                        # As linhas já enviadas neste lote se perderam com a sessão
+                        succeeded = 0
+                        failed_rows.update(range(offset + processed))
+                        e = f"{e}\n{_SESSION_LOST_NOTE}"
+                    elif self.batch_errors:
+                        # Com batcherrors, só erros do próprio comando chegam aqui: valem para todas as linhas
+                        failed_rows.update(range(offset, len(rows)))
+                        index, block = blocks[offset]
+                        if self._apply_error_rules(code, STATEMENT_DML)[0] != ACTION_IGNORE:
+                            error_messages.append(self._format_block_error(
+                                index, block, f"{e}\nNenhuma das {len(rows) - offset} linha(s) restantes do lote foi inserida."
+                            ))
+                        break
+                    else:
+                        succeeded += processed
+                    failed = offset + processed
+                    failed_rows.add(failed)
+                    index, block = blocks[failed]
+                    if self._apply_error_rules(code, STATEMENT_DML)[0] != ACTION_IGNORE:
+                        error_messages.append(self._format_block_error(index, block, e))
+                    if self._halt is not None:
+                        # Regra de interrupção: as linhas restantes do lote não são enviadas
+                        failed_rows.update(range(failed + 1, len(rows)))
+                        break
+                    offset = failed + 1
+
+            batch_elapsed = time.perf_counter() - batch_started
+            if self.journal is not None:
+                self._journal_batch(blocks, failed_rows, batch_elapsed)
+            try:
+                if succeeded:
+                    self._register_success(STATEMENT_DML, succeeded)
+            except Exception as e:
+                index, block = blocks[-1]
+                error_messages.append(self._format_block_error(index, block, e))
+            if self.profile is not None:
+                self._record_timing(blocks[0][0], batch.sql, STATEMENT_DML, KIND_BATCH, len(rows),
+                                    batch_elapsed, succeeded, not failed_rows)
+        batch.clear()
+        return error_messages
+
+    def _send_rows(self, sql, rows, input_sizes=None):
+        """Envia linhas via executemany e retorna as rejeitadas como (posição, código, mensagem).
+
+        Sem batch_errors, cada erro interrompe o envio, que continua a partir
+        da linha seguinte. Erros do próprio comando, de conexão, cancelamento
+        e tempo limite são levantados.
+        """
+        rejected = []
+        offset = 0
+        while offset < len(rows):
+            pending = rows[offset:] if offset else rows
+            self._arm_timeout()
+            if input_sizes and any(input_sizes):
+                self.cursor.setinputsizes(*input_sizes)
+            if self.batch_errors:
+                self.cursor.executemany(sql, pending, batcherrors=True)
+                rejected.extend(
+                    (offset + error.offset, getattr(error, "code", None), str(error.message).strip())
+                    for error in self.cursor.getbatcherrors()
+                )
+                break
+            try:
+                self.cursor.executemany(sql, pending)
+                break
+            except Exception as e:
+                if is_connection_lost(e) or is_call_interrupted(e):
+                    raise
+                processed = min(max(self.cursor.rowcount or 0, 0), len(pending) - 1)
+                rejected.append((offset + processed, get_error_code(e), str(e).strip()))
+                offset += processed + 1
+        return rejected
+
+    def _collect_rejects(self, batch, offset, rejected, failed_rows):
+        """Registra as linhas rejeitadas de um lote e retorna uma mensagem compacta.
+
+        Linhas cujo erro é ignorado pelas regras de erros ficam apenas no
+        relatório de rejeições; retorna None se todas forem ignoradas.
+        """
         lines = []
-        for line in script.split('\n'):
-            # Encontra a posição do comentário de linha
-            comment_pos = line.find('--')
-            if comment_pos >= 0:
-                # Mantém apenas o que está antes do comentário
-                line = line[:comment_pos]
-            lines.append(line)
+        reported = 0
+        for error in rejected:
+            row = offset + error.offset
+            failed_rows.add(row)
+            index, _ = batch.blocks[row]
+            code = getattr(error, "code", None)
+            message = str(error.message).strip()
+            if self.rejects is not None:
+                self.rejects.add(self._script, index, code, message, batch.rows[row])
+            if self._apply_error_rules(code, STATEMENT_DML)[0] == ACTION_IGNORE:
+                continue
+            reported += 1
+            if len(lines) < MAX_REJECTS_IN_MESSAGE:
+                lines.append(f"  Bloco {index}: {message}\n    Valores: {format_values(batch.rows[row])}")
+        if not reported:
+            return None
+        if reported > MAX_REJECTS_IN_MESSAGE:
+            lines.append(f"  ... e mais {reported - MAX_REJECTS_IN_MESSAGE} linha(s)")
+        first, last = batch.blocks[0][0], batch.blocks[-1][0]
+        return (
+            f"Lote de INSERTs (blocos {first} a {last}): {reported} linha(s) rejeitada(s); "
+            f"as demais foram enviadas.\n{batch.sql}\n" + "\n".join(lines) + "\n" + "-" * 50 + "\n"
+        )
+
+    def _journal_batch(self, blocks, failed_rows, elapsed):
+        """Registra no diário cada linha de um lote, com a duração média por linha."""
+        per_row = elapsed / len(blocks)
+        last_ok = None
+        for row, (index, _) in enumerate(blocks):
+            ok = row not in failed_rows
+            self.journal.block(self._script, index, ok, per_row)
+            if ok:
+                last_ok = index
+        if last_ok is not None:
+            self._mark_executed(last_ok)
+
+    def _format_block_error(self, index, block, error):
+        """Formata a mensagem de erro de um bloco, incluindo o trecho que falhou."""
+        # Preparando o bloco para exibição (limitado a 500 caracteres para não sobrecarregar a UI)
+        block_preview = block
+        if len(block_preview) > 500:
+            block_preview = block_preview[:497] + "..."
         
-        return '\n'.join(lines)
+        # Formata a mensagem de erro incluindo o bloco que falhou
+        error_message = f"Erro no bloco {index}:\n{str(error)}\n\n"
+        error_message += f"Bloco com erro:\n{block_preview}\n"
+        error_message += "-" * 50 + "\n"
+        return error_message
 
     def _split_sql_blocks(self, sql_script):
         """Divide um script SQL em blocos executáveis.
-        
-        Lida com:
-        1. Remove comentários (-- e /* */)
-        2. Blocos PL/SQL terminados por '/' em uma linha isolada
-        3. Múltiplos comandos SQL separados por ';'
-        4. Preserva blocos PL/SQL com ';' internos
+
+        Os blocos são produzidos sob demanda por um lexer de passagem única
+        (ver src.database.sql_lexer), que respeita strings, q-quotes,
+        comentários, aninhamento BEGIN/END e '/' em linha isolada.
         """
-        # Primeiro, remove todos os comentários
-        script = self._remove_comments(sql_script)
-        
-        # Divide em blocos delimitados por '/' em uma linha isolada
-        # (comum em scripts PL/SQL Oracle)
-        slash_pattern = re.compile(r'\n\s*/\s*\n')
-        blocks = slash_pattern.split(script)
-        
-        result_blocks = []
-        for block in blocks:
-            block = block.strip()
-            if not block:
-                continue
-                
-            # Se o bloco parece ser PL/SQL (contém BEGIN/DECLARE/CREATE), 
-            # mantém o bloco inteiro
-            if re.search(r'\b(BEGIN|DECLARE|CREATE\s+(OR\s+REPLACE\s+)?'
-                         r'(PROCEDURE|FUNCTION|TRIGGER|PACKAGE|TYPE))\b', 
-                         block, re.IGNORECASE):
-                result_blocks.append(block)
-            else:
-                # Para SQL regular, divide em comandos separados por ';'
-                sql_commands = [cmd.strip() for cmd in block.split(';') if cmd.strip()]
-                result_blocks.extend(sql_commands)
-        
-        return result_blocks
+        return split_sql_blocks(sql_script)
+
+    def _acquire_session(self):
+        """Obtém uma sessão do pool e aplica o tamanho do cache de comandos."""
+        self.connection = self._pool.acquire()
+        self._call_timeout = None
+        if self._stmtcachesize is not None:
+            self.connection.stmtcachesize = self._stmtcachesize
+        self.cursor = self.connection.cursor()
+
+    def cancel(self):
+        """Interrompe o comando em andamento e os blocos restantes (chamado de outra thread)."""
+        self.cancelled = True
+        connection = self.connection
+        if connection is not None:
+            try:
+                connection.cancel()
+            except Exception:
+                pass
+
+    def _interruption(self):
+        """Mensagem quando o script deve parar (cancelamento ou tempo limite do script)."""
+        if self.cancelled:
+            return "Execução cancelada pelo usuário; os blocos restantes não foram executados.\n"
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return (f"Tempo limite do script ({self.script_timeout:g} s) excedido; "
+                    f"os blocos restantes não foram executados.\n")
+        if self._halt is not None:
+            return f"Regra de erros ({self._halt}): os blocos restantes não foram executados.\n"
+        return None
+
+    @property
+    def rules_action(self):
+        """Decisão das regras de erros sobre o último script.
+
+        ACTION_STOP_RUN interrompe a execução; ACTION_ASK (algum erro sem
+        regra, ou sem regras configuradas) mantém a pergunta ao usuário; as
+        demais ações seguem para o próximo script sem perguntar.
+        """
+        if self.error_policy is None:
+            return ACTION_ASK
+        if self._halt == ACTION_STOP_RUN:
+            return ACTION_STOP_RUN
+        if self._unmatched_error:
+            return ACTION_ASK
+        return self._halt or ACTION_IGNORE
+
+    def _apply_error_rules(self, code, statement_type, attempt=None):
+        """Aplica as regras de erros ao erro de um bloco; retorna (ação, regra).
+
+        Sem attempt, regras de repetição são ignoradas. Após um cancelamento,
+        os erros não são submetidos às regras.
+        """
+        if self.error_policy is None or self.cancelled:
+            self._unmatched_error = True
+            return ACTION_ASK, None
+        action, rule = self.error_policy.decide(code, statement_type, self._script, attempt)
+        if action in (ACTION_STOP_FILE, ACTION_STOP_RUN):
+            if self._halt != ACTION_STOP_RUN:
+                self._halt = action
+        elif action == ACTION_ASK:
+            self._unmatched_error = True
+        return action, rule
+
+    def _wait_retry(self, delay):
+        """Aguarda antes de repetir um bloco; False se o script for interrompido nesse meio tempo."""
+        deadline = time.monotonic() + delay
+        while True:
+            if self._interruption():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, 0.1))
+
+    def _arm_timeout(self):
+        """Aplica à sessão o tempo limite da próxima chamada: o do comando ou o que resta do script."""
+        timeout = self.statement_timeout or None
+        if self._deadline is not None:
+            remaining = max(self._deadline - time.monotonic(), 0.001)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        milliseconds = 0 if timeout is None else max(1, int(timeout * 1000))
+        if milliseconds != self._call_timeout:
+            get_driver().set_call_timeout(self.connection, milliseconds)
+            self._call_timeout = milliseconds
+
+    def _after_interruption(self, error):
+        """Verifica a sessão após um comando cancelado ou interrompido pelo tempo limite.
+
+        Retorna (mensagem, trabalho_perdido): se a sessão não responder, ela
+        é substituída e as alterações não confirmadas se perdem.
+        """
+        if self.cancelled:
+            note = "Comando cancelado pelo usuário."
+        else:
+            note = "Tempo limite excedido (statement_timeout/script_timeout); o comando foi interrompido."
+        try:
+            get_driver().set_call_timeout(self.connection, _PING_TIMEOUT_MS)
+            self._call_timeout = _PING_TIMEOUT_MS
+            self.connection.ping()
+        except Exception:
+            self._reconnect()
+            return f"{error}\n{note}\n{_SESSION_LOST_NOTE}", True
+        return f"{error}\n{note}", False
+
+    def _server_parse_counts(self):
+        """Contadores de parse da sessão; None se v$mystat não puder ser lida."""
+        try:
+            self.cursor.execute(_PARSE_STATS_SQL)
+            return dict(self.cursor.fetchall()) or None
+        except Exception:
+            return None
+
+    def _record_server_parses(self):
+        """Soma ao perfil os parses feitos pela sessão desde o início da execução."""
+        start, self._parse_start = self._parse_start, None
+        if self.profile is None or start is None:
+            return
+        end = self._server_parse_counts()
+        if end is None:
+            return
+        self.profile.add_server_parses({name: end.get(name, 0) - value for name, value in start.items()})
+
+    def _reconnect(self):
+        """Substitui uma sessão perdida por uma nova sessão do pool."""
+        self._pool.drop(self.connection)
+        self._acquire_session()
+        if self._parse_start is not None:
+            # Os contadores da nova sessão começam do zero
+            self._parse_start = self._server_parse_counts()
+        # A transação da sessão anterior não existe mais
+        self.commit_policy.committed()
+        self._discard_unconfirmed()
 
     def close(self):
-        """Fecha a conexão com o banco de dados."""
+        """Devolve a sessão ao pool de conexões."""
         if self.cursor:
-            self.cursor.close()
+            try:
+                self.cursor.close()
+            except get_driver().database_error:
+                pass
         if self.connection:
-            self.connection.close() 
\ No newline at end of file
+            self._pool.release(self.connection)
+        self.cursor = None
+        self.connection = None 
\ No newline at end of file
@@ -0,0 +1,91 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import namedtuple
+
+# Linhas listadas na mensagem de erro do script; as demais ficam apenas no relatório
+MAX_REJECTS_IN_MESSAGE = 5
+# Linhas mantidas em memória; as seguintes vão para um arquivo temporário
+MAX_REJECTS_IN_MEMORY = 1000
+
+RowReject = namedtuple("RowReject", ["script", "block", "code", "message", "values"])
+
+
+def format_values(values):
+    """Valores de uma linha em JSON (números decimais como texto)."""
+    return json.dumps(list(values), ensure_ascii=False, default=str)
+
+
+class RejectLog:
+    """Linhas rejeitadas pelos lotes de INSERTs enviados com batcherrors.
+
+    Com batcherrors, o banco processa todas as linhas do lote e devolve os
+    erros de cada linha rejeitada de uma só vez; as linhas válidas seguem
+    a política de commit normalmente. Os totais por código e por script são
+    contados à medida que as linhas chegam; apenas as primeiras
+    MAX_REJECTS_IN_MEMORY ficam em memória e as demais são gravadas em um
+    arquivo temporário, de modo que uma carga com milhões de rejeições não
+    cresce a memória. Compartilhado entre as sessões.
+    """
+
+    def __init__(self, max_in_memory=MAX_REJECTS_IN_MEMORY):
+        self.rejects = []
+        self.total = 0
+        self.max_in_memory = max_in_memory
+        self._by_code = {}
+        self._by_script = {}
+        self._spool = None
+        self._spool_writer = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o relatório de rejeições; retorna None se batch_errors estiver desativado."""
+        if not config.get("batch_errors", True):
+            return None
+        return cls()
+
+    def add(self, script, block, code, message, values):
+        reject = RowReject(script or "", block, code, message, tuple(values))
+        label = f"ORA-{code:05d}" if code else "?"
+        with self._lock:
+            self.total += 1
+            self._by_code[label] = self._by_code.get(label, 0) + 1
+            self._by_script[reject.script] = self._by_script.get(reject.script, 0) + 1
+            if len(self.rejects) < self.max_in_memory:
+                self.rejects.append(reject)
+                return
+            if self._spool is None:
+                self._spool = tempfile.TemporaryFile("w+", newline="", encoding="utf-8")
+                self._spool_writer = csv.writer(self._spool)
+            self._spool_writer.writerow(reject._replace(values=format_values(reject.values)))
+
+    def summary(self):
+        """Total de linhas rejeitadas, por código ORA e por script."""
+        with self._lock:
+            return {"rows": self.total, "by_code": dict(self._by_code), "by_script": dict(self._by_script)}
+
+    def format_summary(self):
+        """Texto do resumo para exibição no painel de saída."""
+        summary = self.summary()
+        codes = ", ".join(f"{code}: {count}" for code, count in
+                          sorted(summary["by_code"].items(), key=lambda item: item[1], reverse=True))
+        lines = [f"Linhas rejeitadas: {summary['rows']} ({codes})"]
+        for script, count in sorted(summary["by_script"].items()):
+            lines.append(f"  {os.path.basename(script) or '(script)'}: {count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Grava as linhas rejeitadas em CSV: script, bloco, código, mensagem e valores."""
+        with self._lock, open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(RowReject._fields)
+            for reject in self.rejects:
+                writer.writerow(reject._replace(values=format_values(reject.values)))
+            if self._spool is not None:
+                self._spool.seek(0)
+                shutil.copyfileobj(self._spool, f)
+                self._spool.seek(0, os.SEEK_END)
@@ -0,0 +1,158 @@
+import csv
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+
+# Local padrão dos resultados exportados (uma subpasta por execução)
+DEFAULT_RESULTS_DIR = os.path.join(os.path.expanduser("~"), ".oracle_script_executor", "results")
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+FORMATS = (FORMAT_CSV, FORMAT_JSONL)
+
+# Linhas buscadas por ida ao banco (cursor.arraysize)
+DEFAULT_ARRAYSIZE = 1000
+
+ExportedResult = namedtuple("ExportedResult", ["script", "block", "path", "rows"])
+
+
+def _unique_names(columns):
+    """Nomes de coluna sem repetição (ID, ID_2, ...), usados como chaves em JSON Lines.
+
+    Consultas com junções costumam repetir nomes; como chaves de um objeto
+    JSON, as colunas repetidas sobrescreveriam as anteriores.
+    """
+    names = []
+    taken = set()
+    original = set(columns)
+    for column in columns:
+        name, suffix = column, 1
+        while name in taken or (name != column and name in original):
+            suffix += 1
+            name = f"{column}_{suffix}"
+        taken.add(name)
+        names.append(name)
+    return names
+
+
+def _is_lob(description):
+    """Indica se a coluna é um LOB (CLOB, NCLOB, BLOB), lido como objeto pelo driver."""
+    type_code = description[1]
+    return "LOB" in str(getattr(type_code, "name", type_code)).upper()
+
+
+def _plain(value):
+    """Conteúdo de um LOB; BLOBs são gravados em hexadecimal."""
+    if value is None:
+        return None
+    value = value.read()
+    return value.hex() if isinstance(value, bytes) else value
+
+
+class ResultExporter:
+    """Grava o resultado de cada SELECT dos scripts em um arquivo próprio.
+
+    As linhas são buscadas em lotes de arraysize (fetchmany) e gravadas à
+    medida que chegam, de modo que a memória usada não depende do tamanho
+    do resultado. prefetchrows define quantas linhas já vêm na execução da
+    consulta. Compartilhado entre as sessões.
+    """
+
+    def __init__(self, folder, result_format=FORMAT_CSV, arraysize=DEFAULT_ARRAYSIZE, prefetchrows=None):
+        self.folder = folder
+        self.format = result_format
+        self.arraysize = arraysize
+        self.prefetchrows = arraysize if prefetchrows is None else prefetchrows
+        self.results = []
+        self._names = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o exportador em uma nova pasta; retorna None se export_results estiver desativado."""
+        if not config.get("export_results", False):
+            return None
+        result_format = str(config.get("results_format", FORMAT_CSV)).lower()
+        if result_format not in FORMATS:
+            result_format = FORMAT_CSV
+        arraysize = max(1, int(config.get("arraysize", DEFAULT_ARRAYSIZE)))
+        prefetchrows = config.get("prefetchrows")
+        folder = base = os.path.join(config.get("results_dir") or DEFAULT_RESULTS_DIR, time.strftime("%Y%m%d_%H%M%S"))
+        suffix = 1
+        while os.path.exists(folder):
+            suffix += 1
+            folder = f"{base}_{suffix}"
+        return cls(folder, result_format, arraysize, None if prefetchrows is None else int(prefetchrows))
+
+    def prepare(self, cursor):
+        """Ajusta a busca de linhas do cursor antes da execução da consulta."""
+        cursor.arraysize = self.arraysize
+        cursor.prefetchrows = self.prefetchrows
+
+    def export(self, cursor, script, block):
+        """Grava as linhas da consulta executada no cursor; retorna o caminho do arquivo."""
+        columns = [description[0] for description in cursor.description]
+        lobs = [position for position, description in enumerate(cursor.description) if _is_lob(description)]
+        path = self._path(script, block)
+        rows = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if self.format == FORMAT_CSV:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+            else:
+                keys = _unique_names(columns)
+            while True:
+                batch = cursor.fetchmany(self.arraysize)
+                if not batch:
+                    break
+                if lobs:
+                    batch = [self._read_lobs(row, lobs) for row in batch]
+                if self.format == FORMAT_CSV:
+                    writer.writerows(batch)
+                else:
+                    f.writelines(
+                        json.dumps(dict(zip(keys, row)), ensure_ascii=False, default=str) + "\n"
+                        for row in batch
+                    )
+                rows += len(batch)
+        with self._lock:
+            self.results.append(ExportedResult(script or "", block, path, rows))
+        return path
+
+    def summary(self):
+        """Pasta da execução, arquivos gravados e total de linhas exportadas."""
+        with self._lock:
+            results = list(self.results)
+        return {
+            "folder": self.folder,
+            "files": len(results),
+            "rows": sum(result.rows for result in results),
+            "results": [result._asdict() for result in results],
+        }
+
+    def format_summary(self):
+        """Texto do resumo para exibição no painel de saída."""
+        summary = self.summary()
+        return (f"Resultados de {summary['files']} consulta(s) ({summary['rows']} linha(s)) "
+                f"gravados em: {summary['folder']}\n")
+
+    def _path(self, script, block):
+        """Arquivo do resultado: <script>_bloco<N>.<formato>, sem repetir nomes na execução."""
+        base = f"{os.path.splitext(os.path.basename(script or 'script'))[0]}_bloco{block}"
+        with self._lock:
+            os.makedirs(self.folder, exist_ok=True)
+            name, suffix = base, 1
+            while name in self._names:
+                suffix += 1
+                name = f"{base}_{suffix}"
+            self._names.add(name)
+        return os.path.join(self.folder, f"{name}.{self.format}")
+
+    @staticmethod
+    def _read_lobs(row, lobs):
+        row = list(row)
+        for position in lobs:
+            row[position] = _plain(row[position])
+        return row
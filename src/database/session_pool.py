@@ -0,0 +1,166 @@
+import threading
+from src.database.drivers import get_driver
+
+# Erros que indicam sessão perdida e exigem reconexão:
+# ORA-00028 (sessão encerrada), ORA-01012 (não conectado), ORA-02396 (tempo ocioso),
+# ORA-03113/03114 (fim de comunicação / sem conexão), ORA-03135 (conexão perdida)
+RECONNECT_ERROR_CODES = {28, 1012, 2396, 3113, 3114, 3135}
+
+# Chamadas interrompidas: ORA-01013 (cancelamento), DPI-1067/DPY-4024 (tempo limite da chamada)
+INTERRUPTED_ERROR_CODES = {1013}
+_CALL_TIMEOUT_ERRORS = ("DPI-1067", "DPY-4024")
+
+# Tamanho padrão do pool de sessões
+POOL_MIN_SESSIONS = 1
+POOL_MAX_SESSIONS = 4
+
+_pools = {}
+_pools_lock = threading.Lock()
+# Pools substituídos por um maior, fechados quando suas sessões voltam
+_retired_pools = []
+
+# Fábrica alternativa de pools (ex.: driver simulado dos benchmarks)
+_pool_factory = None
+
+
+def get_error_code(error):
+    """Extrai o código ORA de uma exceção do driver, se houver."""
+    if isinstance(error, get_driver().database_error) and error.args:
+        return getattr(error.args[0], "code", None)
+    return None
+
+
+def is_connection_lost(error):
+    """Indica se o erro significa que a sessão com o banco foi perdida."""
+    return get_error_code(error) in RECONNECT_ERROR_CODES
+
+
+def is_call_interrupted(error):
+    """Indica se a chamada foi cancelada ou excedeu o tempo limite (call_timeout)."""
+    if not isinstance(error, get_driver().database_error):
+        return False
+    if get_error_code(error) in INTERRUPTED_ERROR_CODES:
+        return True
+    message = str(error)
+    return any(code in message for code in _CALL_TIMEOUT_ERRORS)
+
+
+def get_pool(user, password, host, port, service, max_sessions=POOL_MAX_SESSIONS):
+    """Retorna o pool de sessões para os parâmetros informados, criando-o se necessário.
+
+    O pool permanece aberto entre validações e execuções, de modo que o
+    handshake TCP/TNS e a autenticação acontecem apenas uma vez. Quando é
+    pedido um pool maior, o novo pool passa a ser usado e o anterior só é
+    fechado depois que as sessões em uso (de outras execuções) voltam a ele.
+    """
+    key = (user, password, host, str(port), service)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.max_sessions < max_sessions:
+            dsn = get_driver().makedsn(host, port, service)
+            factory = _pool_factory or SessionPool
+            previous, pool = pool, factory(user, password, dsn, max_sessions=max_sessions)
+            _pools[key] = pool
+            if previous is not None and previous is not pool:
+                _retired_pools[:] = [retired for retired in _retired_pools if not retired.closed]
+                _retired_pools.append(previous)
+                previous.retire()
+        return pool
+
+
+def set_pool_factory(factory):
+    """Substitui a criação dos pools; None restaura o pool do driver selecionado.
+
+    factory(user, password, dsn, max_sessions=...) deve retornar um objeto
+    com a interface de SessionPool. Os pools já abertos são fechados.
+    """
+    global _pool_factory
+    close_all_pools()
+    _pool_factory = factory
+
+
+def close_all_pools():
+    """Fecha todos os pools abertos (usado ao encerrar a aplicação)."""
+    with _pools_lock:
+        for pool in list(_pools.values()) + _retired_pools:
+            pool.close()
+        _pools.clear()
+        _retired_pools.clear()
+
+
+class SessionPool:
+    """Pool de sessões Oracle compartilhado entre validação e execução."""
+
+    def __init__(self, user, password, dsn, min_sessions=POOL_MIN_SESSIONS, max_sessions=POOL_MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self.closed = False
+        driver = get_driver()
+        self._database_error = driver.database_error
+        self._pool = driver.create_pool(user, password, dsn, min_sessions, max_sessions)
+        # Sessões entregues e ainda não devolvidas; um pool aposentado fecha ao zerar
+        self._in_use = 0
+        self._retired = False
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Obtém uma sessão saudável do pool.
+
+        Sessões que não respondem ao ping (por exemplo, derrubadas pela VPN
+        enquanto ociosas) são descartadas e substituídas.
+        """
+        connection = self._pool.acquire()
+        try:
+            connection.ping()
+        except self._database_error:
+            self._discard(connection)
+            connection = self._pool.acquire()
+        with self._lock:
+            self._in_use += 1
+        return connection
+
+    def release(self, connection):
+        """Devolve a sessão ao pool, desfazendo qualquer transação pendente."""
+        try:
+            self._pool.release(connection)
+        except self._database_error:
+            self._discard(connection)
+        with self._lock:
+            self._in_use -= 1
+            idle = self._retired and self._in_use <= 0
+        if idle:
+            self.close()
+
+    def drop(self, connection):
+        """Remove do pool uma sessão que não pode mais ser usada.
+
+        Quem descarta a sessão a substitui em seguida (acquire), por isso
+        um pool aposentado só é fechado em release.
+        """
+        self._discard(connection)
+        with self._lock:
+            self._in_use -= 1
+
+    def retire(self):
+        """Fecha o pool assim que as sessões em uso forem devolvidas (ou já, se não houver)."""
+        with self._lock:
+            self._retired = True
+            idle = self._in_use <= 0
+        if idle:
+            self.close()
+
+    def close(self):
+        """Fecha o pool e todas as suas sessões."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+        try:
+            self._pool.close(force=True)
+        except self._database_error:
+            pass
+
+    def _discard(self, connection):
+        try:
+            self._pool.drop(connection)
+        except self._database_error:
+            pass
@@ -0,0 +1,425 @@
+import re
+from collections import namedtuple
+
+# Versão das regras de divisão; incremente ao alterar o resultado do lexer
+# (invalida os blocos guardados em cache)
+LEXER_VERSION = 1
+
+# Estados do lexer ao atravessar uma linha
+_NORMAL = 0
+_STRING = 1           # dentro de '...'
+_QUOTED_IDENT = 2     # dentro de "..."
+_Q_QUOTE = 3          # dentro de q'[...]'
+_BLOCK_COMMENT = 4    # dentro de /* ... */
+
+# Modos do comando em construção (define como ele termina)
+_UNDECIDED = 0        # ainda não vimos a primeira palavra-chave
+_SQL = 1              # termina em ';' ou '/' isolada
+_ANONYMOUS_PLSQL = 2  # BEGIN/DECLARE: termina no END que fecha o bloco ou em '/'
+_STORED_PLSQL = 3     # CREATE PROCEDURE/PACKAGE/...: termina apenas em '/'
+
+# Fragmentos comuns a todos os modos: strings e identificadores entre aspas
+# (completos na linha ou apenas abertos), comentários e ';'. Todas as
+# alternativas começam por um caractere fixo, o que mantém a busca rápida;
+# q-quotes são reconhecidas a partir do apóstrofo (ver _is_q_quote).
+_BASE_TOKENS = r"""'[^']*(?:''[^']*)*'|"[^"]*"|'|"|--|/\*|;"""
+
+# Em comandos SQL só interessam aspas abertas, comentários e ';': o texto
+# comum e os literais fechados na linha são saltados em uma única chamada,
+# sem voltar ao laço em Python a cada literal. Apóstrofos precedidos de
+# q/Q param o salto, para que as q-quotes sejam verificadas. O token final
+# é opcional, de modo que a busca nunca falha (e não retrocede).
+_SQL_SKIP = r"""(?:[^'"/;-]+|(?<![qQ])'[^']*(?:''[^']*)*'|"[^"]*"|-(?!-)|/(?!\*))*"""
+_SQL_RE = re.compile(_SQL_SKIP + r"""(?P<token>'|"|--|/\*|;)?""")
+_HEAD_RE = re.compile(r"(?P<token>" + _BASE_TOKENS + r"|[^\W\d][\w$#]*)")
+_PLSQL_RE = re.compile(
+    r"(?P<token>" + _BASE_TOKENS
+    + r"|(?<![\w$#])(?:BEGIN|END|CASE|IF|LOOP|FUNCTION|PROCEDURE|IS|AS)(?![\w$#]))",
+    re.IGNORECASE
+)
+
+# Comando SQL completo em uma única linha (caso mais comum, como em cargas
+# de INSERT): primeira palavra, texto saltado por _SQL_SKIP e ';'
+_SINGLE_LINE_RE = re.compile(r"\s*(?P<word>[^\W\d][\w$#]*)" + _SQL_SKIP + r"(?P<token>;)?")
+# Primeiras palavras que não bastam para classificar o comando
+_UNDECIDED_WORDS = {"BEGIN", "DECLARE", "CREATE"}
+
+# Palavras que podem aparecer entre CREATE e o tipo do objeto
+_CREATE_MODIFIERS = {
+    "OR", "REPLACE", "EDITIONABLE", "NONEDITIONABLE", "EDITIONING",
+    "AND", "COMPILE", "RESOLVE", "FORCE", "NOFORCE",
+}
+_STORED_UNITS = {"PROCEDURE", "FUNCTION", "TRIGGER", "PACKAGE", "TYPE", "LIBRARY", "JAVA"}
+
+_Q_CLOSERS = {"[": "]", "{": "}", "(": ")", "<": ">"}
+
+
+def _is_ident_char(char):
+    """Indica se o caractere pode fazer parte de um identificador Oracle."""
+    return char.isalnum() or char in "_$#"
+
+
+def _is_q_quote(line, quote_pos):
+    """Indica se o apóstrofo em quote_pos abre uma q-quote (q'...' ou nq'...')."""
+    if quote_pos == 0 or line[quote_pos - 1] not in "qQ":
+        return False
+    before = quote_pos - 2
+    if before >= 0 and line[before] in "nN":
+        before -= 1
+    return before < 0 or not _is_ident_char(line[before])
+
+
+def iter_lines(text):
+    """Percorre um texto linha a linha sem copiá-lo por inteiro."""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end + 1]
+        start = end + 1
+
+
+def split_sql_blocks(source):
+    """Divide um script SQL em blocos executáveis, sob demanda.
+
+    Aceita o script como texto ou como iterável de linhas (por exemplo,
+    um arquivo aberto) e produz os blocos à medida que são concluídos.
+    """
+    if isinstance(source, str):
+        source = iter_lines(source)
+
+    lexer = SqlLexer()
+    feed = lexer.feed
+    for line in source:
+        blocks = feed(line)
+        if blocks:
+            yield from blocks
+    yield from lexer.finish()
+
+
+class SqlLexer:
+    """Lexer incremental que separa scripts Oracle em blocos executáveis.
+
+    Percorre cada caractere uma única vez e reconhece:
+    1. Strings ('...'), q-quotes (q'[...]') e identificadores entre aspas
+    2. Comentários de linha (--) e de bloco (/* */), que são removidos
+    3. Blocos PL/SQL anônimos, acompanhando o aninhamento BEGIN/END
+    4. Unidades PL/SQL armazenadas, terminadas por '/' em uma linha isolada
+    5. Comandos SQL separados por ';' ou por '/' em uma linha isolada
+    """
+
+    def __init__(self):
+        self._parts = []
+        self._state = _NORMAL
+        self._q_closer = None
+        self._reset_statement()
+
+    def _reset_statement(self):
+        """Prepara o lexer para um novo comando."""
+        self._parts = []
+        self._mode = _UNDECIDED
+        self._head = []
+        self._pending_end = False
+
+    def _start_plsql_block(self):
+        """Inicia o acompanhamento do aninhamento de um bloco PL/SQL anônimo."""
+        self._mode = _ANONYMOUS_PLSQL
+        self._depth = 0
+        self._pending_header = False
+        self._open_subprograms = 0
+        self._body_is_subprogram = []
+        self._complete = False
+
+    def feed(self, line):
+        """Processa uma linha e retorna a lista de blocos concluídos nela."""
+        if line.endswith("\n"):
+            line = line[:-1]
+        if line.endswith("\r"):
+            line = line[:-1]
+
+        blocks = []
+
+        # '/' isolada fora de strings e comentários encerra o bloco atual
+        if self._state == _NORMAL and "/" in line and line.strip() == "/":
+            self._emit(blocks)
+            return blocks
+
+        if self._mode == _UNDECIDED and self._state == _NORMAL and not self._parts:
+            # Comando inteiro na linha, sem nada após o ';': emitido sem o laço abaixo
+            match = _SINGLE_LINE_RE.match(line)
+            if (match is not None and match.group("token") is not None
+                    and (match.end() == len(line) or line[match.end():].isspace())
+                    and match.group("word").upper() not in _UNDECIDED_WORDS):
+                blocks.append(line[:match.start("token")].strip())
+                return blocks
+
+        pos = 0
+        seg_start = 0
+        length = len(line)
+
+        while pos < length:
+            state = self._state
+
+            if state != _NORMAL:
+                if state == _STRING or state == _QUOTED_IDENT:
+                    quote = "'" if state == _STRING else '"'
+                    idx = line.find(quote, pos)
+                    if idx == -1:
+                        pos = length
+                    elif line.startswith(quote, idx + 1):
+                        pos = idx + 2
+                    else:
+                        pos = idx + 1
+                        self._state = _NORMAL
+                    continue
+
+                if state == _Q_QUOTE:
+                    idx = line.find(self._q_closer + "'", pos)
+                    if idx == -1:
+                        pos = length
+                    else:
+                        pos = idx + 2
+                        self._state = _NORMAL
+                    continue
+
+                if state == _BLOCK_COMMENT:
+                    idx = line.find("*/", pos)
+                    if idx == -1:
+                        pos = seg_start = length
+                    else:
+                        pos = seg_start = idx + 2
+                        self._state = _NORMAL
+                    continue
+
+            mode = self._mode
+            if mode == _SQL or mode == _STORED_PLSQL:
+                match = _SQL_RE.match(line, pos)
+            elif mode == _UNDECIDED:
+                match = _HEAD_RE.search(line, pos)
+            else:
+                match = _PLSQL_RE.search(line, pos)
+
+            token = match.group("token") if match is not None else None
+            if token is None:
+                break
+            start = match.start("token")
+            pos = match.end()
+
+            if token == "--":
+                self._append(line[seg_start:start])
+                seg_start = pos = length
+                break
+
+            if token == "/*":
+                self._append(line[seg_start:start] + " ")
+                seg_start = pos
+                self._state = _BLOCK_COMMENT
+                continue
+
+            first = token[0]
+
+            if self._pending_end:
+                next_word = token.upper() if first.isalpha() else ""
+                self._resolve_end(next_word)
+                if next_word in ("IF", "LOOP", "CASE"):
+                    continue
+
+            if first == ";":
+                if self._mode == _STORED_PLSQL:
+                    continue
+                if self._mode == _ANONYMOUS_PLSQL:
+                    # Declaração antecipada de subprograma (sem corpo)
+                    self._pending_header = False
+                    if self._complete:
+                        self._emit(blocks, line[seg_start:pos])
+                        seg_start = pos
+                    continue
+                self._emit(blocks, line[seg_start:start])
+                seg_start = pos
+                continue
+
+            if first == "'":
+                if _is_q_quote(line, start) and start + 1 < length:
+                    # O caractere seguinte ao apóstrofo define o delimitador
+                    delimiter = line[start + 1]
+                    self._q_closer = _Q_CLOSERS.get(delimiter, delimiter)
+                    self._state = _Q_QUOTE
+                    pos = start + 2
+                elif len(token) == 1:
+                    self._state = _STRING
+                # Literal fechado na própria linha não muda o estado
+                continue
+
+            if first == '"':
+                if len(token) == 1:
+                    self._state = _QUOTED_IDENT
+                continue
+
+            # Palavra-chave ou identificador
+            if self._mode == _UNDECIDED:
+                self._classify(token.upper())
+                if self._mode != _ANONYMOUS_PLSQL:
+                    continue
+            self._plsql_word(token.upper())
+
+        # Literais de várias linhas também preservam a quebra de linha
+        if self._state != _BLOCK_COMMENT and (self._parts or seg_start < length):
+            self._append(line[seg_start:] + "\n")
+
+        return blocks
+
+    def finish(self):
+        """Retorna o bloco pendente ao final do script, se houver."""
+        blocks = []
+        self._emit(blocks)
+        self._state = _NORMAL
+        return blocks
+
+    def _append(self, text):
+        """Acrescenta um trecho ao comando em construção."""
+        if self._parts or (text and not text.isspace()):
+            self._parts.append(text)
+
+    def _emit(self, blocks, tail=""):
+        """Finaliza o comando atual (com o trecho final tail) e o adiciona aos blocos, se não for vazio."""
+        parts = self._parts
+        if parts:
+            parts.append(tail)
+            block = "".join(parts).strip()
+        else:
+            # Comando contido em uma única linha
+            block = tail.strip()
+        if block:
+            blocks.append(block)
+        self._reset_statement()
+
+    def _classify(self, word):
+        """Decide o tipo do comando a partir das primeiras palavras."""
+        head = self._head
+        head.append(word)
+        first = head[0]
+
+        if first in ("BEGIN", "DECLARE"):
+            self._start_plsql_block()
+        elif first == "CREATE":
+            if len(head) == 1 or word in _CREATE_MODIFIERS:
+                return
+            self._mode = _STORED_PLSQL if word in _STORED_UNITS else _SQL
+        else:
+            self._mode = _SQL
+
+    def _plsql_word(self, word):
+        """Acompanha o aninhamento de um bloco PL/SQL anônimo."""
+        if word == "BEGIN":
+            if self._depth == 0:
+                # Corpo de subprograma declarado ou corpo principal do bloco
+                self._body_is_subprogram.append(self._open_subprograms > 0)
+            self._depth += 1
+        elif word == "CASE":
+            self._depth += 1
+        elif word == "END":
+            self._pending_end = True
+        elif self._depth == 0:
+            if word in ("FUNCTION", "PROCEDURE"):
+                self._pending_header = True
+            elif word in ("IS", "AS") and self._pending_header:
+                self._pending_header = False
+                self._open_subprograms += 1
+
+    def _resolve_end(self, next_word):
+        """Fecha o nível aberto pelo END anterior, conforme a palavra seguinte."""
+        self._pending_end = False
+        if next_word in ("IF", "LOOP"):
+            return
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0 and next_word != "CASE" and self._body_is_subprogram:
+            if self._body_is_subprogram.pop():
+                self._open_subprograms -= 1
+            else:
+                self._complete = True
+
+
+# Tipos de comando reconhecidos por classify_statement
+STATEMENT_SELECT = "SELECT"
+STATEMENT_DML = "DML"
+STATEMENT_DDL = "DDL"
+STATEMENT_PLSQL = "PLSQL"
+STATEMENT_TCL = "TCL"
+STATEMENT_OTHER = "OTHER"
+
+_LEADING_WORDS_RE = re.compile(r"[\s(]*([^\W\d][\w$#]*)(?:\s+([^\W\d][\w$#]*))?")
+
+_STATEMENT_TYPES = {
+    "SELECT": STATEMENT_SELECT,
+    "WITH": STATEMENT_SELECT,
+    "INSERT": STATEMENT_DML,
+    "UPDATE": STATEMENT_DML,
+    "DELETE": STATEMENT_DML,
+    "MERGE": STATEMENT_DML,
+    "BEGIN": STATEMENT_PLSQL,
+    "DECLARE": STATEMENT_PLSQL,
+    "CALL": STATEMENT_PLSQL,
+    "COMMIT": STATEMENT_TCL,
+    "ROLLBACK": STATEMENT_TCL,
+    "CREATE": STATEMENT_DDL,
+    "ALTER": STATEMENT_DDL,
+    "DROP": STATEMENT_DDL,
+    "TRUNCATE": STATEMENT_DDL,
+    "RENAME": STATEMENT_DDL,
+    "GRANT": STATEMENT_DDL,
+    "REVOKE": STATEMENT_DDL,
+    "COMMENT": STATEMENT_DDL,
+    "ANALYZE": STATEMENT_DDL,
+    "AUDIT": STATEMENT_DDL,
+    "NOAUDIT": STATEMENT_DDL,
+    "PURGE": STATEMENT_DDL,
+    "FLASHBACK": STATEMENT_DDL,
+    "ASSOCIATE": STATEMENT_DDL,
+    "DISASSOCIATE": STATEMENT_DDL,
+}
+
+# Bloco PL/SQL cujo último comando é um COMMIT
+_SELF_COMMIT_RE = re.compile(r"\bCOMMIT(?:\s+WORK)?\s*;\s*END(?:\s+[\w$#]+)?\s*;?\s*$", re.IGNORECASE)
+
+
+def classify_statement(block):
+    """Classifica um bloco como SELECT, DML, DDL, PLSQL, TCL ou OTHER.
+
+    ALTER SESSION/SYSTEM e ROLLBACK TO SAVEPOINT não encerram a transação
+    e por isso são classificados como OTHER.
+    """
+    match = _LEADING_WORDS_RE.match(block)
+    if match is None:
+        return STATEMENT_OTHER
+    first = match.group(1).upper()
+    second = (match.group(2) or "").upper()
+
+    if first == "ALTER" and second in ("SESSION", "SYSTEM"):
+        return STATEMENT_OTHER
+    if first == "ROLLBACK" and second == "TO":
+        return STATEMENT_OTHER
+    return _STATEMENT_TYPES.get(first, STATEMENT_OTHER)
+
+
+def commits_itself(block):
+    """Indica se um bloco PL/SQL termina com COMMIT, dispensando novo commit."""
+    return _SELF_COMMIT_RE.search(block) is not None
+
+
+# Bloco já classificado, pronto para execução
+ParsedBlock = namedtuple("ParsedBlock", ["text", "statement_type", "commits_itself"])
+
+
+def parse_block(block):
+    """Classifica um bloco, guardando o tipo e se ele confirma a própria transação."""
+    statement_type = classify_statement(block)
+    return ParsedBlock(
+        block,
+        statement_type,
+        statement_type == STATEMENT_PLSQL and commits_itself(block)
+    )
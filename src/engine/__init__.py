@@ -0,0 +1 @@
+# Pacote do motor de execução de scripts
@@ -0,0 +1,156 @@
+import os
+import re
+import json
+
+# Manifesto opcional, na pasta dos scripts, com dependências entre arquivos
+MANIFEST_FILE = "scripts.manifest.json"
+
+# Ordem padrão para scripts sem diretivas
+ORDEM_SEQUENCIAL = "sequential"   # depende de todos os scripts anteriores da lista
+ORDEM_PARALELA = "parallel"       # independente, salvo dependências declaradas
+
+# Diretivas aceitas no cabeçalho do script:
+#   -- @depends: 01_tabelas.sql, 02_views.sql
+#   -- @independent
+_DIRECTIVE_RE = re.compile(r"--\s*@(depends|independent)\b\s*:?\s*(.*)$", re.IGNORECASE)
+
+# Quantidade máxima de linhas de cabeçalho examinadas em cada script
+_MAX_HEADER_LINES = 50
+
+
+def read_header_directives(file_path, encoding="utf-8-sig"):
+    """Lê as diretivas de dependência dos comentários no início do script.
+
+    Retorna None quando não há diretivas, ou uma lista (possivelmente vazia,
+    para @independent) com os nomes dos scripts dos quais este depende.
+    """
+    depends = None
+    with open(file_path, encoding=encoding, errors="replace") as f:
+        for line_number, line in enumerate(f):
+            line = line.strip()
+            if line_number >= _MAX_HEADER_LINES or (line and not line.startswith("--")):
+                break
+            match = _DIRECTIVE_RE.match(line)
+            if match is None:
+                continue
+            depends = depends or []
+            if match.group(1).lower() == "depends":
+                depends.extend(name.strip() for name in match.group(2).split(",") if name.strip())
+    return depends
+
+
+def load_manifest(folder):
+    """Carrega o manifesto de dependências da pasta, se existir."""
+    if not folder:
+        return {}
+    manifest_path = os.path.join(folder, MANIFEST_FILE)
+    if not os.path.isfile(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, encoding="utf-8-sig") as f:
+            return json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Manifesto de dependências inválido ({manifest_path}): {e}")
+
+
+class DependencyGraph:
+    """Grafo acíclico de dependências entre scripts, na ordem da lista."""
+
+    def __init__(self, scripts):
+        self.nodes = list(scripts)
+        self.index = {script: i for i, script in enumerate(self.nodes)}
+        self.dependencies = {script: set() for script in self.nodes}
+        self.dependents = {script: [] for script in self.nodes}
+
+    def add_dependency(self, script, dependency):
+        """Registra que `script` só pode começar após `dependency` terminar."""
+        if dependency == script or dependency in self.dependencies[script]:
+            return
+        self.dependencies[script].add(dependency)
+        self.dependents[dependency].append(script)
+
+    def check_acyclic(self):
+        """Verifica se o grafo não tem ciclos (algoritmo de Kahn)."""
+        remaining = {script: len(deps) for script, deps in self.dependencies.items()}
+        ready = [script for script, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            script = ready.pop()
+            visited += 1
+            for dependent in self.dependents[script]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if visited != len(self.nodes):
+            cycle = [os.path.basename(s) for s, count in remaining.items() if count > 0]
+            raise ValueError("Dependências circulares entre os scripts: " + ", ".join(cycle))
+
+
+def _resolve(name, scripts, by_name):
+    """Localiza na lista o script referenciado por nome ou caminho relativo."""
+    normalized = os.path.normcase(os.path.normpath(name))
+    if normalized in by_name:
+        return by_name[normalized]
+    suffix = os.sep + normalized
+    for script in scripts:
+        if os.path.normcase(os.path.normpath(script)).endswith(suffix):
+            return script
+    return None
+
+
+def build_sequential_graph(scripts):
+    """Monta um grafo em que cada script depende do anterior (ordem da lista)."""
+    graph = DependencyGraph(scripts)
+    for previous, script in zip(graph.nodes, graph.nodes[1:]):
+        graph.add_dependency(script, previous)
+    return graph
+
+
+def build_dependency_graph(scripts, folder=None):
+    """Monta o grafo de dependências a partir da ordem da lista e das anotações.
+
+    Scripts sem anotação seguem a ordem padrão do manifesto ("sequential",
+    se omitida): no modo sequencial cada script depende do anterior e dos
+    independentes que o antecedem, preservando a ordem da lista. Dependências
+    para scripts fora da lista são consideradas já satisfeitas.
+    """
+    manifest = load_manifest(folder)
+    default_order = manifest.get("default", ORDEM_SEQUENCIAL)
+    manifest_depends = {
+        os.path.normcase(name): deps for name, deps in manifest.get("depends", {}).items()
+    }
+    manifest_independent = {os.path.normcase(name) for name in manifest.get("independent", [])}
+
+    graph = DependencyGraph(scripts)
+    by_name = {}
+    for script in scripts:
+        by_name.setdefault(os.path.normcase(os.path.basename(script)), script)
+        by_name.setdefault(os.path.normcase(os.path.normpath(script)), script)
+
+    previous = None
+    independents_since_previous = []
+    for script in scripts:
+        key = os.path.normcase(os.path.basename(script))
+        depends = read_header_directives(script)
+        if depends is None and key in manifest_depends:
+            depends = list(manifest_depends[key])
+        if depends is None and key in manifest_independent:
+            depends = []
+
+        if depends is None:
+            if default_order == ORDEM_SEQUENCIAL:
+                # Barreira: aguarda o anterior e os independentes desde então
+                for dependency in ([previous] if previous else []) + independents_since_previous:
+                    graph.add_dependency(script, dependency)
+                previous = script
+                independents_since_previous = []
+            continue
+
+        for name in depends:
+            dependency = _resolve(name, scripts, by_name)
+            if dependency is not None:
+                graph.add_dependency(script, dependency)
+        independents_since_previous.append(script)
+
+    graph.check_acyclic()
+    return graph
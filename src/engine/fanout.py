@@ -0,0 +1,346 @@
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from src.database.block_cache import BlockCache
+from src.database.result_export import DEFAULT_RESULTS_DIR
+from src.engine.script_runner import ScriptRunner, prepare_script, DEFAULT_PREFETCH_MAX_MB
+
+# Destinos executados ao mesmo tempo
+DEFAULT_TARGET_WORKERS = 8
+
+# Campos de conexão que cada destino precisa ter (próprios ou herdados da configuração)
+TARGET_FIELDS = ("user", "password", "host", "port", "service")
+
+# Estados de um destino
+TARGET_PENDING = "pendente"
+TARGET_RUNNING = "executando"
+TARGET_OK = "concluído"
+TARGET_ERRORS = "com erros"
+TARGET_FAILED = "falhou"
+TARGET_CANCELLED = "cancelado"
+
+_UNSAFE_NAME_RE = re.compile(r"[^\w.-]+")
+
+
+def load_targets(path, config):
+    """Lê a lista de destinos de um arquivo JSON (lista ou {"targets": [...]}).
+
+    Cada destino herda da configuração os campos que não informar; a senha
+    pode vir de uma variável de ambiente (password_env). Levanta ValueError
+    se o arquivo for inválido ou se faltar algum campo de conexão.
+    """
+    try:
+        with open(path, encoding="utf-8-sig") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Arquivo de destinos inválido: {e}") from None
+    if isinstance(data, dict):
+        data = data.get("targets")
+    if not isinstance(data, list) or not data:
+        raise ValueError("O arquivo de destinos deve conter uma lista de destinos em 'targets'.")
+
+    targets = []
+    names = set()
+    for position, entry in enumerate(data, 1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Destino {position} inválido: informe um objeto JSON.")
+        target = {key: value for key, value in config.items() if key not in ("targets", "targets_file")}
+        target.update(entry)
+        if entry.get("password_env"):
+            target["password"] = os.environ.get(entry["password_env"], "")
+        missing = [field for field in TARGET_FIELDS if not target.get(field)]
+        name = str(entry.get("name") or f"{target.get('user')}@{target.get('host')}/{target.get('service')}")
+        if missing:
+            raise ValueError(f"Destino '{name}': campos obrigatórios ausentes: {', '.join(missing)}.")
+        if name in names:
+            raise ValueError(f"Destino '{name}' repetido.")
+        names.add(name)
+        target["name"] = name
+        targets.append(target)
+    return targets
+
+
+class SharedScripts:
+    """Scripts lidos e divididos uma única vez para todos os destinos.
+
+    O primeiro destino que pede um script o prepara; os demais aguardam e
+    recebem os mesmos blocos. Cada script é liberado assim que todos os
+    destinos o receberam (ou terminaram sem ele), de modo que a memória
+    acompanha a distância entre o destino mais rápido e o mais lento, e
+    não o tamanho da lista inteira. Scripts maiores que prefetch_max_mb e
+    arquivos CSV/TSV são lidos por cada destino, sob demanda.
+    """
+
+    def __init__(self, config, scripts, target_count):
+        self.block_cache = BlockCache.from_config(config)
+        self._max_bytes = int(config.get("prefetch_max_mb", DEFAULT_PREFETCH_MAX_MB)) * 1024 * 1024
+        # Destinos que ainda vão pedir cada script
+        self._entries = {
+            file_path: {"lock": threading.Lock(), "ready": False, "value": None, "pending": target_count}
+            for file_path in scripts
+        }
+        self._lock = threading.Lock()
+
+    def for_target(self):
+        """Fonte de scripts de um destino (ScriptRunner prepared); chame close() ao final dele."""
+        return _TargetScripts(self)
+
+    def get(self, file_path):
+        """Retorna (hash, blocos) do script, ou None se ele deve ser lido sob demanda."""
+        with self._lock:
+            entry = self._entries.get(file_path)
+        if entry is None:
+            # Já liberado (script repetido na lista): lido de novo
+            return self._prepare(file_path)
+        with entry["lock"]:
+            if not entry["ready"]:
+                entry["value"] = self._prepare(file_path)
+                entry["ready"] = True
+            value = entry["value"]
+        self.release(file_path)
+        return value
+
+    def _prepare(self, file_path):
+        return prepare_script(file_path, self.block_cache, self._max_bytes)
+
+    def release(self, file_path):
+        """Registra que um destino não vai mais pedir o script; o último o libera da memória."""
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is None:
+                return
+            entry["pending"] -= 1
+            if entry["pending"] <= 0:
+                del self._entries[file_path]
+
+
+class _TargetScripts:
+    """Scripts pedidos por um destino; ao final, libera os que ele não chegou a executar."""
+
+    def __init__(self, shared):
+        self.shared = shared
+        self.taken = set()
+
+    def __call__(self, file_path):
+        if file_path in self.taken:
+            return self.shared._prepare(file_path)
+        self.taken.add(file_path)
+        return self.shared.get(file_path)
+
+    def close(self, scripts):
+        for file_path in set(scripts) - self.taken:
+            self.shared.release(file_path)
+
+
+class TargetProgress:
+    """Progresso de um destino: estado, scripts concluídos e com erro, duração."""
+
+    def __init__(self, name):
+        self.name = name
+        self.state = TARGET_PENDING
+        self.total = 0
+        self.done = 0
+        self.errors = 0
+        self.error = None
+        self.started = None
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.monotonic()) - self.started
+
+    def as_dict(self):
+        return {
+            "target": self.name, "state": self.state, "total": self.total, "done": self.done,
+            "errors": self.errors, "seconds": round(self.elapsed, 3), "error": self.error,
+        }
+
+
+class _TargetListener:
+    """Repassa os eventos do ScriptRunner de um destino ao observador da distribuição."""
+
+    def __init__(self, fanout, progress):
+        self.fanout = fanout
+        self.listener = fanout.listener
+        self.progress = progress
+        # O destino pode executar scripts em várias sessões
+        self._lock = threading.Lock()
+
+    def on_run_start(self, total):
+        self.progress.total = total
+
+    def on_script_success(self, file_path):
+        with self._lock:
+            self.progress.done += 1
+        self.listener.on_target_script_success(self.progress.name, file_path)
+
+    def on_script_resumed(self, file_path, start_block):
+        if start_block is None:
+            with self._lock:
+                self.progress.done += 1
+
+    def on_script_error(self, file_path, error, general=False):
+        with self._lock:
+            self.progress.done += 1
+            self.progress.errors += 1
+        self.listener.on_target_script_error(self.progress.name, file_path, error)
+
+    def ask_error_action(self, file_path, error):
+        # Uma decisão por vez, mesmo com vários destinos em paralelo
+        with self.fanout._decision_lock:
+            return self.listener.ask_target_error_action(self.progress.name, file_path, error)
+
+    def on_load_progress(self, file_path, rows, rows_per_second):
+        pass
+
+    def on_connection_error(self, error):
+        self.on_run_error(error)
+
+    def on_run_error(self, error):
+        self.progress.error = error
+        self.listener.on_target_error(self.progress.name, error)
+
+    def on_run_finish(self, success_count, error_count):
+        pass
+
+
+class FanOutRunner:
+    """Executa a mesma lista de scripts em vários destinos ao mesmo tempo.
+
+    Cada destino tem seu próprio ScriptRunner (sessões, diário, política de
+    commit); os scripts são divididos uma única vez (SharedScripts) e até
+    target_workers destinos executam em paralelo, de modo que a duração
+    total se aproxima da do destino mais lento. O observador implementa:
+    on_fanout_start(targets, script_count),
+    on_target_script_success(target, file_path),
+    on_target_script_error(target, file_path, error),
+    ask_target_error_action(target, file_path, error),
+    on_target_error(target, error), on_target_finish(target, progress) e
+    on_fanout_finish(summary), chamados a partir das threads de execução.
+    """
+
+    def __init__(self, config, targets, listener):
+        self.config = config
+        self.targets = targets
+        self.listener = listener
+        self.progress = {target["name"]: TargetProgress(target["name"]) for target in targets}
+        self.started = None
+        self.finished = None
+        self._runners = {}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._decision_lock = threading.Lock()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def cancel(self):
+        """Cancela os destinos em execução; os pendentes não são iniciados."""
+        self._stop.set()
+        with self._lock:
+            runners = list(self._runners.values())
+        for runner in runners:
+            runner.cancel()
+
+    def run(self, scripts):
+        """Executa os scripts em todos os destinos e retorna o resumo."""
+        workers = max(1, int(self.config.get("target_workers", DEFAULT_TARGET_WORKERS)))
+        shared = SharedScripts(self.config, scripts, len(self.targets))
+        self.started = time.monotonic()
+        self.listener.on_fanout_start([target["name"] for target in self.targets], len(scripts))
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(self.targets)),
+                                    thread_name_prefix="target") as pool:
+                futures = [pool.submit(self._run_target, target, scripts, shared) for target in self.targets]
+                try:
+                    wait(futures)
+                except BaseException:
+                    # Execução abortada (ex.: Ctrl+C no modo em lote): o pool aguarda os destinos cancelados
+                    self.cancel()
+                    raise
+        finally:
+            self.finished = time.monotonic()
+        summary = self.summary()
+        self.listener.on_fanout_finish(summary)
+        return summary
+
+    def _run_target(self, target, scripts, shared):
+        progress = self.progress[target["name"]]
+        source = shared.for_target()
+        if self.stopped:
+            source.close(scripts)
+            progress.state = TARGET_CANCELLED
+            self.listener.on_target_finish(progress.name, progress)
+            return
+        progress.state = TARGET_RUNNING
+        progress.started = time.monotonic()
+        try:
+            runner = ScriptRunner(self._target_config(target), _TargetListener(self, progress), source)
+            with self._lock:
+                self._runners[progress.name] = runner
+            runner.run(scripts)
+        except Exception as e:
+            progress.error = str(e)
+            self.listener.on_target_error(progress.name, progress.error)
+        finally:
+            source.close(scripts)
+            with self._lock:
+                self._runners.pop(progress.name, None)
+            progress.finished = time.monotonic()
+            if self.stopped and progress.done < progress.total:
+                progress.state = TARGET_CANCELLED
+            elif progress.error is not None and not progress.done:
+                progress.state = TARGET_FAILED
+            elif progress.errors or progress.error is not None:
+                progress.state = TARGET_ERRORS
+            else:
+                progress.state = TARGET_OK
+            self.listener.on_target_finish(progress.name, progress)
+
+    def _target_config(self, target):
+        """Configuração do destino; resultados exportados ficam em uma subpasta com o nome dele."""
+        config = dict(target)
+        if config.get("export_results"):
+            folder = _UNSAFE_NAME_RE.sub("_", target["name"])
+            config["results_dir"] = os.path.join(self.config.get("results_dir") or DEFAULT_RESULTS_DIR, folder)
+        return config
+
+    def summary(self):
+        """Resumo agregado: destinos por estado, scripts, duração total e do destino mais lento."""
+        progress = [self.progress[target["name"]] for target in self.targets]
+        by_state = {}
+        for item in progress:
+            by_state[item.state] = by_state.get(item.state, 0) + 1
+        slowest = max(progress, key=lambda item: item.elapsed)
+        wall = (self.finished or time.monotonic()) - self.started if self.started is not None else 0.0
+        return {
+            "targets": len(progress),
+            "by_state": by_state,
+            "scripts_ok": sum(item.done - item.errors for item in progress),
+            "script_errors": sum(item.errors for item in progress),
+            "wall_seconds": round(wall, 3),
+            "sum_seconds": round(sum(item.elapsed for item in progress), 3),
+            "slowest": {"target": slowest.name, "seconds": round(slowest.elapsed, 3)},
+            "by_target": [item.as_dict() for item in progress],
+        }
+
+    def format_summary(self):
+        """Texto do resumo para exibição no painel de saída."""
+        summary = self.summary()
+        states = ", ".join(f"{state}: {count}" for state, count in summary["by_state"].items())
+        lines = [
+            f"Destinos: {summary['targets']} ({states})",
+            f"Scripts: {summary['scripts_ok']} com sucesso, {summary['script_errors']} com erro",
+            f"Duração: {summary['wall_seconds']:.1f} s (soma dos destinos {summary['sum_seconds']:.1f} s; "
+            f"mais lento: {summary['slowest']['target']}, {summary['slowest']['seconds']:.1f} s)",
+        ]
+        for item in summary["by_target"]:
+            if item["state"] != TARGET_OK:
+                lines.append(f"  {item['target']}: {item['state']} ({item['errors']} erro(s))")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,165 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from src.database.block_cache import content_digest
+
+# Local padrão dos diários de execução
+DEFAULT_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".oracle_script_executor", "journal")
+
+# Os registros são gravados em disco (fsync) a cada N registros ou T segundos
+FSYNC_EVERY_RECORDS = 200
+FSYNC_INTERVAL_SECONDS = 0.5
+
+# Trechos do início e do fim lidos para identificar arquivos grandes
+FINGERPRINT_SAMPLE_BYTES = 1024 * 1024
+
+
+def script_fingerprint(file_path, max_bytes):
+    """Identifica o conteúdo de um script para a retomada.
+
+    Até max_bytes é o hash de todo o conteúdo. Acima disso são usados o
+    tamanho, a data de modificação e o hash do início e do fim do arquivo,
+    sem ler o arquivo inteiro antes da execução; uma alteração não detectada
+    exigiria manter tamanho e data de modificação.
+    """
+    stat = os.stat(file_path)
+    if stat.st_size <= max_bytes:
+        return content_digest(file_path)
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+        f.seek(max(FINGERPRINT_SAMPLE_BYTES, stat.st_size - FINGERPRINT_SAMPLE_BYTES))
+        digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+    return f"{stat.st_size}-{stat.st_mtime_ns}-{digest.hexdigest()}"
+
+
+class ScriptProgress:
+    """Progresso de um script segundo o diário da execução anterior."""
+
+    def __init__(self, digest):
+        self.digest = digest
+        # Último bloco cujas alterações foram confirmadas (0 = nenhum)
+        self.durable_block = 0
+        self.done = False
+
+
+class ExecutionJournal:
+    """Diário local, somente de acréscimo, do progresso da execução.
+
+    Cada linha JSON registra o início de um script (com o hash do conteúdo),
+    o resultado e a duração de cada bloco, os pontos de confirmação (todos
+    os blocos até N confirmados no banco) e a conclusão dos scripts. Os
+    registros são gravados em lote; se a aplicação cair, o diário permite
+    retomar a execução a partir do primeiro bloco não confirmado. Pontos de
+    confirmação são entregues ao sistema operacional imediatamente (sobrevivem
+    ao fechamento da aplicação); em uma queda do próprio sistema, blocos
+    confirmados no último intervalo de fsync podem ser repetidos.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        """Cria o diário do destino configurado; retorna None se estiver desativado."""
+        if not config.get("journal", True):
+            return None
+        target = f"{config.get('user')}@{config.get('host')}:{config.get('port')}/{config.get('service')}"
+        name = hashlib.sha1(target.lower().encode()).hexdigest()[:16] + ".journal"
+        return cls(os.path.join(config.get("journal_dir") or DEFAULT_JOURNAL_DIR, name))
+
+    def _read_records(self):
+        """Lê os registros do diário, ignorando uma última linha incompleta."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except OSError:
+            return
+
+    def can_resume(self):
+        """Indica se a última execução registrada foi interrompida."""
+        last_run = None
+        for record in self._read_records():
+            if record["ev"] in ("run_start", "run_finish"):
+                last_run = record
+        return last_run is not None and not (
+            last_run["ev"] == "run_finish" and last_run["completed"]
+        )
+
+    def load_progress(self):
+        """Retorna {caminho do script: ScriptProgress} a partir do diário."""
+        progress = {}
+        for record in self._read_records():
+            event = record["ev"]
+            if event == "script_start":
+                state = progress.get(record["script"])
+                if state is None or state.digest != record["hash"]:
+                    progress[record["script"]] = ScriptProgress(record["hash"])
+            elif event == "durable":
+                state = progress.get(record["script"])
+                if state is not None:
+                    state.durable_block = max(state.durable_block, record["block"])
+            elif event == "script_done":
+                state = progress.get(record["script"])
+                if state is not None:
+                    state.done = True
+        return progress
+
+    def open(self, resume=False):
+        """Inicia o registro de uma execução; ao retomar, acrescenta ao diário existente."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        self._write({"ev": "run_start", "resume": resume}, sync=True)
+
+    def script_started(self, script, digest):
+        self._write({"ev": "script_start", "script": script, "hash": digest})
+
+    def block(self, script, index, ok, elapsed):
+        self._write({
+            "ev": "block", "script": script, "block": index,
+            "status": "ok" if ok else "error", "ms": round(elapsed * 1000, 3)
+        })
+
+    def durable(self, script, index):
+        self._write({"ev": "durable", "script": script, "block": index}, flush=True)
+
+    def script_done(self, script):
+        self._write({"ev": "script_done", "script": script}, flush=True)
+
+    def close(self, completed):
+        """Registra o fim da execução e fecha o diário."""
+        if self._file is None:
+            return
+        self._write({"ev": "run_finish", "completed": completed}, sync=True)
+        with self._lock:
+            self._file.close()
+            self._file = None
+
+    def _write(self, record, flush=False, sync=False):
+        """Acrescenta um registro e grava em disco quando o lote está completo."""
+        record["ts"] = round(time.time(), 3)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._unsynced += 1
+            now = time.monotonic()
+            if (sync or self._unsynced >= FSYNC_EVERY_RECORDS
+                    or now - self._last_sync >= FSYNC_INTERVAL_SECONDS):
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+                self._last_sync = now
+            elif flush:
+                self._file.flush()
@@ -0,0 +1,71 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Quantidade padrão de scripts preparados antecipadamente
+DEFAULT_PREFETCH_DEPTH = 2
+PREFETCH_WORKERS = 2
+
+
+class ScriptPrefetcher:
+    """Prepara os próximos scripts em segundo plano enquanto o atual executa.
+
+    load(file_path) lê, decodifica e divide um script; o resultado é
+    guardado até que take() o solicite. No máximo depth scripts ficam
+    preparados (ou em preparação) ao mesmo tempo: um novo só é lido quando
+    outro é consumido, o que limita a memória usada.
+    """
+
+    def __init__(self, scripts, load, depth=DEFAULT_PREFETCH_DEPTH, workers=PREFETCH_WORKERS):
+        self._load = load
+        self._depth = depth
+        self._upcoming = deque(scripts)
+        self._futures = {}
+        self._taken = set()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, min(workers, depth)),
+                                            thread_name_prefix="prefetch")
+        with self._lock:
+            self._refill()
+
+    @classmethod
+    def from_config(cls, config, scripts, load):
+        """Cria o prefetcher conforme prefetch_scripts; retorna None se desativado."""
+        depth = int(config.get("prefetch_scripts", DEFAULT_PREFETCH_DEPTH))
+        if depth <= 0 or len(scripts) < 2:
+            return None
+        return cls(scripts, load, depth)
+
+    def take(self, file_path):
+        """Retorna o script preparado (aguardando, se ainda estiver em leitura).
+
+        Scripts que não foram antecipados são carregados na hora. Exceções
+        da leitura são propagadas para quem solicitou o script.
+        """
+        with self._lock:
+            future = self._futures.pop(file_path, None)
+            if future is None:
+                self._taken.add(file_path)
+            self._refill()
+        if future is None:
+            return self._load(file_path)
+        return future.result()
+
+    def close(self):
+        """Descarta os scripts ainda não consumidos."""
+        with self._lock:
+            self._closed = True
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+            self._upcoming.clear()
+        self._executor.shutdown(wait=False)
+
+    def _refill(self):
+        """Inicia a leitura dos próximos scripts até completar depth (com o lock adquirido)."""
+        while not self._closed and self._upcoming and len(self._futures) < self._depth:
+            file_path = self._upcoming.popleft()
+            if file_path in self._taken:
+                continue
+            self._futures[file_path] = self._executor.submit(self._load, file_path)
@@ -0,0 +1,42 @@
+import heapq
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def run_graph(graph, execute, workers=1, should_stop=None, on_abort=None):
+    """Executa os scripts do grafo em até `workers` threads, respeitando dependências.
+
+    Entre os scripts prontos, a ordem original da lista tem prioridade; com
+    um único worker a execução é idêntica à sequencial. Quando should_stop()
+    retorna True, nenhum novo script é iniciado e os que estão em andamento
+    terminam normalmente. Se a espera for interrompida (ex.: Ctrl+C),
+    on_abort() é chamado antes de aguardar os scripts em andamento.
+    """
+    should_stop = should_stop or (lambda: False)
+    remaining = {script: len(deps) for script, deps in graph.dependencies.items()}
+    ready = [graph.index[script] for script, count in remaining.items() if count == 0]
+    heapq.heapify(ready)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="script") as pool:
+        running = {}
+        try:
+            while ready or running:
+                while ready and len(running) < workers and not should_stop():
+                    script = graph.nodes[heapq.heappop(ready)]
+                    running[pool.submit(execute, script)] = script
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    script = running.pop(future)
+                    future.result()
+                    for dependent in graph.dependents[script]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            heapq.heappush(ready, graph.index[dependent])
+        except BaseException:
+            # Interrompe os comandos em andamento; o pool aguarda as threads ao sair
+            if on_abort is not None:
+                on_abort()
+            raise
@@ -0,0 +1,313 @@
+import os
+import queue
+import threading
+from contextlib import closing
+from src.database.block_cache import BlockCache, content_digest
+from src.database.oracle_connector import OracleConnector
+from src.database.commit_policy import CommitPolicy, COMMIT_EXECUCAO
+from src.database.delimited_loader import DelimitedFile, is_delimited
+from src.database.error_policy import ErrorPolicy, ACTION_ASK, ACTION_STOP_RUN
+from src.database.execution_profile import ExecutionProfile
+from src.database.reject_log import RejectLog
+from src.database.result_export import ResultExporter
+from src.engine.dependency_graph import build_dependency_graph, build_sequential_graph
+from src.engine.journal import ExecutionJournal, script_fingerprint
+from src.engine.prefetch import ScriptPrefetcher
+from src.engine.scheduler import run_graph
+from src.database.sql_lexer import split_sql_blocks
+from src.utils.script_reader import open_script
+
+# Constantes para as respostas ao erro de um script
+IGNORAR = 1
+IGNORAR_TODOS = 2
+PARAR = 3
+
+# Scripts maiores que este limite não são antecipados (são lidos sob demanda)
+DEFAULT_PREFETCH_MAX_MB = 32
+
+
+def script_blocks(file_path, digest, block_cache=None):
+    """Blocos do script: do cache de blocos, quando ativo, ou do lexer."""
+    if block_cache is not None:
+        # Scripts inalterados desde a última execução não passam pelo lexer
+        yield from block_cache.blocks(file_path, digest)
+    else:
+        with open_script(file_path) as script:
+            yield from split_sql_blocks(script)
+
+
+def prepare_script(file_path, block_cache=None, max_bytes=None, with_digest=True):
+    """Lê e divide um script de uma vez: (hash, blocos), ou None se não couber na memória."""
+    if is_delimited(file_path) or (max_bytes is not None and os.path.getsize(file_path) > max_bytes):
+        return None
+    digest = content_digest(file_path) if with_digest or block_cache is not None else None
+    return digest, list(script_blocks(file_path, digest, block_cache))
+
+
+class ScriptRunner:
+    """Executa uma lista de scripts em uma ou mais sessões do pool.
+
+    O progresso é comunicado a um observador (listener), que implementa:
+    on_run_start(total), on_script_success(file_path),
+    on_script_error(file_path, error, general), ask_error_action(file_path, error),
+    on_connection_error(error), on_run_error(error),
+    on_script_resumed(file_path, start_block),
+    on_load_progress(file_path, rows, rows_per_second) e
+    on_run_finish(success_count, error_count). Os métodos podem ser chamados
+    a partir de threads de execução.
+    """
+
+    def __init__(self, config, listener, prepared=None):
+        self.config = config
+        self.listener = listener
+        # Fonte alternativa de scripts já divididos: prepared(file_path) -> (hash, blocos) ou None
+        self._prepared = prepared
+        self.success_count = 0
+        self.error_count = 0
+        self._ignore_all_errors = False
+        self.block_cache = BlockCache.from_config(config)
+        self.journal = ExecutionJournal.from_config(config)
+        self._progress = {}
+        self._prefetcher = None
+        self._connectors = []
+        self.profile = ExecutionProfile.from_config(config)
+        self.rejects = RejectLog.from_config(config)
+        self.results = ResultExporter.from_config(config)
+        # Erros decididos sem interação (chave error_rules); ValueError se as regras forem inválidas
+        self.error_policy = ErrorPolicy.from_config(config)
+        self._prefetch_max_bytes = int(config.get("prefetch_max_mb", DEFAULT_PREFETCH_MAX_MB)) * 1024 * 1024
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._decision_lock = threading.Lock()
+
+    def session_count(self, script_count):
+        """Número de sessões paralelas a usar nesta execução."""
+        sessions = max(1, int(self.config.get("parallel_sessions", 1)))
+        # Uma transação única para a execução só existe dentro de uma sessão
+        if self.config.get("commit_mode") == COMMIT_EXECUCAO:
+            sessions = 1
+        return max(1, min(sessions, script_count))
+
+    def stop(self):
+        """Solicita a interrupção: nenhum novo script será iniciado."""
+        self._stop.set()
+
+    def cancel(self):
+        """Interrompe a execução e os comandos em andamento em todas as sessões.
+
+        Os scripts em andamento terminam com erro de cancelamento e as
+        alterações pendentes são desfeitas, como em uma execução interrompida.
+        """
+        self.stop()
+        for connector in list(self._connectors):
+            connector.cancel()
+
+    @property
+    def stopped(self):
+        return self._stop.is_set()
+
+    def can_resume(self):
+        """Indica se há uma execução interrompida que pode ser retomada."""
+        return self.journal is not None and self.journal.can_resume()
+
+    def run(self, scripts, resume=False):
+        """Executa os scripts e retorna (sucessos, erros).
+
+        Com resume=True, scripts já concluídos na execução interrompida são
+        pulados e os demais continuam a partir do primeiro bloco não confirmado.
+        """
+        sessions = self.session_count(len(scripts))
+        try:
+            if sessions == 1:
+                graph = build_sequential_graph(scripts)
+            else:
+                graph = build_dependency_graph(scripts, self.config.get("folder"))
+        except (OSError, ValueError) as e:
+            self.listener.on_run_error(str(e))
+            return self.success_count, self.error_count
+
+        connectors = self._open_sessions(sessions)
+        if connectors is None:
+            return self.success_count, self.error_count
+        self._connectors = connectors
+
+        if self.journal is not None:
+            try:
+                self._progress = self.journal.load_progress() if resume else {}
+                self.journal.open(resume)
+            except OSError as e:
+                self.listener.on_run_error(f"Diário de execução indisponível: {e}")
+                self.journal = None
+            for connector in connectors:
+                connector.journal = self.journal
+
+        for connector in connectors:
+            connector.profile = self.profile
+
+        self.listener.on_run_start(len(scripts))
+
+        idle = queue.Queue()
+        for connector in connectors:
+            idle.put(connector)
+
+        # Lê e divide os próximos scripts enquanto o atual executa no banco
+        if self._prepared is None:
+            self._prefetcher = ScriptPrefetcher.from_config(self.config, graph.nodes, self._prepare_script)
+
+        def execute(file_path):
+            connector = idle.get()
+            try:
+                self._run_script(connector, file_path)
+            finally:
+                idle.put(connector)
+
+        try:
+            run_graph(graph, execute, workers=sessions, should_stop=self._stop.is_set, on_abort=self.cancel)
+        except BaseException:
+            # Execução abortada (ex.: Ctrl+C no modo em lote): desfaz o pendente
+            self.stop()
+            raise
+        finally:
+            if self._prefetcher is not None:
+                self._prefetcher.close()
+                self._prefetcher = None
+            # Confirma a transação de cada sessão (ou a desfaz, se interrompida)
+            for connector in connectors:
+                success, error = connector.end_run(completed=not self.stopped)
+                if not success:
+                    self.listener.on_run_error(error)
+                connector.close()
+            self._connectors = []
+            if self.journal is not None:
+                self.journal.close(completed=not self.stopped)
+
+        self.listener.on_run_finish(self.success_count, self.error_count)
+        return self.success_count, self.error_count
+
+    def _open_sessions(self, sessions):
+        """Obtém as sessões do pool; retorna None se a conexão falhar."""
+        connectors = []
+        for _ in range(sessions):
+            connector = OracleConnector()
+            success, error = connector.connect(
+                self.config["user"],
+                self.config["password"],
+                self.config["host"],
+                self.config["port"],
+                self.config["service"],
+                max_sessions=sessions,
+                stmtcachesize=self.config.get("stmtcachesize")
+            )
+            if not success:
+                for opened in connectors:
+                    opened.close()
+                self.listener.on_connection_error(error)
+                return None
+            connector.bind_literals = bool(self.config.get("bind_literals", True))
+            connector.batch_errors = self.rejects is not None
+            connector.rejects = self.rejects
+            connector.results = self.results
+            connector.error_policy = self.error_policy
+            connector.statement_timeout = float(self.config.get("statement_timeout") or 0)
+            connector.script_timeout = float(self.config.get("script_timeout") or 0)
+            connector.begin_run(CommitPolicy.from_config(self.config))
+            connectors.append(connector)
+        return connectors
+
+    def _run_script(self, connector, file_path):
+        """Executa um script em uma sessão e trata o resultado."""
+        try:
+            if self._prepared is not None:
+                prepared = self._prepared(file_path)
+            else:
+                prepared = self._prefetcher.take(file_path) if self._prefetcher is not None else None
+            digest = prepared[0] if prepared is not None else None
+            start_block = 1
+            if self.journal is not None:
+                if digest is None:
+                    # Scripts lidos sob demanda e arquivos CSV/TSV grandes não são lidos duas vezes
+                    digest = script_fingerprint(file_path, self._prefetch_max_bytes)
+                progress = self._progress.get(file_path)
+                if progress is not None and progress.digest == digest:
+                    if progress.done:
+                        # Concluído na execução interrompida
+                        with self._lock:
+                            self.success_count += 1
+                        self.listener.on_script_resumed(file_path, None)
+                        return
+                    start_block = progress.durable_block + 1
+                    if start_block > 1:
+                        self.listener.on_script_resumed(file_path, start_block)
+                self.journal.script_started(file_path, digest)
+
+            if is_delimited(file_path):
+                # Arquivos CSV/TSV são carregados diretamente na tabela do mapeamento
+                success, error = connector.load_file(
+                    DelimitedFile.from_file(file_path, self.config), file_path, start_block,
+                    lambda rows, elapsed: self.listener.on_load_progress(
+                        file_path, rows, rows / elapsed if elapsed else 0.0
+                    )
+                )
+            elif prepared is not None:
+                success, error = connector.execute_blocks(prepared[1], file_path, start_block)
+            elif self.block_cache is not None or self.journal is not None:
+                with closing(self._script_blocks(file_path, digest)) as blocks:
+                    success, error = connector.execute_blocks(blocks, file_path, start_block)
+            else:
+                # Executa o script à medida que ele é lido do disco
+                with open_script(file_path) as script:
+                    success, error = connector.execute_script(script)
+        except Exception as e:
+            self._handle_error(file_path, str(e), general=True)
+            return
+
+        if success:
+            with self._lock:
+                self.success_count += 1
+            self.listener.on_script_success(file_path)
+        else:
+            self._handle_error(file_path, error, action=connector.rules_action)
+
+    def _prepare_script(self, file_path):
+        """Lê e divide um script antecipadamente; None se for grande demais para a memória."""
+        return prepare_script(file_path, self.block_cache, self._prefetch_max_bytes,
+                              with_digest=self.block_cache is not None or self.journal is not None)
+
+    def _script_blocks(self, file_path, digest):
+        """Blocos de um script lido durante a execução.
+
+        Acima de prefetch_max_mb o cache de blocos é ignorado: consultá-lo
+        exigiria ler o arquivo inteiro (hash) antes do primeiro bloco, e o
+        script deixaria de ser executado enquanto é lido.
+        """
+        block_cache = self.block_cache
+        if block_cache is not None and os.path.getsize(file_path) > self._prefetch_max_bytes:
+            block_cache = None
+        return script_blocks(file_path, digest, block_cache)
+
+    def _handle_error(self, file_path, error, general=False, action=ACTION_ASK):
+        """Registra o erro de um script e decide se a execução continua.
+
+        Se as regras de erros já decidiram todos os erros do script (action),
+        o usuário não é consultado.
+        """
+        with self._lock:
+            self.error_count += 1
+        self.listener.on_script_error(file_path, error, general)
+
+        if action == ACTION_STOP_RUN:
+            self.stop()
+            return
+        if action != ACTION_ASK:
+            return
+
+        # Uma decisão por vez, mesmo com várias sessões em paralelo
+        with self._decision_lock:
+            if self._ignore_all_errors or self.stopped:
+                return
+            choice = self.listener.ask_error_action(file_path, error)
+            if choice == IGNORAR_TODOS:
+                # Continua sem perguntar novamente
+                self._ignore_all_errors = True
+            elif choice == PARAR:
+                self.stop()
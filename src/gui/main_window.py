@@ -4,32 +4,90 @@ import threading
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from src.gui.widgets.file_list import FileList
 from src.gui.widgets.output_panel import OutputPanel
+from src.gui.widgets.result_grid import ResultGrid
+from src.gui.widgets.target_matrix import TargetMatrix
 from src.config.config_manager import ConfigManager
-from src.database.oracle_connector import OracleConnector
+from src.database.commit_policy import COMMIT_MODES, COMMIT_MODE_LABELS
+from src.database.oracle_client import ClientInitializer
+from src.utils.folder_scanner import FolderScanner, scan_options
+from src.utils.startup_timer import StartupTimer
 from src.utils.validators import Validators
 
-# Constantes para as respostas do diálogo de erro
-IGNORAR = 1
-IGNORAR_TODOS = 2
-PARAR = 3
+
+# O botão de cancelamento só fica habilitado durante a execução dos scripts
+CANCEL_BUTTON_TEXT = "Cancelar Execução"
+
 
 class MainWindow:
-    def __init__(self):
+    def __init__(self, startup_timer=None):
+        self.startup_timer = startup_timer or StartupTimer()
         self.root = tk.Tk()
         self.root.title("Executor de Scripts SQL Oracle v1.1")
         self.root.geometry("800x600")  # Reduzido para 800x600
         self.root.minsize(800, 600)    # Tamanho mínimo da janela
         
         self.config_manager = ConfigManager()
-        self.oracle_connector = OracleConnector()
         
         # Flag para controlar operações em andamento
         self.operation_in_progress = False
+
+        # Varredura da pasta de scripts em segundo plano
+        self.folder_scanner = None
+        self._scan_generation = 0
+        self.scan_in_progress = False
+
+        # Perfil de tempos, linhas rejeitadas e resultados exportados da última execução
+        self.last_profile = None
+        self.last_rejects = None
+        self.last_results = None
+        self.last_error_policy = None
+        # Execução em andamento (para o cancelamento)
+        self.runner = None
+        # Última execução em vários destinos
+        self.last_fanout = None
         
         self._setup_styles()
         self._setup_layout()
         self._load_initial_config()
 
+        # O driver (e o Instant Client, se usado) é carregado enquanto a janela é exibida
+        self._startup_reported = False
+        self.client_init = ClientInitializer(
+            self.config_manager.get_config().get("driver"), on_done=self._on_client_initialized
+        ).start()
+        self.startup_timer.mark("janela montada")
+        self.root.after_idle(self._on_window_ready)
+
+    def _on_window_ready(self):
+        """Primeiro momento em que a janela está desenhada e responde ao usuário."""
+        self.startup_timer.mark("janela interativa")
+        self._report_startup()
+
+    def _on_client_initialized(self, success, error):
+        """Chamado pela thread de inicialização do cliente Oracle."""
+        self.startup_timer.mark("cliente Oracle")
+        self.root.after(0, lambda: self._show_client_status(success, error))
+
+    def _show_client_status(self, success, error):
+        if not success:
+            messagebox.showerror("Erro Crítico - Oracle Client", error)
+        self._report_startup()
+
+    def _report_startup(self):
+        """Mostra os tempos da inicialização (chave startup_report da configuração)."""
+        timer = self.startup_timer
+        if self._startup_reported or timer.elapsed("cliente Oracle") is None or timer.elapsed("janela interativa") is None:
+            return
+        self._startup_reported = True
+        if self.config_manager.get_config().get("startup_report"):
+            self.output_panel.append_text(timer.report())
+
+    def _wait_for_client(self):
+        """Aguarda o fim da inicialização do cliente Oracle; retorna (sucesso, erro)."""
+        if not self.client_init.done:
+            self.output_panel.append_text("Aguardando a inicialização do cliente Oracle...\n")
+        return self.client_init.wait()
+
     def _setup_styles(self):
         """Configura os estilos da interface."""
         style = ttk.Style()
@@ -69,10 +127,27 @@ class MainWindow:
         
         executar_btn = ttk.Button(main_button_frame, text="Executar Scripts", command=self.executar_scripts)
         executar_btn.pack(pady=3, fill=tk.X)  # Menos espaço
+
+        retomar_btn = ttk.Button(main_button_frame, text="Retomar Execução", command=self.retomar_execucao)
+        retomar_btn.pack(pady=3, fill=tk.X)
+
+        destinos_btn = ttk.Button(main_button_frame, text="Executar em Destinos", command=self.executar_em_destinos)
+        destinos_btn.pack(pady=3, fill=tk.X)
+
+        self.cancel_btn = ttk.Button(main_button_frame, text=CANCEL_BUTTON_TEXT,
+                                     command=self.cancelar_execucao, state=tk.DISABLED)
+        self.cancel_btn.pack(pady=3, fill=tk.X)
+
+        perfil_btn = ttk.Button(main_button_frame, text="Exportar Perfil", command=self.exportar_perfil)
+        perfil_btn.pack(pady=3, fill=tk.X)
         
         sair_btn = ttk.Button(main_button_frame, text="Sair", command=self.root.destroy)
         sair_btn.pack(pady=3, fill=tk.X)  # Menos espaço
 
+        # Progresso da carga de arquivos CSV/TSV (linhas e linhas/s)
+        self.load_status = ttk.Label(main_button_frame, text="", wraplength=180)
+        self.load_status.pack(pady=3, fill=tk.X)
+
         # Configura o frame de configuração para expandir
         top_frame.columnconfigure(0, weight=3)  # Dá mais espaço ao campo de configuração
         top_frame.columnconfigure(1, weight=1)  # Menos espaço para botões
@@ -86,10 +161,18 @@ class MainWindow:
         bottom_paned_window.add(files_panel, weight=1)
         self.file_list = FileList(files_panel)
 
-        # Painel direito (saída)
-        output_panel = ttk.Frame(bottom_paned_window, padding=3)  # Menos padding
-        bottom_paned_window.add(output_panel, weight=1)
+        # Painel direito: saída da execução e resultados das consultas
+        self.output_notebook = ttk.Notebook(bottom_paned_window)
+        bottom_paned_window.add(self.output_notebook, weight=1)
+        output_panel = ttk.Frame(self.output_notebook, padding=3)  # Menos padding
+        self.output_notebook.add(output_panel, text="Saída")
         self.output_panel = OutputPanel(output_panel)
+        results_panel = ttk.Frame(self.output_notebook, padding=3)
+        self.output_notebook.add(results_panel, text="Resultados")
+        self.result_grid = ResultGrid(results_panel)
+        targets_panel = ttk.Frame(self.output_notebook, padding=3)
+        self.output_notebook.add(targets_panel, text="Destinos")
+        self.target_matrix = TargetMatrix(targets_panel)
         
         # Configura a posição inicial do divisor (40% para arquivos, 60% para saída)
         bottom_paned_window.sashpos(0, 320)
@@ -129,6 +212,22 @@ class MainWindow:
         self.service_entry = ttk.Entry(parent)
         self.service_entry.grid(row=5, column=1, sticky=(tk.W, tk.E), padx=3, pady=2)
 
+        # Política de commit
+        ttk.Label(parent, text="Commit:").grid(row=6, column=0, sticky=tk.W, padx=3, pady=2)
+        self.commit_mode_combo = ttk.Combobox(
+            parent,
+            values=[COMMIT_MODE_LABELS[mode] for mode in COMMIT_MODES],
+            state="readonly"
+        )
+        self.commit_mode_combo.grid(row=6, column=1, sticky=(tk.W, tk.E), padx=3, pady=2)
+        self.commit_every_entry = ttk.Entry(parent, width=8)
+        self.commit_every_entry.grid(row=6, column=2, padx=3, pady=2)
+
+        # Sessões paralelas
+        ttk.Label(parent, text="Sessões:").grid(row=7, column=0, sticky=tk.W, padx=3, pady=2)
+        self.sessions_spinbox = ttk.Spinbox(parent, from_=1, to=32, width=6)
+        self.sessions_spinbox.grid(row=7, column=1, sticky=tk.W, padx=3, pady=2)
+
         # Configura a coluna dos campos para expandir
         parent.columnconfigure(1, weight=1)
 
@@ -143,19 +242,18 @@ class MainWindow:
         self.host_entry.insert(0, config.get("host", "localhost"))
         self.port_entry.insert(0, config.get("port", "1521"))
         self.service_entry.insert(0, config.get("service", "XE"))
+        self.commit_mode_combo.set(COMMIT_MODE_LABELS.get(
+            config.get("commit_mode"), COMMIT_MODE_LABELS[COMMIT_MODES[0]]
+        ))
+        self.commit_every_entry.insert(0, str(config.get("commit_every", 100)))
+        self.sessions_spinbox.set(str(config.get("parallel_sessions", 1)))
 
         # Carrega scripts da pasta inicial
         if config.get("folder"):
             try:
                 initial_folder = config["folder"]
                 if os.path.isdir(initial_folder):
-                    initial_files = sorted([
-                        os.path.join(initial_folder, f) 
-                        for f in os.listdir(initial_folder) 
-                        if f.lower().endswith('.sql')
-                    ])
-                    self.file_list.loaded_scripts = initial_files
-                    self.file_list.atualizar_lista_arquivos()
+                    self._start_scan(initial_folder)
                 else:
                     self.folder_entry.delete(0, tk.END)
                     messagebox.showwarning(
@@ -176,25 +274,53 @@ class MainWindow:
         if folder:
             self.folder_entry.delete(0, tk.END)
             self.folder_entry.insert(0, folder)
-            try:
-                files = sorted([
-                    os.path.join(folder, f) 
-                    for f in os.listdir(folder) 
-                    if f.lower().endswith('.sql')
-                ])
-                self.file_list.loaded_scripts = files
-                self.file_list.atualizar_lista_arquivos()
-            except Exception as e:
-                messagebox.showerror("Erro", f"Erro ao listar arquivos da pasta '{folder}': {e}")
-                self.file_list.loaded_scripts = []
-                self.file_list.atualizar_lista_arquivos()
+            self._start_scan(folder)
+
+    def _start_scan(self, folder):
+        """Carrega os scripts da pasta (e subpastas) em segundo plano."""
+        if self.folder_scanner is not None:
+            self.folder_scanner.cancel()
+        self._scan_generation += 1
+        generation = self._scan_generation
+        self.scan_in_progress = True
+        self.file_list.set_scripts([])
+        self.file_list.set_loading(True)
+
+        # Os lotes chegam da thread de varredura e são aplicados na thread principal
+        self.folder_scanner = FolderScanner(
+            lambda batch: self.root.after(0, self._add_scanned_scripts, generation, batch),
+            lambda total, error: self.root.after(0, self._finish_scan, generation, folder, error)
+        )
+        self.folder_scanner.scan(folder, **scan_options(self.config_manager.get_config()))
 
-    def executar_scripts(self):
+    def _add_scanned_scripts(self, generation, scripts):
+        """Acrescenta um lote da varredura, se ela ainda for a atual."""
+        if generation == self._scan_generation:
+            self.file_list.add_scripts(scripts)
+
+    def _finish_scan(self, generation, folder, error):
+        """Finaliza a varredura da pasta."""
+        if generation != self._scan_generation:
+            return
+        self.scan_in_progress = False
+        self.file_list.set_loading(False)
+        if error:
+            messagebox.showerror("Erro", f"Erro ao listar arquivos da pasta '{folder}': {error}")
+
+    def retomar_execucao(self):
+        """Retoma a última execução interrompida a partir do primeiro bloco não confirmado."""
+        self.executar_scripts(resume=True)
+
+    def executar_scripts(self, resume=False):
         """Executa os scripts SQL selecionados em uma thread separada."""
         # Verifica se já há uma operação em andamento
         if self.operation_in_progress:
             messagebox.showinfo("Operação em Andamento", "Aguarde a conclusão da operação atual.")
             return
+
+        if self.scan_in_progress:
+            messagebox.showinfo("Carregando Scripts", "Aguarde o carregamento da lista de scripts.")
+            return
             
         # Valida campos
         if not Validators.validate_connection_fields(
@@ -211,36 +337,129 @@ class MainWindow:
         if not Validators.validate_scripts_list(scripts):
             return
 
+        if not Validators.validate_commit_every(self.commit_every_entry.get()):
+            return
+
+        if not Validators.validate_parallel_sessions(self.sessions_spinbox.get()):
+            return
+
         # Salva configuração atual
+        config_data = self._save_run_config()
+        if not self._validate_error_rules(config_data):
+            return
+
+        if resume:
+            from src.engine.journal import ExecutionJournal
+            journal = ExecutionJournal.from_config(config_data)
+            if journal is None or not journal.can_resume():
+                messagebox.showinfo("Retomar Execução", "Não há execução interrompida para retomar.")
+                return
+        
+        # Executa em uma thread separada
+        self._start_execution(self._run_scripts, scripts, config_data, resume)
+
+    def executar_em_destinos(self):
+        """Executa os scripts selecionados em todos os bancos de um arquivo de destinos."""
+        if self.operation_in_progress:
+            messagebox.showinfo("Operação em Andamento", "Aguarde a conclusão da operação atual.")
+            return
+
+        if self.scan_in_progress:
+            messagebox.showinfo("Carregando Scripts", "Aguarde o carregamento da lista de scripts.")
+            return
+
+        scripts = self.file_list.get_scripts()
+        if not Validators.validate_scripts_list(scripts):
+            return
+
+        if not Validators.validate_commit_every(self.commit_every_entry.get()):
+            return
+
+        if not Validators.validate_parallel_sessions(self.sessions_spinbox.get()):
+            return
+
+        targets_file = self.config_manager.get_config().get("targets_file", "")
+        path = filedialog.askopenfilename(
+            title="Selecionar Arquivo de Destinos",
+            initialdir=os.path.dirname(targets_file) or None,
+            initialfile=os.path.basename(targets_file),
+            filetypes=[("Arquivos JSON", "*.json"), ("Todos os arquivos", "*.*")]
+        )
+        if not path:
+            return
+
+        # Os campos do formulário valem para os destinos que não os informarem
+        config_data = self._save_run_config(targets_file=path)
+        if not self._validate_error_rules(config_data):
+            return
+        from src.engine.fanout import load_targets
+        try:
+            targets = load_targets(path, config_data)
+        except ValueError as e:
+            messagebox.showerror("Arquivo de Destinos", str(e))
+            return
+
+        self._start_execution(self._run_targets, scripts, config_data, targets)
+
+    def _save_run_config(self, **extra):
+        """Salva os campos do formulário e retorna a configuração completa da execução."""
         config_data = {
             "folder": self.folder_entry.get(),
             "user": self.user_entry.get(),
             "password": self.password_entry.get(),
             "host": self.host_entry.get(),
             "port": self.port_entry.get(),
-            "service": self.service_entry.get()
+            "service": self.service_entry.get(),
+            "commit_mode": self._get_commit_mode(),
+            "commit_every": int(self.commit_every_entry.get()),
+            "parallel_sessions": int(self.sessions_spinbox.get())
         }
+        config_data.update(extra)
         self.config_manager.update_config(config_data)
-        
+        # A execução usa também as demais chaves do arquivo de configuração
+        return dict(self.config_manager.get_config())
+
+    def _validate_error_rules(self, config):
+        """Verifica as regras de erros (error_rules) antes da execução."""
+        from src.database.error_policy import ErrorPolicy
+        try:
+            ErrorPolicy.from_config(config)
+        except ValueError as e:
+            messagebox.showerror("Regras de Erros", str(e))
+            return False
+        return True
+
+    def _start_execution(self, run, *args):
+        """Bloqueia a interface e executa run(*args) em uma thread separada."""
         # Define a operação como em andamento
         self.operation_in_progress = True
         
         # Desabilita os botões durante a execução
         self._toggle_buttons_state(tk.DISABLED)
         
+        self.cancel_btn.configure(state=tk.NORMAL)
+
         # Mostra indicador de progresso
         self.output_panel.clear()
+        self.output_panel.start_log()
         self.output_panel.append_text("Iniciando a execução dos scripts...\n")
         
-        # Executa em uma thread separada
-        thread = threading.Thread(target=self._run_scripts_thread, args=(scripts, config_data))
+        thread = threading.Thread(target=self._run_scripts_thread, args=(run, *args))
         thread.daemon = True
         thread.start()
 
-    def _run_scripts_thread(self, scripts, config):
+    def _get_commit_mode(self):
+        """Retorna o modo de commit correspondente ao rótulo selecionado."""
+        label = self.commit_mode_combo.get()
+        for mode, mode_label in COMMIT_MODE_LABELS.items():
+            if mode_label == label:
+                return mode
+        return COMMIT_MODES[0]
+
+    def _run_scripts_thread(self, run, *args):
         """Executa os scripts em uma thread separada."""
         try:
-            self._run_scripts(scripts, config)
+            run(*args)
         finally:
             # Garante que a UI seja atualizada no thread principal
             self.root.after(0, self._finish_execution)
@@ -248,7 +467,18 @@ class MainWindow:
     def _finish_execution(self):
         """Finaliza a execução e restaura o estado da interface."""
         self.operation_in_progress = False
+        self.runner = None
         self._toggle_buttons_state(tk.NORMAL)
+        self.cancel_btn.configure(state=tk.DISABLED)
+
+    def cancelar_execucao(self):
+        """Cancela os comandos em andamento; os scripts seguintes não são iniciados."""
+        runner = self.runner
+        if runner is None:
+            return
+        self.cancel_btn.configure(state=tk.DISABLED)
+        self.output_panel.append_error("\n[CANCELANDO] Interrompendo os comandos em andamento...\n")
+        threading.Thread(target=runner.cancel, daemon=True).start()
     
     def _toggle_buttons_state(self, state):
         """Altera o estado dos botões da interface."""
@@ -263,8 +493,8 @@ class MainWindow:
                 self._set_widget_state(child, state)
         
         if isinstance(widget, ttk.Button) or isinstance(widget, tk.Button):
-            # Não desabilita o botão de "Sair"
-            if widget.cget("text") != "Sair":
+            # Não altera o botão de "Sair" nem o de cancelamento (controlado pela execução)
+            if widget.cget("text") not in ("Sair", CANCEL_BUTTON_TEXT):
                 widget.configure(state=state)
 
     def _show_error_dialog(self, file_name, error_message):
@@ -306,6 +536,7 @@ class MainWindow:
         ).pack(anchor=tk.W, pady=(0, 10))
         
         # Variável para armazenar a escolha do usuário
+        from src.engine.script_runner import IGNORAR, IGNORAR_TODOS, PARAR
         result = tk.IntVar(value=PARAR)
         
         # Frame para os botões
@@ -351,115 +582,154 @@ class MainWindow:
         result_var.set(choice)
         dialog.destroy()
 
-    def _run_scripts(self, scripts, config):
+    def _run_scripts(self, scripts, config, resume=False):
         """Executa a lista de scripts SQL."""
-        success, error = self.oracle_connector.connect(
-            config["user"],
-            config["password"],
-            config["host"],
-            config["port"],
-            config["service"]
-        )
-        
+        success, error = self._wait_for_client()
         if not success:
-            # Mostra o erro na thread principal
-            self.root.after(0, lambda: messagebox.showerror("Erro de Conexão", error))
+            self.on_connection_error(error)
             return
+        # O motor de execução só é importado quando usado, para não atrasar a abertura da janela
+        from src.engine.script_runner import ScriptRunner
+        runner = ScriptRunner(config, self)
+        self.runner = runner
+        self.last_profile = runner.profile
+        self.last_rejects = runner.rejects
+        self.last_results = runner.results
+        self.last_error_policy = runner.error_policy
+        runner.run(scripts, resume=resume)
+
+    def _run_targets(self, scripts, config, targets):
+        """Executa a lista de scripts em todos os destinos."""
+        success, error = self._wait_for_client()
+        if not success:
+            self.on_connection_error(error)
+            return
+        from src.engine.fanout import FanOutRunner
+        fanout = FanOutRunner(config, targets, self)
+        self.runner = fanout
+        self.last_fanout = fanout
+        self.last_profile = self.last_rejects = self.last_results = self.last_error_policy = None
+        self.root.after(0, lambda: self._show_target_matrix(fanout))
+        fanout.run(scripts)
+
+    def _show_target_matrix(self, fanout):
+        self.target_matrix.start(fanout)
+        self.output_notebook.select(2)
+
+    # Observador da execução (chamado a partir das threads de execução)
+
+    def on_connection_error(self, error):
+        """Mostra o erro de conexão na thread principal."""
+        self.root.after(0, lambda: messagebox.showerror("Erro de Conexão", error))
+
+    # O painel de saída aceita chamadas de qualquer thread e se atualiza em lotes
+
+    def on_run_start(self, script_count):
+        """Limpa e inicializa o painel de saída."""
+        self.root.after(0, lambda: self.load_status.configure(text=""))
+        self._init_output_panel(script_count)
+
+    def on_script_success(self, file_path):
+        """Registra o sucesso do script no painel de saída."""
+        self._append_success(os.path.basename(file_path))
+
+    def on_script_resumed(self, file_path, start_block):
+        """Informa que o script foi retomado (ou já estava concluído)."""
+        file_name = os.path.basename(file_path)
+        if start_block is None:
+            message = f"[JÁ CONCLUÍDO] {file_name}\n"
+        else:
+            message = f"[RETOMADO] {file_name} a partir do bloco {start_block}\n"
+        self.output_panel.append_text(message)
+
+    def on_script_error(self, file_path, error, general=False):
+        """Exibe o erro no painel de saída."""
+        file_name = os.path.basename(file_path)
+        if general:
+            self._append_general_error(file_name, error)
+        else:
+            self._append_error(file_name, error)
+
+    def ask_error_action(self, file_path, error):
+        """Pergunta ao usuário como prosseguir após o erro de um script."""
+        return self._ask_in_main_thread(os.path.basename(file_path), error)
+
+    def _ask_in_main_thread(self, file_name, error):
+        """Mostra o diálogo de erro na thread principal e aguarda a escolha."""
+        # Como não podemos bloquear uma thread secundária com um diálogo,
+        # precisamos voltar para a thread principal, mostrar o diálogo e esperar
+        from src.engine.script_runner import PARAR
+        choice_var = threading.Event()
+        choice_result = [PARAR]  # Valor padrão
+
+        # Função que será executada na thread principal para mostrar o diálogo
+        def show_dialog_in_main_thread():
+            result = self._show_error_dialog(file_name, error)
+            choice_result[0] = result
+            choice_var.set()
+
+        # Agenda a execução na thread principal e espera
+        self.root.after(0, show_dialog_in_main_thread)
+        choice_var.wait()
+        return choice_result[0]
+
+    def on_load_progress(self, file_path, rows, rows_per_second):
+        """Mostra o progresso da carga de um arquivo CSV/TSV."""
+        text = f"{os.path.basename(file_path)}: {rows:,} linha(s), {rows_per_second:,.0f} linhas/s".replace(",", ".")
+        self.root.after(0, lambda: self.load_status.configure(text=text))
+
+    def on_run_error(self, error):
+        """Exibe um erro da execução como um todo."""
+        self.output_panel.append_error(f"[ERRO] {error}\n")
+
+    def on_run_finish(self, success_count, error_count):
+        """Atualiza o resumo na thread principal."""
+        self.root.after(0, lambda sc=success_count, ec=error_count: self._show_execution_summary(sc, ec))
 
-        # Limpa e inicializa o painel de saída na thread principal
-        self.root.after(0, lambda: self._init_output_panel(len(scripts)))
+    # Observador da execução em vários destinos
 
-        # Flag para controlar se deve mostrar diálogos de erro
-        ignore_all_errors = False
-        
-        # Contador de scripts executados com sucesso
-        success_count = 0
-        error_count = 0
+    def on_fanout_start(self, targets, script_count):
+        """Inicializa o painel de saída."""
+        self.output_panel.clear()
+        self.output_panel.append_text(
+            f"Iniciando execução de {script_count} script(s) em {len(targets)} destino(s)...\n\n"
+        )
 
-        for file_path in scripts:
-            file_name = os.path.basename(file_path)
-            try:
-                with open(file_path, encoding='utf-8') as f:
-                    sql = f.read()
-                
-                # Executa o script e obtém o resultado
-                success, error = self.oracle_connector.execute_script(sql)
-                
-                if success:
-                    # Atualiza o UI na thread principal
-                    self.root.after(0, lambda fn=file_name: self._append_success(fn))
-                    success_count += 1
-                else:
-                    error_count += 1
-                    # Exibe o erro no painel de saída na thread principal
-                    self.root.after(0, lambda fn=file_name, err=error: self._append_error(fn, err))
-                    
-                    # Se não estiver ignorando todos os erros, mostra o diálogo
-                    if not ignore_all_errors:
-                        # Como não podemos bloquear uma thread secundária com um diálogo,
-                        # precisamos voltar para a thread principal, mostrar o diálogo e esperar
-                        choice_var = threading.Event()
-                        choice_result = [PARAR]  # Valor padrão
-                        
-                        # Função que será executada na thread principal para mostrar o diálogo
-                        def show_dialog_in_main_thread():
-                            result = self._show_error_dialog(file_name, error)
-                            choice_result[0] = result
-                            choice_var.set()
-                            
-                        # Agenda a execução na thread principal e espera
-                        self.root.after(0, show_dialog_in_main_thread)
-                        choice_var.wait()
-                        
-                        choice = choice_result[0]
-                        
-                        if choice == IGNORAR:
-                            # Continua com o próximo script
-                            continue
-                        elif choice == IGNORAR_TODOS:
-                            # Continua sem mostrar mais diálogos
-                            ignore_all_errors = True
-                        elif choice == PARAR:
-                            # Para a execução
-                            break
-            except Exception as e:
-                error_count += 1
-                # Exibe o erro no painel de saída na thread principal
-                self.root.after(0, lambda fn=file_name, err=str(e): self._append_general_error(fn, err))
-                
-                # Se não estiver ignorando todos os erros, mostra o diálogo
-                if not ignore_all_errors:
-                    # Como não podemos bloquear uma thread secundária com um diálogo,
-                    # precisamos voltar para a thread principal, mostrar o diálogo e esperar
-                    choice_var = threading.Event()
-                    choice_result = [PARAR]  # Valor padrão
-                    
-                    # Função que será executada na thread principal para mostrar o diálogo
-                    def show_dialog_in_main_thread():
-                        result = self._show_error_dialog(file_name, str(e))
-                        choice_result[0] = result
-                        choice_var.set()
-                        
-                    # Agenda a execução na thread principal e espera
-                    self.root.after(0, show_dialog_in_main_thread)
-                    choice_var.wait()
-                    
-                    choice = choice_result[0]
-                    
-                    if choice == IGNORAR:
-                        # Continua com o próximo script
-                        continue
-                    elif choice == IGNORAR_TODOS:
-                        # Continua sem mostrar mais diálogos
-                        ignore_all_errors = True
-                    elif choice == PARAR:
-                        # Para a execução
-                        break
-
-        self.oracle_connector.close()
-        
-        # Atualiza o resumo na thread principal
-        self.root.after(0, lambda sc=success_count, ec=error_count: self._show_execution_summary(sc, ec))
+    def on_target_script_success(self, target, file_path):
+        self._append_success(f"{target}: {os.path.basename(file_path)}")
+
+    def on_target_script_error(self, target, file_path, error):
+        self._append_error(f"{target}: {os.path.basename(file_path)}", error)
+
+    def ask_target_error_action(self, target, file_path, error):
+        """Pergunta ao usuário como prosseguir no destino após o erro de um script."""
+        return self._ask_in_main_thread(f"{target}: {os.path.basename(file_path)}", error)
+
+    def on_target_error(self, target, error):
+        self.output_panel.append_error(f"[ERRO] {target}: {error}\n")
+
+    def on_target_finish(self, target, progress):
+        self.output_panel.append_text(f"[DESTINO] {target}: {progress.state} ({progress.elapsed:.1f} s)\n")
+
+    def on_fanout_finish(self, summary):
+        """Atualiza o resumo na thread principal."""
+        self.root.after(0, lambda: self._show_fanout_summary(summary))
+
+    def _show_fanout_summary(self, summary):
+        """Mostra o resumo da execução em vários destinos."""
+        self.target_matrix.refresh()
+        self.output_panel.append_text(f"\n{'=' * 50}\n")
+        self.output_panel.append_text("Execução finalizada. Resumo:\n")
+        self.output_panel.append_text(self.last_fanout.format_summary())
+        if self.output_panel.log_path:
+            self.output_panel.append_text(f"Log completo: {self.output_panel.log_path}\n")
+
+        from src.engine.fanout import TARGET_OK
+        failed = summary["targets"] - summary["by_state"].get(TARGET_OK, 0)
+        if failed == 0:
+            messagebox.showinfo("Sucesso", f"Scripts executados com sucesso em {summary['targets']} destino(s)!")
+        else:
+            messagebox.showinfo("Concluído", f"Execução concluída com problemas em {failed} destino(s).")
     
     def _init_output_panel(self, script_count):
         """Inicializa o painel de saída."""
@@ -485,12 +755,54 @@ class MainWindow:
         self.output_panel.append_success(f"✓ Scripts executados com sucesso: {success_count}\n")
         if error_count > 0:
             self.output_panel.append_error(f"✗ Scripts com erros: {error_count}\n")
+        if self.last_profile is not None and self.last_profile.records:
+            self.output_panel.append_text("\n" + self.last_profile.format_summary())
+        if self.last_rejects is not None and self.last_rejects.total:
+            self.output_panel.append_error("\n" + self.last_rejects.format_summary())
+            self._export_rejects()
+        if self.last_results is not None and self.last_results.results:
+            self.output_panel.append_text(self.last_results.format_summary())
+        if self.last_error_policy is not None and self.last_error_policy.summary():
+            self.output_panel.append_text(self.last_error_policy.format_summary())
+        self.result_grid.set_results(self.last_results.results if self.last_results is not None else ())
+        if self.output_panel.log_path:
+            self.output_panel.append_text(f"Log completo: {self.output_panel.log_path}\n")
         
         if error_count == 0:
             messagebox.showinfo("Sucesso", "Todos os scripts foram executados com sucesso!")
         else:
             messagebox.showinfo("Concluído", f"Execução concluída com {error_count} erro(s).")
 
+    def _export_rejects(self):
+        """Grava as linhas rejeitadas em CSV, ao lado do log da execução."""
+        if not self.output_panel.log_path:
+            return
+        path = os.path.splitext(self.output_panel.log_path)[0] + "_rejeitadas.csv"
+        try:
+            self.last_rejects.export(path)
+            self.output_panel.append_text(f"Linhas rejeitadas: {path}\n")
+        except OSError as e:
+            self.output_panel.append_error(f"Erro ao gravar as linhas rejeitadas: {e}\n")
+
+    def exportar_perfil(self):
+        """Exporta os tempos de cada bloco da última execução (CSV ou JSON Lines)."""
+        if self.last_profile is None or not self.last_profile.records:
+            messagebox.showinfo("Exportar Perfil", "Nenhuma execução com perfil de tempos disponível "
+                                "(ative profile na configuração).")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Exportar Perfil da Execução",
+            defaultextension=".csv",
+            filetypes=(("CSV", "*.csv"), ("JSON Lines", "*.jsonl"))
+        )
+        if not path:
+            return
+        try:
+            self.last_profile.export(path)
+            messagebox.showinfo("Exportar Perfil", f"Perfil exportado para:\n{path}")
+        except OSError as e:
+            messagebox.showerror("Erro", f"Erro ao exportar o perfil: {e}")
+
     def validar_conexao(self):
         """Valida a conexão com o banco de dados em uma thread separada."""
         # Verifica se já há uma operação em andamento
@@ -523,8 +835,16 @@ class MainWindow:
     def _validate_connection_thread(self):
         """Executa a validação de conexão em uma thread separada."""
         try:
+            success, error = self.client_init.wait()
+            if not success:
+                self._connection_result = (False, error)
+                self.root.after(0, self._show_connection_result)
+                return
+
             # Tenta conectar
-            success, error = self.oracle_connector.connect(
+            from src.database.oracle_connector import OracleConnector
+            oracle_connector = OracleConnector()
+            success, error = oracle_connector.connect(
                 self.user_entry.get(),
                 self.password_entry.get(),
                 self.host_entry.get(),
@@ -537,7 +857,7 @@ class MainWindow:
             
             # Se conectou com sucesso, fecha a conexão
             if success:
-                self.oracle_connector.close()
+                oracle_connector.close()
                 
             # Atualiza a UI no thread principal
             self.root.after(0, self._show_connection_result)
@@ -2,10 +2,104 @@ import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
+# Linhas renumeradas por vez após remoções (o restante segue em segundo plano)
+RENUMBER_CHUNK = 500
+
+
+class ScriptListModel:
+    """Lista ordenada de scripts com índice de posições.
+
+    Consultas de posição são O(1). Mover ou adicionar k itens custa O(k).
+    Remover custa O(n - p), sendo p a primeira posição removida: todos os
+    itens seguintes mudam de posição (e de número na lista exibida).
+    """
+
+    def __init__(self, scripts=()):
+        self.items = []
+        self.positions = {}
+        self.add(scripts)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, script):
+        return script in self.positions
+
+    def index(self, script):
+        return self.positions[script]
+
+    def add(self, scripts):
+        """Acrescenta os scripts ainda ausentes e retorna os adicionados."""
+        added = []
+        for script in scripts:
+            if script not in self.positions:
+                self.positions[script] = len(self.items)
+                self.items.append(script)
+                added.append(script)
+        return added
+
+    def remove(self, scripts):
+        """Remove os scripts e retorna a primeira posição afetada (ou None).
+
+        A lista é reconstruída uma única vez a partir dessa posição, qualquer
+        que seja a quantidade de scripts removidos: O(n - p), não O(k * n).
+        """
+        removed = {self.positions[s] for s in scripts if s in self.positions}
+        if not removed:
+            return None
+        first = min(removed)
+        for script in scripts:
+            self.positions.pop(script, None)
+        self.items[first:] = [
+            script for offset, script in enumerate(self.items[first:], first)
+            if offset not in removed
+        ]
+        self._reindex(first)
+        return first
+
+    def move(self, scripts, offset):
+        """Move os scripts uma posição para cima (-1) ou para baixo (+1).
+
+        Itens encostados no início/fim (ou em outro item selecionado parado)
+        permanecem no lugar. Retorna as posições alteradas, em ordem crescente.
+        """
+        indices = sorted((self.positions[s] for s in scripts if s in self.positions),
+                         reverse=offset > 0)
+        boundary = -1 if offset < 0 else len(self.items)
+        changed = []
+        for index in indices:
+            target = index + offset
+            if target == boundary:
+                boundary = index
+                continue
+            items = self.items
+            items[index], items[target] = items[target], items[index]
+            self.positions[items[index]] = index
+            self.positions[items[target]] = target
+            changed.extend((index, target))
+        return sorted(set(changed))
+
+    def can_move(self, scripts, offset):
+        """Indica se algum dos scripts pode ser movido na direção informada."""
+        indices = sorted(self.positions[s] for s in scripts if s in self.positions)
+        if not indices:
+            return False
+        if offset < 0:
+            return any(index != expected for expected, index in enumerate(indices))
+        last = len(self.items) - 1
+        return any(index != last - expected for expected, index in enumerate(reversed(indices)))
+
+    def _reindex(self, start):
+        for index in range(start, len(self.items)):
+            self.positions[self.items[index]] = index
+
+
 class FileList:
     def __init__(self, parent):
         self.parent = parent
-        self.loaded_scripts = []
+        self.model = ScriptListModel()
+        self._renumber_start = None
+        self._loading = False
         self._setup_widgets()
 
     def _setup_widgets(self):
@@ -79,19 +173,12 @@ class FileList:
         """Adiciona scripts à lista."""
         files_to_add = filedialog.askopenfilenames(
             title="Selecionar Scripts SQL para Adicionar",
-            filetypes=(("SQL files", "*.sql"), ("All files", "*.*"))
+            filetypes=(("SQL files", "*.sql"), ("CSV/TSV", "*.csv *.tsv"), ("All files", "*.*"))
         )
         
         if files_to_add:
-            added_count = 0
-            for file_path in files_to_add:
-                if file_path not in self.loaded_scripts:
-                    self.loaded_scripts.append(file_path)
-                    added_count += 1
-            
-            if added_count > 0:
-                self.atualizar_lista_arquivos()
-            else:
+            added = self.add_scripts(files_to_add)
+            if not added:
                 messagebox.showinfo("Nenhum Script Adicionado", "Os scripts selecionados já estavam na lista.")
 
     def remover_scripts(self):
@@ -101,74 +188,115 @@ class FileList:
             messagebox.showwarning("Seleção Vazia", "Selecione um ou mais scripts para remover.")
             return
 
-        self.loaded_scripts = [script for script in self.loaded_scripts if script not in selected_items_ids]
-        self.atualizar_lista_arquivos()
+        first = self.model.remove(selected_items_ids)
+        if first is not None:
+            # Apenas as linhas removidas saem da árvore; as seguintes são renumeradas
+            self.arquivos_tree.delete(*selected_items_ids)
+            self._renumber_from(first)
+        self._update_counter()
 
     def mover_script(self, direcao):
-        """Move um script na lista."""
+        """Move os scripts selecionados uma posição na lista."""
         selected_items = self.arquivos_tree.selection()
-        if not selected_items or len(selected_items) > 1:
-            messagebox.showwarning("Seleção Inválida", "Selecione um único script para mover.")
+        if not selected_items:
+            messagebox.showwarning("Seleção Inválida", "Selecione um ou mais scripts para mover.")
+            return
+
+        changed = self.model.move(selected_items, -1 if direcao == "cima" else 1)
+        if not changed:
             return
 
-        selected_id = selected_items[0]
-        try:
-            index = self.loaded_scripts.index(selected_id)
-            if direcao == "cima" and index > 0:
-                # Troca os elementos na lista
-                self.loaded_scripts[index], self.loaded_scripts[index - 1] = self.loaded_scripts[index - 1], self.loaded_scripts[index]
-                new_index = index - 1
-            elif direcao == "baixo" and index < len(self.loaded_scripts) - 1:
-                # Troca os elementos na lista
-                self.loaded_scripts[index], self.loaded_scripts[index + 1] = self.loaded_scripts[index + 1], self.loaded_scripts[index]
-                new_index = index + 1
+        # Reposiciona apenas as linhas que trocaram de lugar
+        for index in changed:
+            file_path = self.model.items[index]
+            self.arquivos_tree.move(file_path, "", index)
+            self.arquivos_tree.set(file_path, "#", index + 1)
+
+        self.arquivos_tree.see(self.model.items[changed[0] if direcao == "cima" else changed[-1]])
+        self.update_reorder_buttons_state()
+
+    def set_scripts(self, scripts):
+        """Substitui a lista de scripts, alterando apenas as linhas que mudaram."""
+        new_scripts = list(dict.fromkeys(scripts))
+        new_set = set(new_scripts)
+        removed = [script for script in self.model.items if script not in new_set]
+        if removed:
+            self.arquivos_tree.delete(*removed)
+
+        old_positions = self.model.positions
+        kept = [script for script in self.model.items if script in new_set]
+        self.model = ScriptListModel(new_scripts)
+
+        # Percorre a nova ordem comparando com as linhas que ficaram na árvore:
+        # só inserimos, movemos ou renumeramos as linhas que realmente mudaram
+        kept_index, placed, first_renumber = 0, set(), None
+        for index, file_path in enumerate(new_scripts):
+            while kept_index < len(kept) and kept[kept_index] in placed:
+                kept_index += 1
+            if file_path not in old_positions:
+                self.arquivos_tree.insert("", index, iid=file_path,
+                                          values=(index + 1, os.path.basename(file_path)))
+                continue
+            if kept_index < len(kept) and kept[kept_index] == file_path:
+                kept_index += 1
             else:
-                return
-
-            # Atualiza a exibição
-            self.atualizar_lista_arquivos()
-            
-            # Seleciona o item movido
-            if new_index != -1:
-                moved_item = self.loaded_scripts[new_index]
-                self.arquivos_tree.selection_set(moved_item)
-                self.arquivos_tree.focus(moved_item)
-                self.arquivos_tree.see(moved_item)
-        except ValueError:
-            messagebox.showerror("Erro Interno", "Script selecionado não encontrado na lista interna.")
-
-    def atualizar_lista_arquivos(self):
-        """Atualiza a exibição da lista de arquivos."""
-        for item in self.arquivos_tree.get_children():
-            self.arquivos_tree.delete(item)
-        
-        for i, file_path in enumerate(self.loaded_scripts, 1):
-            file_name = os.path.basename(file_path)
-            self.arquivos_tree.insert("", "end", iid=file_path, values=(i, file_name))
-        
-        self.contador_label.config(text=f"Total: {len(self.loaded_scripts)} script(s)")
+                self.arquivos_tree.move(file_path, "", index)
+                placed.add(file_path)
+            if old_positions[file_path] != index and first_renumber is None:
+                first_renumber = index
+
+        if first_renumber is not None:
+            self._renumber_from(first_renumber)
+        self._update_counter()
+
+    def add_scripts(self, scripts):
+        """Acrescenta ao final os scripts ainda ausentes; retorna os adicionados."""
+        start = len(self.model)
+        added = self.model.add(scripts)
+        for i, file_path in enumerate(added, start + 1):
+            self.arquivos_tree.insert("", "end", iid=file_path, values=(i, os.path.basename(file_path)))
+        if added:
+            self._update_counter()
+        return added
+
+    def _renumber_from(self, start):
+        """Renumera as linhas a partir de start, em lotes durante os momentos ociosos."""
+        if self._renumber_start is None:
+            self._renumber_start = start
+            self.arquivos_tree.after_idle(self._renumber_chunk)
+        else:
+            self._renumber_start = min(self._renumber_start, start)
+
+    def _renumber_chunk(self):
+        start = self._renumber_start
+        end = min(start + RENUMBER_CHUNK, len(self.model))
+        for index in range(start, end):
+            self.arquivos_tree.set(self.model.items[index], "#", index + 1)
+        if end < len(self.model):
+            self._renumber_start = end
+            self.arquivos_tree.after(1, self._renumber_chunk)
+        else:
+            self._renumber_start = None
+
+    def set_loading(self, loading):
+        """Indica no contador que a lista ainda está sendo carregada."""
+        self._loading = loading
+        self._update_counter()
+
+    def _update_counter(self):
+        suffix = " (carregando...)" if self._loading else ""
+        self.contador_label.config(text=f"Total: {len(self.model)} script(s){suffix}")
         self.update_reorder_buttons_state()
 
     def update_reorder_buttons_state(self, *args):
         """Atualiza o estado dos botões de reordenação."""
         selected_items = self.arquivos_tree.selection()
-        can_move_up = False
-        can_move_down = False
-
-        if len(selected_items) == 1:
-            selected_id = selected_items[0]
-            try:
-                index = self.loaded_scripts.index(selected_id)
-                if index > 0:
-                    can_move_up = True
-                if index < len(self.loaded_scripts) - 1:
-                    can_move_down = True
-            except ValueError:
-                pass
+        can_move_up = self.model.can_move(selected_items, -1)
+        can_move_down = self.model.can_move(selected_items, 1)
 
         self.move_up_btn.config(state=tk.NORMAL if can_move_up else tk.DISABLED)
         self.move_down_btn.config(state=tk.NORMAL if can_move_down else tk.DISABLED)
 
     def get_scripts(self):
         """Retorna a lista de scripts carregados."""
-        return self.loaded_scripts 
\ No newline at end of file
+        return list(self.model.items) 
\ No newline at end of file
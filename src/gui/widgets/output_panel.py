@@ -1,11 +1,42 @@
+import os
+import queue
+import time
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from tkinter.font import Font
 
+# Intervalo entre as atualizações do painel e limite de trechos por atualização
+FLUSH_INTERVAL_MS = 100
+MAX_SEGMENTS_PER_FLUSH = 5000
+
+# Quantidade máxima de linhas mantidas no painel (as mais antigas são descartadas)
+MAX_DISPLAY_LINES = 5000
+
+# Pasta dos logs completos de cada execução
+DEFAULT_LOG_DIR = os.path.join(os.path.expanduser("~"), ".oracle_script_executor", "logs")
+MAX_LOG_FILES = 20
+
+# Marcadores de controle na fila de saída
+_CLEAR = object()
+_NEW_LOG = object()
+
 class OutputPanel:
-    def __init__(self, parent):
+    """Painel de saída da execução.
+
+    Os métodos append_* podem ser chamados de qualquer thread: o texto entra
+    em uma fila que é descarregada no widget em lotes, a cada
+    FLUSH_INTERVAL_MS, com um único see() por lote. O painel mantém apenas
+    as últimas MAX_DISPLAY_LINES linhas; a saída completa vai para o log.
+    """
+
+    def __init__(self, parent, log_dir=DEFAULT_LOG_DIR):
         self.parent = parent
+        self.log_dir = log_dir
+        self.log_path = None
+        self._log_file = None
+        self._queue = queue.SimpleQueue()
         self._setup_widgets()
+        self._schedule_flush()
 
     def _setup_widgets(self):
         """Configura os widgets do painel de saída."""
@@ -33,17 +64,19 @@ class OutputPanel:
 
     def clear(self):
         """Limpa a área de saída."""
-        self.output_text.delete(1.0, tk.END)
+        self._queue.put(_CLEAR)
+
+    def start_log(self):
+        """Inicia um novo arquivo de log completo (uma vez por execução)."""
+        self._queue.put(_NEW_LOG)
 
     def append_success(self, text):
         """Adiciona texto de sucesso à área de saída."""
-        self.output_text.insert(tk.END, text, "success")
-        self.output_text.see(tk.END)
+        self._queue.put(((text, "success"),))
 
     def append_error(self, text):
         """Adiciona texto de erro à área de saída."""
-        self.output_text.insert(tk.END, text, "error")
-        self.output_text.see(tk.END)
+        self._queue.put(((text, "error"),))
 
     def append_sql_error(self, file_name, error_message):
         """Adiciona erro SQL formatado com o bloco de código destacado."""
@@ -62,24 +95,107 @@ class OutputPanel:
                 code_block = parts[1].strip()
                 footer = ""
             
-            # Adiciona o cabeçalho do erro
-            self.output_text.insert(tk.END, f"[ERRO] {file_name}:\n", "error")
-            self.output_text.insert(tk.END, f"{header.strip()}\n\n")
-            
-            # Adiciona o bloco de código com formatação especial
-            self.output_text.insert(tk.END, "Bloco com erro:\n")
-            self.output_text.insert(tk.END, f"{code_block}\n", "code_block")
+            # Cabeçalho do erro e bloco de código com formatação especial
+            segments = [
+                (f"[ERRO] {file_name}:\n", "error"),
+                (f"{header.strip()}\n\n", None),
+                ("Bloco com erro:\n", None),
+                (f"{code_block}\n", "code_block"),
+            ]
             
             # Adiciona o separador, se houver
             if footer:
-                self.output_text.insert(tk.END, f"{footer}\n", "separator")
+                segments.append((f"{footer}\n", "separator"))
         else:
             # Se não contém o formato esperado, adiciona como erro normal
-            self.output_text.insert(tk.END, f"[ERRO] {file_name}: {error_message}\n", "error")
-            
-        self.output_text.see(tk.END)
+            segments = [(f"[ERRO] {file_name}: {error_message}\n", "error")]
+
+        self._queue.put(tuple(segments))
 
     def append_text(self, text):
         """Adiciona texto normal à área de saída."""
-        self.output_text.insert(tk.END, text)
-        self.output_text.see(tk.END) 
\ No newline at end of file
+        self._queue.put(((text, None),))
+
+    def _schedule_flush(self):
+        self.output_text.after(FLUSH_INTERVAL_MS, self._flush)
+
+    def _flush(self):
+        """Descarrega a fila no widget e no log (executado na thread da interface)."""
+        try:
+            self._drain()
+            self._schedule_flush()
+        except tk.TclError:
+            # Janela destruída: encerra as atualizações
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+
+    def _drain(self):
+        pending = []
+        for _ in range(MAX_SEGMENTS_PER_FLUSH):
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _CLEAR:
+                # O que seria exibido antes da limpeza ainda vai para o log
+                self._write(pending, display=False)
+                pending = []
+                self.output_text.delete(1.0, tk.END)
+            elif item is _NEW_LOG:
+                self._write(pending)
+                pending = []
+                self._open_log()
+            else:
+                pending.extend(item)
+
+        if pending:
+            self._write(pending)
+
+    def _write(self, segments, display=True):
+        """Grava os trechos no log e os insere no widget, agrupando os de mesma formatação."""
+        if not segments:
+            return
+        if self._log_file is not None:
+            self._log_file.write("".join(text for text, _ in segments))
+            self._log_file.flush()
+        if not display:
+            return
+
+        text_parts, current_tag = [], segments[0][1]
+        for text, tag in segments:
+            if tag != current_tag:
+                self._insert("".join(text_parts), current_tag)
+                text_parts, current_tag = [], tag
+            text_parts.append(text)
+        self._insert("".join(text_parts), current_tag)
+
+        # Mantém apenas as últimas MAX_DISPLAY_LINES linhas
+        line_count = int(self.output_text.index("end-1c").split(".")[0])
+        if line_count > MAX_DISPLAY_LINES:
+            self.output_text.delete(1.0, f"{line_count - MAX_DISPLAY_LINES + 1}.0")
+        self.output_text.see(tk.END)
+
+    def _insert(self, text, tag):
+        if tag is None:
+            self.output_text.insert(tk.END, text)
+        else:
+            self.output_text.insert(tk.END, text, tag)
+
+    def _open_log(self):
+        """Fecha o log atual e abre um novo, descartando os mais antigos."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        try:
+            os.makedirs(self.log_dir, exist_ok=True)
+            logs = sorted(f for f in os.listdir(self.log_dir) if f.endswith(".log"))
+            for old_log in logs[:max(0, len(logs) - MAX_LOG_FILES + 1)]:
+                os.remove(os.path.join(self.log_dir, old_log))
+            self.log_path = os.path.join(
+                self.log_dir, time.strftime("execucao_%Y%m%d_%H%M%S.log")
+            )
+            self._log_file = open(self.log_path, "a", encoding="utf-8")
+        except OSError:
+            # Sem log em disco; o painel continua funcionando
+            self.log_path = None 
\ No newline at end of file
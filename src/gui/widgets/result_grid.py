@@ -0,0 +1,281 @@
+import csv
+import io
+import itertools
+import json
+import os
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+
+# Linhas por página lida do arquivo e páginas mantidas em memória
+PAGE_ROWS = 500
+CACHED_PAGES = 8
+
+# Intervalo entre as atualizações da grade enquanto o arquivo é indexado
+INDEX_POLL_MS = 200
+
+# Largura inicial das colunas (em pixels)
+COLUMN_WIDTH = 120
+
+
+class ResultFileModel:
+    """Linhas de um resultado exportado (CSV ou JSON Lines), lidas sob demanda.
+
+    Uma thread percorre o arquivo uma vez e guarda apenas a posição de
+    início de cada página de PAGE_ROWS linhas; as páginas pedidas pela
+    grade são lidas do disco e mantidas em um cache de CACHED_PAGES
+    páginas. A memória usada não depende do tamanho do resultado.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.jsonl = path.lower().endswith(".jsonl")
+        self.columns = []
+        self.indexed = False
+        self._rows = 0
+        self._offsets = []
+        self._pages = OrderedDict()
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._data_start = self._read_header()
+
+    @property
+    def rows(self):
+        """Linhas indexadas até o momento."""
+        with self._lock:
+            return self._rows
+
+    def start(self):
+        """Inicia a indexação do arquivo em segundo plano."""
+        threading.Thread(target=self._index, daemon=True).start()
+
+    def close(self):
+        """Interrompe a indexação em andamento."""
+        self._cancel.set()
+
+    def rows_at(self, start, count):
+        """Retorna até count linhas a partir de start (já indexadas)."""
+        rows = []
+        end = min(start + count, self.rows)
+        position = start
+        while position < end:
+            page = self._page(position // PAGE_ROWS)
+            offset = position % PAGE_ROWS
+            taken = page[offset:offset + end - position]
+            if not taken:
+                break
+            rows.extend(taken)
+            position += len(taken)
+        return rows
+
+    def _read_header(self):
+        """Lê as colunas do resultado e retorna a posição da primeira linha de dados."""
+        with open(self.path, "rb") as f:
+            first = f.readline()
+            if self.jsonl:
+                if first.strip():
+                    self.columns = list(json.loads(first))
+                return 0
+            self.columns = next(csv.reader([first.decode("utf-8")]), [])
+            return len(first)
+
+    def _index(self):
+        """Registra a posição de cada página; em CSV, campos com quebras de linha são respeitados."""
+        count = 0
+        position = self._data_start
+        record_start = position
+        in_quotes = False
+        with open(self.path, "rb") as f:
+            f.seek(position)
+            for line in f:
+                if self._cancel.is_set():
+                    return
+                if not in_quotes:
+                    record_start = position
+                position += len(line)
+                if not self.jsonl and line.count(b'"') % 2:
+                    in_quotes = not in_quotes
+                if in_quotes or not line.strip():
+                    continue
+                if count % PAGE_ROWS == 0:
+                    with self._lock:
+                        self._offsets.append(record_start)
+                        self._rows = count
+                count += 1
+        with self._lock:
+            self._rows = count
+        self.indexed = True
+
+    def _page(self, number):
+        """Linhas de uma página, do cache ou do disco."""
+        with self._lock:
+            page = self._pages.get(number)
+            if page is not None:
+                self._pages.move_to_end(number)
+                return page
+            offset = self._offsets[number]
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+            if self.jsonl:
+                page = []
+                for line in itertools.islice(text, PAGE_ROWS):
+                    record = json.loads(line)
+                    page.append([record.get(column) for column in self.columns])
+            else:
+                page = list(itertools.islice(csv.reader(text), PAGE_ROWS))
+
+        with self._lock:
+            self._pages[number] = page
+            if len(self._pages) > CACHED_PAGES:
+                self._pages.popitem(last=False)
+        return page
+
+
+class ResultGrid:
+    """Aba com as linhas retornadas pelos SELECTs da última execução.
+
+    A Treeview contém apenas as linhas visíveis: a barra de rolagem
+    vertical é controlada pela grade, que substitui os itens a cada
+    rolagem com as linhas lidas de ResultFileModel.
+    """
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.results = []
+        self.model = None
+        self.first = 0
+        self.visible = 20
+        self._rendered = None
+        self._setup_widgets()
+
+    def _setup_widgets(self):
+        """Configura a seleção do resultado, a grade e as barras de rolagem."""
+        top_frame = ttk.Frame(self.parent)
+        top_frame.pack(fill=tk.X, pady=(0, 3))
+        self.result_combo = ttk.Combobox(top_frame, state="readonly")
+        self.result_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.result_combo.bind("<<ComboboxSelected>>", lambda event: self._open(self.result_combo.current()))
+        self.status_label = ttk.Label(top_frame, text="Nenhum resultado exportado.")
+        self.status_label.pack(side=tk.LEFT, padx=(6, 0))
+
+        grid_frame = ttk.Frame(self.parent)
+        grid_frame.pack(fill=tk.BOTH, expand=True)
+        grid_frame.rowconfigure(0, weight=1)
+        grid_frame.columnconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(grid_frame, show="tree headings", selectmode="browse")
+        self.tree.column("#0", width=70, stretch=False, anchor=tk.E)
+        self.tree.heading("#0", text="#")
+        self.tree.grid(row=0, column=0, sticky=(tk.N, tk.S, tk.E, tk.W))
+
+        self.v_scrollbar = ttk.Scrollbar(grid_frame, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        h_scrollbar = ttk.Scrollbar(grid_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
+        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", lambda event: self._scroll(-3 if event.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda event: self._scroll(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll(3))
+        self.tree.bind("<Prior>", lambda event: self._scroll(-self.visible))
+        self.tree.bind("<Next>", lambda event: self._scroll(self.visible))
+        self.tree.bind("<Home>", lambda event: self._move_to(0))
+        self.tree.bind("<End>", lambda event: self._move_to(self._rows()))
+
+    def set_results(self, results):
+        """Lista os resultados exportados (ExportedResult) e abre o primeiro."""
+        self.results = list(results)
+        self.result_combo["values"] = [
+            f"{os.path.basename(result.script)} #{result.block} ({result.rows} linha(s))"
+            for result in self.results
+        ]
+        if self.results:
+            self.result_combo.current(0)
+            self._open(0)
+        else:
+            self.result_combo.set("")
+            self._close_model()
+            self.tree["columns"] = ()
+            self._render()
+            self.status_label.configure(text="Nenhum resultado exportado (ative export_results na configuração).")
+
+    def _open(self, position):
+        """Abre um resultado e inicia a indexação do arquivo."""
+        if position < 0:
+            return
+        self._close_model()
+        try:
+            self.model = ResultFileModel(self.results[position].path)
+        except (OSError, ValueError) as e:
+            self.status_label.configure(text=f"Erro ao abrir o resultado: {e}")
+            return
+        columns = [f"c{index}" for index in range(len(self.model.columns))]
+        self.tree["columns"] = columns
+        for column, name in zip(columns, self.model.columns):
+            self.tree.heading(column, text=name)
+            self.tree.column(column, width=COLUMN_WIDTH, stretch=False)
+        self.first = 0
+        self.model.start()
+        self._poll(self.model)
+
+    def _close_model(self):
+        if self.model is not None:
+            self.model.close()
+            self.model = None
+        self._rendered = None
+
+    def _poll(self, model):
+        """Atualiza a grade enquanto o arquivo é indexado."""
+        if model is not self.model:
+            return
+        self._render()
+        if model.indexed:
+            self.status_label.configure(text=f"{model.rows:,} linha(s)".replace(",", "."))
+        else:
+            self.status_label.configure(text=f"Indexando... {model.rows:,} linha(s)".replace(",", "."))
+            self.parent.after(INDEX_POLL_MS, self._poll, model)
+
+    def _rows(self):
+        return self.model.rows if self.model is not None else 0
+
+    def _on_resize(self, event):
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        visible = max(1, (event.height - row_height) // row_height)
+        if visible != self.visible:
+            self.visible = visible
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._move_to(int(float(amount) * self._rows()))
+        elif action == "scroll":
+            step = self.visible if unit == "pages" else 1
+            self._scroll(int(amount) * step)
+
+    def _scroll(self, rows):
+        self._move_to(self.first + rows)
+        return "break"
+
+    def _move_to(self, first):
+        self.first = max(0, min(first, self._rows() - self.visible))
+        self._render()
+        return "break"
+
+    def _render(self):
+        """Substitui os itens da Treeview pelas linhas visíveis."""
+        total = self._rows()
+        window = (id(self.model), self.first, self.visible, min(total, self.first + self.visible))
+        if window != self._rendered:
+            self._rendered = window
+            self.tree.delete(*self.tree.get_children())
+            if self.model is not None:
+                for number, row in enumerate(self.model.rows_at(self.first, self.visible), self.first + 1):
+                    self.tree.insert("", tk.END, text=str(number), values=["" if value is None else value for value in row])
+        if total:
+            self.v_scrollbar.set(self.first / total, min(1.0, (self.first + self.visible) / total))
+        else:
+            self.v_scrollbar.set(0.0, 1.0)
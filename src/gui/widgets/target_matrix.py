@@ -0,0 +1,98 @@
+import tkinter as tk
+from tkinter import ttk
+
+# Intervalo entre as atualizações da matriz durante a execução
+PROGRESS_POLL_MS = 500
+
+# Colunas da matriz: (identificador, título, largura)
+COLUMNS = (
+    ("state", "Estado", 90),
+    ("scripts", "Scripts", 80),
+    ("errors", "Erros", 60),
+    ("seconds", "Tempo", 80),
+    ("error", "Erro", 300),
+)
+
+# Cor de cada estado do destino
+STATE_COLORS = {
+    "executando": "#0b5394",
+    "concluído": "#38761d",
+    "com erros": "#b45f06",
+    "falhou": "#cc0000",
+    "cancelado": "#666666",
+}
+
+
+class TargetMatrix:
+    """Aba com o progresso de cada destino de uma execução em vários destinos.
+
+    A matriz é atualizada a cada PROGRESS_POLL_MS a partir do progresso
+    mantido pelo FanOutRunner, sem depender da quantidade de eventos.
+    """
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.fanout = None
+        self._setup_widgets()
+
+    def _setup_widgets(self):
+        """Configura a matriz de destinos e as barras de rolagem."""
+        self.status_label = ttk.Label(self.parent, text="Nenhuma execução em vários destinos.")
+        self.status_label.pack(fill=tk.X, pady=(0, 3))
+
+        grid_frame = ttk.Frame(self.parent)
+        grid_frame.pack(fill=tk.BOTH, expand=True)
+        grid_frame.rowconfigure(0, weight=1)
+        grid_frame.columnconfigure(0, weight=1)
+
+        self.tree = ttk.Treeview(grid_frame, columns=[column for column, _, _ in COLUMNS],
+                                 show="tree headings", selectmode="browse")
+        self.tree.heading("#0", text="Destino")
+        self.tree.column("#0", width=160, stretch=False)
+        for column, title, width in COLUMNS:
+            self.tree.heading(column, text=title)
+            self.tree.column(column, width=width, stretch=column == "error")
+        for state, color in STATE_COLORS.items():
+            self.tree.tag_configure(state, foreground=color)
+        self.tree.grid(row=0, column=0, sticky=(tk.N, tk.S, tk.E, tk.W))
+
+        v_scrollbar = ttk.Scrollbar(grid_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        h_scrollbar = ttk.Scrollbar(grid_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
+        h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+
+    def start(self, fanout):
+        """Lista os destinos da execução e passa a acompanhar o progresso."""
+        self.fanout = fanout
+        self.tree.delete(*self.tree.get_children())
+        for name in fanout.progress:
+            self.tree.insert("", tk.END, iid=name, text=name)
+        self._poll(fanout)
+
+    def _poll(self, fanout):
+        """Atualiza a matriz enquanto a execução estiver em andamento."""
+        if fanout is not self.fanout:
+            return
+        self.refresh()
+        if fanout.finished is None:
+            self.parent.after(PROGRESS_POLL_MS, self._poll, fanout)
+
+    def refresh(self):
+        """Atualiza as linhas e o total de destinos por estado."""
+        if self.fanout is None:
+            return
+        states = {}
+        for name, progress in self.fanout.progress.items():
+            states[progress.state] = states.get(progress.state, 0) + 1
+            error = (progress.error or "").strip().splitlines()
+            self.tree.item(name, tags=(progress.state,), values=(
+                progress.state,
+                f"{progress.done}/{progress.total}",
+                progress.errors,
+                f"{progress.elapsed:.1f} s",
+                error[0] if error else "",
+            ))
+        self.status_label.configure(
+            text=f"{len(self.fanout.progress)} destino(s): " + ", ".join(f"{state}: {count}" for state, count in states.items())
+        )
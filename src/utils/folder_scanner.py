@@ -0,0 +1,158 @@
+import fnmatch
+import os
+import re
+import threading
+import time
+from src.database.delimited_loader import is_delimited, mapping_path
+
+# Padrões padrão dos arquivos de script (e dos arquivos de dados CSV/TSV)
+DEFAULT_INCLUDE_PATTERNS = ("*.sql", "*.csv", "*.tsv")
+
+# Quantidade de scripts entregues por lote durante a varredura e intervalo
+# máximo entre lotes (para que os primeiros scripts apareçam logo)
+SCAN_BATCH_SIZE = 200
+SCAN_BATCH_SECONDS = 0.1
+
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def natural_sort_key(name):
+    """Chave de ordenação natural: 'V2' vem antes de 'V10'."""
+    return [int(part) if part.isdigit() else part.lower() for part in _DIGITS_RE.split(name)]
+
+
+def _matches(patterns, relative_path, name):
+    """Indica se o caminho relativo (ou o nome) corresponde a algum dos padrões."""
+    for pattern in patterns:
+        if fnmatch.fnmatch(name.lower(), pattern.lower()) or fnmatch.fnmatch(relative_path.lower(), pattern.lower()):
+            return True
+    return False
+
+
+def split_patterns(value, default=()):
+    """Converte 'a.sql; b/*.sql' (ou uma lista) em uma tupla de padrões."""
+    if not value:
+        return tuple(default)
+    if isinstance(value, str):
+        value = re.split(r"[;,]", value)
+    return tuple(pattern.strip() for pattern in value if pattern.strip())
+
+
+def iter_scripts(folder, include=DEFAULT_INCLUDE_PATTERNS, exclude=(), recursive=True,
+                 batch_size=SCAN_BATCH_SIZE, should_stop=None):
+    """Percorre a pasta com os.scandir e produz lotes de scripts já ordenados.
+
+    Cada pasta é lida uma única vez: seus arquivos (em ordem natural) vêm
+    antes das subpastas, também em ordem natural, de modo que a sequência
+    dos lotes já é a ordem final. Os padrões são comparados com o nome do
+    arquivo e com o caminho relativo à pasta ('/' como separador); pastas
+    que correspondem a um padrão de exclusão não são percorridas. Arquivos
+    CSV/TSV só são incluídos quando acompanhados do arquivo de mapeamento.
+    """
+    batch = []
+    last_yield = time.monotonic()
+    pending_dirs = [(folder, "")]
+    while pending_dirs:
+        if should_stop is not None and should_stop():
+            return
+        directory, relative_dir = pending_dirs.pop()
+        files, subdirs, names = [], [], set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    relative_path = relative_dir + entry.name
+                    names.add(entry.name)
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if recursive and not _matches(exclude, relative_path, entry.name):
+                            subdirs.append((entry.path, relative_path + "/"))
+                    elif _matches(include, relative_path, entry.name) and not _matches(exclude, relative_path, entry.name):
+                        files.append(entry)
+        except OSError:
+            if directory == folder:
+                raise
+            continue
+
+        files = [entry for entry in files
+                 if not is_delimited(entry.name) or mapping_path(entry.name) in names]
+        files.sort(key=lambda entry: natural_sort_key(entry.name))
+        for entry in files:
+            batch.append(entry.path)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+                last_yield = time.monotonic()
+        if batch and time.monotonic() - last_yield >= SCAN_BATCH_SECONDS:
+            yield batch
+            batch = []
+            last_yield = time.monotonic()
+
+        # Pilha: a primeira subpasta (em ordem natural) é a próxima a ser lida
+        subdirs.sort(key=lambda item: natural_sort_key(os.path.basename(item[0])), reverse=True)
+        pending_dirs.extend(subdirs)
+
+    if batch:
+        yield batch
+
+
+def list_scripts(folder, include=DEFAULT_INCLUDE_PATTERNS, exclude=(), recursive=True):
+    """Retorna todos os scripts da pasta, em ordem natural."""
+    scripts = []
+    for batch in iter_scripts(folder, include, exclude, recursive):
+        scripts.extend(batch)
+    return scripts
+
+
+def scan_options(config):
+    """Lê as opções de varredura (include/exclude/recursive) da configuração."""
+    return {
+        "include": split_patterns(config.get("include_patterns"), DEFAULT_INCLUDE_PATTERNS),
+        "exclude": split_patterns(config.get("exclude_patterns")),
+        "recursive": bool(config.get("recursive_scan", True)),
+    }
+
+
+class FolderScanner:
+    """Varre uma pasta em segundo plano, entregando os scripts em lotes.
+
+    on_batch(scripts) é chamado para cada lote e on_finish(total, error)
+    ao final, ambos a partir da thread de varredura. Uma nova varredura
+    (ou cancel()) interrompe a anterior.
+    """
+
+    def __init__(self, on_batch, on_finish):
+        self.on_batch = on_batch
+        self.on_finish = on_finish
+        self._cancel = None
+
+    def scan(self, folder, include=DEFAULT_INCLUDE_PATTERNS, exclude=(), recursive=True):
+        """Inicia a varredura da pasta, cancelando a anterior."""
+        self.cancel()
+        cancel = threading.Event()
+        self._cancel = cancel
+        thread = threading.Thread(
+            target=self._run, args=(folder, include, exclude, recursive, cancel), daemon=True
+        )
+        thread.start()
+
+    def cancel(self):
+        """Interrompe a varredura em andamento, se houver."""
+        if self._cancel is not None:
+            self._cancel.set()
+            self._cancel = None
+
+    def _run(self, folder, include, exclude, recursive, cancel):
+        total, error = 0, None
+        try:
+            for batch in iter_scripts(folder, include, exclude, recursive, should_stop=cancel.is_set):
+                if cancel.is_set():
+                    return
+                total += len(batch)
+                self.on_batch(batch)
+        except OSError as e:
+            error = str(e)
+        if not cancel.is_set():
+            self.on_finish(total, error)
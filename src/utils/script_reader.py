@@ -0,0 +1,13 @@
+# Tamanho do buffer de leitura dos scripts (em bytes)
+SCRIPT_BUFFER_SIZE = 1024 * 1024
+
+
+def open_script(file_path, encoding="utf-8-sig"):
+    """Abre um script SQL para leitura incremental.
+
+    O arquivo é lido em blocos de SCRIPT_BUFFER_SIZE e decodificado de forma
+    incremental; iterar sobre ele produz uma linha por vez, de modo que o
+    lexer de blocos pode começar a entregar comandos antes do fim da leitura.
+    O encoding 'utf-8-sig' descarta o BOM gerado por alguns editores.
+    """
+    return open(file_path, encoding=encoding, buffering=SCRIPT_BUFFER_SIZE)
@@ -0,0 +1,29 @@
+import time
+
+
+class StartupTimer:
+    """Registra quanto tempo cada etapa da inicialização levou.
+
+    Os tempos são medidos a partir de started (por padrão, a criação do
+    objeto); mark() pode ser chamado de qualquer thread.
+    """
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.marks = []
+
+    def mark(self, stage):
+        """Registra o fim de uma etapa."""
+        self.marks.append((stage, time.perf_counter() - self.started))
+
+    def elapsed(self, stage):
+        """Tempo (em segundos) até o fim da etapa, ou None se ainda não ocorreu."""
+        for name, elapsed in self.marks:
+            if name == stage:
+                return elapsed
+        return None
+
+    def report(self):
+        """Texto com os tempos acumulados de cada etapa, em ordem."""
+        stages = ", ".join(f"{stage} {elapsed * 1000:.0f} ms" for stage, elapsed in sorted(self.marks, key=lambda m: m[1]))
+        return f"Inicialização: {stages}\n"
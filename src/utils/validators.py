@@ -1,4 +1,7 @@
-from tkinter import messagebox
+def _show_error(message):
+    """Mostra um erro de validação (o tkinter só é carregado quando necessário)."""
+    from tkinter import messagebox
+    messagebox.showerror("Erro de Validação", message)
 
 class Validators:
     @staticmethod
@@ -15,8 +18,7 @@ class Validators:
         
         campos_vazios = [campo for campo, valor in campos.items() if not valor]
         if campos_vazios:
-            messagebox.showerror("Erro de Validação", 
-                               "Os seguintes campos de conexão são obrigatórios:\n" + 
+            _show_error("Os seguintes campos de conexão são obrigatórios:\n" + 
                                "\n".join(f"- {campo}" for campo in campos_vazios))
             return False
         return True
@@ -25,6 +27,30 @@ class Validators:
     def validate_scripts_list(scripts):
         """Valida se há scripts carregados."""
         if not scripts:
-            messagebox.showerror("Erro de Validação", "Nenhum script SQL foi carregado para execução.")
+            _show_error("Nenhum script SQL foi carregado para execução.")
             return False
-        return True 
\ No newline at end of file
+        return True 
+
+    @staticmethod
+    def validate_commit_every(every):
+        """Valida o intervalo (em comandos ou milissegundos) da política de commit."""
+        try:
+            valido = int(every) > 0
+        except (TypeError, ValueError):
+            valido = False
+        if not valido:
+            _show_error("Informe um número inteiro positivo para o intervalo de commit.")
+            return False
+        return True
+
+    @staticmethod
+    def validate_parallel_sessions(sessions):
+        """Valida a quantidade de sessões paralelas."""
+        try:
+            valido = 1 <= int(sessions) <= 32
+        except (TypeError, ValueError):
+            valido = False
+        if not valido:
+            _show_error("A quantidade de sessões paralelas deve ser um número entre 1 e 32.")
+            return False
+        return True